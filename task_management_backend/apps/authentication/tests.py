@@ -1,3 +1,73 @@
-from django.test import TestCase
+import time
+from unittest import mock
 
-# Create your tests here.
+import jwt
+from django.conf import settings
+from django.test import SimpleTestCase
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient
+
+import utils.cache
+from . import token_auth
+from .token_auth import decode_token, generate_token, token_cache
+
+
+def _token(emp_id, expires_in):
+    payload = {'emp_id': emp_id, 'emp_name': "Tester",
+               'exp': int(time.time() + expires_in), 'iat': int(time.time())}
+    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm='HS256')
+
+
+class TokenCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        token_cache.clear()
+        self.addCleanup(token_cache.clear)
+
+    def _later(self, seconds):
+        """Move the cache clock forward without sleeping."""
+        now = time.monotonic() + seconds
+        return mock.patch.object(utils.cache.time, 'monotonic', return_value=now)
+
+    def test_verified_once_then_served_from_cache(self):
+        token = generate_token(7, "Assignee")
+        with mock.patch.object(token_auth, 'verify_token',
+                               wraps=token_auth.verify_token) as verify:
+            first, second = decode_token(token), decode_token(token)
+        self.assertIs(first, second)
+        self.assertEqual(verify.call_count, 1)
+
+    def test_entry_never_outlives_the_token(self):
+        token = _token(7, expires_in=30)            # far below TOKEN_CACHE_TTL_SECONDS
+        decode_token(token)
+        with mock.patch.object(token_auth, 'verify_token',
+                               wraps=token_auth.verify_token) as verify:
+            with self._later(10):
+                decode_token(token)
+            self.assertEqual(verify.call_count, 0)
+            with self._later(31):
+                decode_token(token)
+            self.assertEqual(verify.call_count, 1)  # exp reached → verified again
+
+    def test_cache_ttl_applies_to_long_lived_tokens(self):
+        token = generate_token(7, "Assignee")
+        decode_token(token)
+        with mock.patch.object(token_auth, 'verify_token',
+                               wraps=token_auth.verify_token) as verify:
+            with self._later(token_cache.ttl + 1):
+                decode_token(token)
+        self.assertEqual(verify.call_count, 1)
+
+    def test_expired_and_invalid_tokens_are_rejected_and_not_cached(self):
+        for token, message in [(_token(7, expires_in=-5), "Token expired"),
+                               (generate_token(7, "Assignee") + "x", "Invalid token")]:
+            with self.subTest(message=message):
+                with self.assertRaisesMessage(AuthenticationFailed, message):
+                    decode_token(token)
+        self.assertEqual(len(token_cache), 0)
+
+    def test_expired_token_is_refused_over_http(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION='Bearer ' + _token(7, expires_in=-5))
+        response = client.get('/api/tasks/my-tasks/')
+        self.assertEqual(response.status_code, 403)       # no authenticate_header → DRF sends 403
@@ -6,21 +6,38 @@ No password. Just provide emp_id.
 
 Token payload: {"emp_id": 380988, "emp_name": "Ritesh Pachlore", "exp": ..., "iat": ...}
 No is_manager — any user can assign and receive tasks.
+
+Verified tokens are cached (token_cache, per process):
+  key   → sha256 of the token (the token itself is never stored)
+  value → the SimpleUser built from it, shared by every request
+  kept until exp, or TOKEN_CACHE_TTL_SECONDS, whichever comes first
+Only tokens that passed verification are cached.
 """
 
 import jwt
 import datetime
+import hashlib
+import time
 from django.conf import settings
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
+from utils.cache import TTLCache
+from utils.db_routing import set_actor
+from utils.profiling import add_timing
 
 
 class SimpleUser:
-    """Lightweight user object attached to request.user"""
+    """
+    Lightweight user object attached to request.user.
+    One instance is shared by all requests with the same token — read-only.
+    """
+    __slots__ = ('emp_id', 'emp_name')
+
+    is_authenticated = True
+
     def __init__(self, emp_id, emp_name):
         self.emp_id = emp_id
         self.emp_name = emp_name
-        self.is_authenticated = True
 
     def __str__(self):
         return f"{self.emp_name} (ID: {self.emp_id})"
@@ -39,6 +56,46 @@ def generate_token(emp_id, emp_name):
     return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm='HS256')
 
 
+token_cache = TTLCache(
+    max_entries=getattr(settings, 'TOKEN_CACHE_SIZE', 10000),
+    ttl_seconds=getattr(settings, 'TOKEN_CACHE_TTL_SECONDS', 900),
+)
+
+
+def verify_token(token):
+    """JWT → (SimpleUser, exp). Full signature check, no cache."""
+    try:
+        payload = jwt.decode(
+            token, settings.JWT_SECRET_KEY, algorithms=['HS256']
+        )
+        user = SimpleUser(
+            emp_id=payload.get('emp_id'),
+            emp_name=payload.get('emp_name', 'Unknown'),
+        )
+        return user, payload.get('exp')
+
+    except jwt.ExpiredSignatureError:
+        raise AuthenticationFailed('Token expired. Generate a new one.')
+    except jwt.InvalidTokenError:
+        raise AuthenticationFailed('Invalid token.')
+
+
+def decode_token(token):
+    """JWT → SimpleUser. Raises AuthenticationFailed. Shared by HTTP and WebSocket auth."""
+    key = hashlib.sha256(token.encode()).digest()
+    user = token_cache.get(key)
+    if user is not None:
+        return user
+
+    user, exp = verify_token(token)
+    ttl = token_cache.ttl
+    if exp is not None:
+        # Never outlive the token itself
+        ttl = min(ttl, exp - time.time())
+    token_cache.set(key, user, ttl_seconds=ttl)
+    return user
+
+
 class StandaloneTokenAuthentication(BaseAuthentication):
     """Validates JWT token from Authorization: Bearer <token> header."""
 
@@ -52,18 +109,10 @@ class StandaloneTokenAuthentication(BaseAuthentication):
         if not token:
             return None
 
+        started = time.perf_counter()
         try:
-            payload = jwt.decode(
-                token, settings.JWT_SECRET_KEY, algorithms=['HS256']
-            )
-            user = SimpleUser(
-                emp_id=payload.get('emp_id'),
-                emp_name=payload.get('emp_name', 'Unknown'),
-            )
-            return (user, token)
-
-        except jwt.ExpiredSignatureError:
-            raise AuthenticationFailed('Token expired. Generate a new one.')
-        except jwt.InvalidTokenError:
-            raise AuthenticationFailed('Invalid token.')
-        
\ No newline at end of file
+            user = decode_token(token)
+        finally:
+            add_timing('auth', time.perf_counter() - started)
+        set_actor(user.emp_id)
+        return (user, token)
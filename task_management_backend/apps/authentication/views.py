@@ -6,12 +6,16 @@ GET /api/auth/me/ → Current user from token
 GET /api/auth/employees/ → Employee list from staffmst
 """
 
+import time
+
+from django.conf import settings
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
-from utils.db_helper import call_sp, run_query
 from utils.response_handler import success_response, error_response
+from utils.conditional import etag_guard, make_etag
 from .token_auth import generate_token
 from apps.tasks.services import get_employees
+from apps.tasks.employee_directory import employee_directory
 
 class DevTokenView(APIView):
     """
@@ -44,27 +48,14 @@ class DevTokenView(APIView):
 
             emp_id = int(emp_id)
 
-            # Get REAL name from staffmst
-            result = run_query(
-                """
-                SELECT 
-                    EMP_ID AS emp_id,
-                    STF_FRNAME AS first_name,
-                    STF_LSNAME AS last_name,
-                    STF_FRNAME + ' ' + STF_LSNAME AS full_name
-                FROM inout_aems..staffmst
-                WHERE EMP_ID = %s
-                """,
-                [emp_id]
-            )
+            # Get REAL name from staffmst (directory snapshot, or one lookup)
+            user_data = employee_directory.get(emp_id)
 
-            if not result:
+            if not user_data:
                 return error_response(
                     f"Employee ID {emp_id} not found in staffmst."
                 )
 
-            user_data = result[0]
-
             token = generate_token(
                 emp_id=user_data['emp_id'],
                 emp_name=user_data['full_name'],
@@ -101,23 +92,43 @@ class MeView(APIView):
         )
 
 
+def _employee_list_etag(request):
+    # Search is served by the directory → digest of its rows, taken after
+    # any due reload, so it matches what the view is about to answer.
+    # The full list comes from sp_get_employees; staffmst changes outside
+    # this app, so that ETag rolls over every EMPLOYEE_LIST_ETAG_SECONDS.
+    if request.query_params.get('search', '').strip():
+        version = f"dir.{employee_directory.version()}"
+    else:
+        version = int(time.time() // getattr(settings, 'EMPLOYEE_LIST_ETAG_SECONDS', 300))
+    return make_etag(
+        request.path,
+        request.user.emp_id,
+        version,
+        request.META.get('QUERY_STRING', ''),
+    )
+
+
 class EmployeeListView(APIView):
     """
     GET /api/auth/employees/              → All employees
     GET /api/auth/employees/?search=rahul → Search by name
     GET /api/auth/employees/?search=3809  → Search by ID
+    GET /api/auth/employees/?search=ra&limit=10 → Top 10 only (default 50)
     
     Single search input works for BOTH ID and Name.
+    Search results are ranked: ID matches, then name prefixes, then substrings.
     """
 
-
-
+    @etag_guard(_employee_list_etag)
     def get(self, request):
         try:
             search = request.query_params.get('search', '').strip()
+            limit  = request.query_params.get('limit')
             result = get_employees(
                 emp_id=request.user.emp_id,
-                search=search or None
+                search=search or None,
+                limit=min(int(limit), 200) if limit else None,
             )
             return success_response(data=result or [])
         except Exception as e:
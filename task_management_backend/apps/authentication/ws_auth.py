@@ -0,0 +1,47 @@
+"""
+WebSocket Authentication — same JWT as the REST API
+────────────────────────────────────────────────────
+Browsers cannot set headers on a WebSocket handshake, so the token
+is read from the query string:
+
+    ws://host/ws/tasks/?token=<jwt>
+
+An "Authorization: Bearer <jwt>" header is accepted too (non-browser clients).
+scope["user"]      → SimpleUser, or None when the token is missing / invalid
+scope["token_exp"] → the token's exp (epoch seconds), or None
+"""
+
+from urllib.parse import parse_qs
+
+from channels.middleware import BaseMiddleware
+from rest_framework.exceptions import AuthenticationFailed
+
+from .token_auth import verify_token
+
+
+def _token_from_scope(scope):
+    query = parse_qs(scope.get('query_string', b'').decode())
+    if query.get('token'):
+        return query['token'][0]
+    for name, value in scope.get('headers', []):
+        if name == b'authorization':
+            value = value.decode()
+            if value.startswith('Bearer '):
+                return value.replace('Bearer ', '').strip()
+    return None
+
+
+class JWTAuthMiddleware(BaseMiddleware):
+
+    async def __call__(self, scope, receive, send):
+        scope = dict(scope)
+        scope['user'] = None
+        scope['token_exp'] = None
+        token = _token_from_scope(scope)
+        if token:
+            try:
+                # Once per connection — verify fully, exp is needed
+                scope['user'], scope['token_exp'] = verify_token(token)
+            except AuthenticationFailed:
+                pass
+        return await super().__call__(scope, receive, send)
@@ -0,0 +1,169 @@
+# apps/tasks/change_log.py
+"""
+Change Log — which tasks changed, and for whom
+──────────────────────────────────────────────
+Every successful write (create / status update / extend) appends one
+entry with an increasing sequence number:
+
+    seq → (execution_log_id, task_id, assigned_by, assignees)
+
+Clients hold a token "<epoch>.<seq>.<issued>" and ask for everything
+after it (/api/tasks/changes/?since=<token>).
+
+Stored in Django's cache (CHANGE_LOG_CACHE alias), so every worker
+sees the same log when that cache is shared (Redis). With the default
+LocMemCache it is per process.
+
+Versions (for ETags) — seq of the last change that touched:
+  version(emp_id, view_type)    → that employee's list / dashboard
+  log_version(execution_log_id) → one task's history
+A key with no recorded change is pinned to the current seq for
+CHANGE_LOG_PIN_SECONDS only: writes this log never sees (another
+worker's LocMemCache, SQL run directly) surface once the pin expires.
+
+A token is answered with reset=True (→ client reloads the full list) when:
+  • the cache was wiped (epoch changed)
+  • the token is older than half of CHANGE_LOG_TTL_SECONDS
+  • more than CHANGE_LOG_MAX_SCAN entries were written since
+  • an entry after it was evicted / expired (a gap in the log)
+"""
+
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+SEQ_KEY   = 'task_changes:seq'
+EPOCH_KEY = 'task_changes:epoch'
+
+
+def _entry_key(seq):
+    return f'task_changes:e:{seq}'
+
+
+def _version_key(emp_id, view_type):
+    return f'task_changes:v:{emp_id}:{view_type}'
+
+
+def _log_version_key(execution_log_id):
+    return f'task_changes:l:{int(execution_log_id)}'
+
+
+class ChangeLog:
+
+    @property
+    def cache(self):
+        return caches[getattr(settings, 'CHANGE_LOG_CACHE', 'default')]
+
+    @property
+    def ttl(self):
+        return getattr(settings, 'CHANGE_LOG_TTL_SECONDS', 86400)
+
+    def _epoch(self):
+        self.cache.add(EPOCH_KEY, uuid.uuid4().hex[:8], timeout=None)
+        return self.cache.get(EPOCH_KEY)
+
+    def current_seq(self):
+        return self.cache.get(SEQ_KEY, 0)
+
+    # ── Writing ──────────────────────────────────────────────────
+    def record(self, assigned_by=None, assignees=(),
+               execution_log_id=None, task_id=None):
+        """Append one change. Returns its sequence number."""
+        self._epoch()
+        self.cache.add(SEQ_KEY, 0, timeout=None)
+        seq = self.cache.incr(SEQ_KEY)
+        # IDs arrive as the client sent them ("602" from a form) — the
+        # SP rows they are matched against hold ints
+        execution_log_id = int(execution_log_id) if execution_log_id else None
+        task_id          = int(task_id) if task_id else None
+        assigned_by = int(assigned_by) if assigned_by else None
+        assignees   = tuple(int(e) for e in assignees if e)
+        self.cache.set(_entry_key(seq), (
+            execution_log_id, task_id, assigned_by, assignees,
+        ), timeout=self.ttl)
+
+        versions = {_version_key(e, 'SELF'): seq for e in assignees}
+        if assigned_by:
+            versions[_version_key(assigned_by, 'ASSIGNED_BY_ME')] = seq
+        if execution_log_id:
+            versions[_log_version_key(execution_log_id)] = seq
+        self.cache.set_many(versions, timeout=None)
+        return seq
+
+    # ── Versions ─────────────────────────────────────────────────
+    def _version(self, key):
+        # Unknown (never written, or evicted) → pin it to the current
+        # seq for a while. Never equal to an older version.
+        version = self.cache.get(key)
+        if version is None:
+            self.cache.add(key, self.current_seq(),
+                           timeout=getattr(settings, 'CHANGE_LOG_PIN_SECONDS', 300))
+            version = self.cache.get(key, 0)
+        return f"{self._epoch()}.{version}"
+
+    def version(self, emp_id, view_type):
+        return self._version(_version_key(emp_id, view_type))
+
+    def log_version(self, execution_log_id):
+        return self._version(_log_version_key(execution_log_id))
+
+    # ── Tokens ───────────────────────────────────────────────────
+    def token(self, seq=None, issued=None):
+        if seq is None:
+            seq = self.current_seq()
+        return f"{self._epoch()}.{seq}.{int(issued or time.time())}"
+
+    def read_token(self, token):
+        """token → (seq, issued), or None if it can no longer be trusted."""
+        try:
+            epoch, seq, issued = token.split('.')
+            seq, issued = int(seq), int(issued)
+        except (AttributeError, ValueError):
+            return None
+        if epoch != self._epoch() or seq > self.current_seq():
+            return None
+        if time.time() - issued > self.ttl / 2:
+            return None
+        return seq, issued
+
+    # ── Reading ──────────────────────────────────────────────────
+    def changes_since(self, seq, emp_id, view_type):
+        """
+        Changes after seq that touch emp_id's view_type list.
+        Returns (execution_log_ids, task_ids, last_seq_read),
+        or None (→ reset) when the window is too large or an entry is
+        gone (evicted / expired) while later ones exist.
+        Missing entries at the very end are writes in flight (between
+        incr and set) — reading stops before them.
+        """
+        current = self.current_seq()
+        if current - seq > getattr(settings, 'CHANGE_LOG_MAX_SCAN', 5000):
+            return None
+
+        keys    = [_entry_key(s) for s in range(seq + 1, current + 1)]
+        entries = self.cache.get_many(keys) if keys else {}
+        log_ids, task_ids = set(), set()
+        last = seq
+        for s, key in zip(range(seq + 1, current + 1), keys):
+            entry = entries.get(key)
+            if entry is None:
+                if any(later in entries for later in keys[s - seq:]):
+                    return None
+                break
+            execution_log_id, task_id, assigned_by, assignees = entry
+            if view_type == 'SELF':
+                mine = emp_id in assignees
+            else:
+                mine = emp_id == assigned_by
+            if mine:
+                if execution_log_id:
+                    log_ids.add(execution_log_id)
+                if task_id:
+                    task_ids.add(task_id)
+            last = s
+        return log_ids, task_ids, last
+
+
+change_log = ChangeLog()
@@ -0,0 +1,63 @@
+# apps/tasks/consumers.py
+"""
+WebSocket consumer — ws/tasks/?token=<jwt>
+──────────────────────────────────────────
+Joins task_updates_{emp_id} for the token's employee and forwards
+every notification sent by notifications.py as JSON:
+
+    {"type": "STATUS_CHANGED", "message": "...", "action": "refresh"}
+
+Client may send {"type": "ping"} → server answers {"type": "pong"}.
+
+Missing / invalid token → the handshake is accepted, then closed with
+code 4401 (closing before accept would surface as a bare HTTP 403).
+When the token's exp passes, the server sends {"type": "TOKEN_EXPIRED"}
+and closes with 4401 too — reconnect with a fresh token.
+"""
+
+import asyncio
+import time
+
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from .notifications import group_name
+
+# Close codes (4000–4999 are free for applications)
+CLOSE_UNAUTHORIZED = 4401
+
+
+class TaskUpdatesConsumer(AsyncJsonWebsocketConsumer):
+
+    async def connect(self):
+        user = self.scope.get('user')
+        if user is None:
+            await self.accept()
+            await self.close(code=CLOSE_UNAUTHORIZED)
+            return
+        self.group = group_name(user.emp_id)
+        await self.channel_layer.group_add(self.group, self.channel_name)
+        await self.accept()
+
+        exp = self.scope.get('token_exp')
+        if exp is not None:
+            self.expiry = asyncio.ensure_future(self._close_at(exp))
+
+    async def _close_at(self, exp):
+        await asyncio.sleep(max(0, exp - time.time()))
+        await self.send_json({"type": "TOKEN_EXPIRED"})
+        await self.close(code=CLOSE_UNAUTHORIZED)
+
+    async def disconnect(self, code):
+        expiry = getattr(self, 'expiry', None)
+        if expiry is not None and expiry is not asyncio.current_task():
+            expiry.cancel()
+        if getattr(self, 'group', None):
+            await self.channel_layer.group_discard(self.group, self.channel_name)
+
+    async def receive_json(self, content, **kwargs):
+        if content.get('type') == 'ping':
+            await self.send_json({"type": "pong"})
+
+    async def task_notification(self, event):
+        """Handler for {"type": "task_notification"} group messages."""
+        await self.send_json(event['data'])
@@ -0,0 +1,327 @@
+# apps/tasks/employee_directory.py
+"""
+Employee Directory — active staff from inout_aems..staffmst, in memory
+──────────────────────────────────────────────────────────────────────
+Loaded with ONE query (REP_STATUS = 1) and refreshed every
+EMPLOYEE_DIRECTORY_TTL_SECONDS. Search-as-you-type is answered from
+in-process indexes instead of LIKE '%x%' across databases:
+
+  • trigram index  → candidates for queries of 3+ characters
+  • sorted words   → name-word prefix matches (bisect)
+  • sorted ids     → employee-ID prefix matches (bisect)
+
+Ranking (best first):
+  exact ID → ID prefix → full-name prefix → word prefix → name substring
+  → ID substring. Ties keep staffmst name order (first, last).
+
+version() → digest of the loaded rows; changes only when staffmst did
+(used in the search ETag).
+
+Lookups by ID (names for tokens, notifications, task rows):
+  get_many(ids) → active staff from the snapshot; anyone else
+                  (inactive, joined since the last reload) with ONE
+                  batched IN (...) query, cached for the same TTL.
+  get(emp_id) / name(emp_id)
+  fill_names(rows)  → fills blank name columns of task rows, one
+                      get_many() for the whole list
+"""
+
+import hashlib
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+from utils.cache import TTLCache
+from utils.db_helper import run_query
+
+logger = logging.getLogger(__name__)
+
+# IDs per IN (...) lookup — SQL Server allows 2100 params per call
+LOOKUP_CHUNK = 500
+
+# (id column, name column) pairs in task rows, for fill_names()
+NAME_COLUMNS = (
+    ('emp_id',      'emp_name'),
+    ('assigned_by', 'assigned_by_name'),
+)
+
+# Rank buckets — lower is better
+EXACT_ID, ID_PREFIX, NAME_PREFIX, WORD_PREFIX, NAME_MATCH, ID_MATCH = range(6)
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class _DirectoryIndex:
+    """Immutable snapshot. A refresh builds a new one and swaps it in."""
+
+    def __init__(self, rows):
+        people = []
+        for row in rows:
+            first = (row.get('first_name') or '').strip()
+            last  = (row.get('last_name') or '').strip()
+            people.append((first.lower(), last.lower(), int(row['emp_id']),
+                           first, last))
+        people.sort()
+
+        # Content digest — equal snapshots → equal ETags, in every worker
+        digest = hashlib.blake2b(digest_size=8)
+        for p in people:
+            digest.update(f"{p[2]}\x1f{p[3]}\x1f{p[4]}\x1e".encode())
+        self.digest = digest.hexdigest()
+
+        self.emp_ids  = [p[2] for p in people]
+        self.first    = [p[3] for p in people]
+        self.last     = [p[4] for p in people]
+        self.names    = [f"{p[3]} {p[4]}".strip() for p in people]
+        self.names_lc = [name.lower() for name in self.names]
+        self.ids_str  = [str(emp_id) for emp_id in self.emp_ids]
+        self.by_id    = {emp_id: pos for pos, emp_id in enumerate(self.emp_ids)}
+
+        # Sorted (key, position) lists for prefix lookups
+        self.words = sorted(
+            (word, pos)
+            for pos, name in enumerate(self.names_lc)
+            for word in name.split()
+        )
+        self.ids_sorted = sorted(
+            (id_str, pos) for pos, id_str in enumerate(self.ids_str))
+
+        trigrams = {}
+        for pos in range(len(self.names)):
+            for gram in _trigrams(self.names_lc[pos]) | _trigrams(self.ids_str[pos]):
+                trigrams.setdefault(gram, []).append(pos)
+        self.trigrams = {gram: frozenset(p) for gram, p in trigrams.items()}
+
+    def __len__(self):
+        return len(self.emp_ids)
+
+    def person(self, pos):
+        return {
+            "emp_id":     self.emp_ids[pos],
+            "full_name":  self.names[pos],
+            "first_name": self.first[pos],
+            "last_name":  self.last[pos],
+        }
+
+    @staticmethod
+    def _prefix_hits(sorted_pairs, prefix):
+        i = bisect_left(sorted_pairs, (prefix,))
+        while i < len(sorted_pairs) and sorted_pairs[i][0].startswith(prefix):
+            yield sorted_pairs[i][1]
+            i += 1
+
+    def _candidates(self, query):
+        grams = _trigrams(query)
+        if not grams:
+            # 1–2 characters: no trigram to narrow with — scan
+            return range(len(self.names))
+        postings = []
+        for gram in grams:
+            hits = self.trigrams.get(gram)
+            if not hits:
+                return ()
+            postings.append(hits)
+        postings.sort(key=len)
+        return frozenset.intersection(*postings)
+
+    def _rank(self, pos, query, word_hits):
+        if self.ids_str[pos] == query:
+            return EXACT_ID
+        if self.ids_str[pos].startswith(query):
+            return ID_PREFIX
+        if self.names_lc[pos].startswith(query):
+            return NAME_PREFIX
+        if pos in word_hits:
+            return WORD_PREFIX
+        if query in self.names_lc[pos]:
+            return NAME_MATCH
+        if query in self.ids_str[pos]:
+            return ID_MATCH
+        return None
+
+    def search(self, query, limit):
+        query = ' '.join(query.lower().split())
+        if not query:
+            return []
+
+        # Stage 1 — prefix hits straight from the sorted lists
+        word_hits = set(self._prefix_hits(self.words, query))
+        ranked = {}
+        for pos in word_hits.union(self._prefix_hits(self.ids_sorted, query)):
+            ranked[pos] = self._rank(pos, query, word_hits)
+
+        # Stage 2 — substring matches rank lower; only needed when
+        # prefixes did not already fill the top-N
+        if len(ranked) < limit:
+            for pos in self._candidates(query):
+                if pos not in ranked:
+                    rank = self._rank(pos, query, word_hits)
+                    if rank is not None:
+                        ranked[pos] = rank
+
+        best = heapq.nsmallest(limit, ((rank, pos) for pos, rank in ranked.items()))
+        return [pos for _, pos in best]
+
+
+class EmployeeDirectory:
+
+    def __init__(self):
+        self._index     = None
+        self._loaded_at = 0.0
+        self._lock      = threading.Lock()
+        # IDs not in the active snapshot → person dict, or None if unknown
+        self._others    = TTLCache(
+            max_entries=getattr(settings, 'EMPLOYEE_LOOKUP_CACHE_SIZE', 5000),
+            ttl_seconds=self.ttl,
+        )
+
+    @property
+    def ttl(self):
+        return getattr(settings, 'EMPLOYEE_DIRECTORY_TTL_SECONDS', 600)
+
+    def _load(self):
+        rows = run_query(
+            """
+            SELECT
+                EMP_ID     AS emp_id,
+                STF_FRNAME AS first_name,
+                STF_LSNAME AS last_name
+            FROM inout_aems..staffmst
+            WHERE REP_STATUS = 1
+            """,
+            label='staffmst_directory',
+        )
+        return _DirectoryIndex(rows)
+
+    def refresh(self):
+        """Reload from staffmst now."""
+        with self._lock:
+            self._reload()
+
+    def _reload(self):
+        self._index     = self._load()
+        self._loaded_at = time.monotonic()
+        self._others.clear()
+
+    def index(self):
+        """Current snapshot. Reloads when stale — others keep the old one meanwhile."""
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._reload()
+        elif time.monotonic() - self._loaded_at >= self.ttl:
+            if self._lock.acquire(blocking=False):
+                try:
+                    self._reload()
+                except Exception as e:
+                    # Keep serving the previous snapshot
+                    logger.error(f"Employee directory refresh failed: {str(e)}")
+                    self._loaded_at = time.monotonic()
+                finally:
+                    self._lock.release()
+        return self._index
+
+    def version(self):
+        """Digest of the current snapshot (reloads first when stale)."""
+        return self.index().digest
+
+    def search(self, query, limit=None):
+        """Ranked top-N active employees: [{"emp_id", "emp_name"}, ...]"""
+        index = self.index()
+        limit = limit or getattr(settings, 'EMPLOYEE_SEARCH_LIMIT', 50)
+        return [
+            {"emp_id": index.emp_ids[pos], "emp_name": index.names[pos]}
+            for pos in index.search(query, limit)
+        ]
+
+    # ── Lookups by ID ────────────────────────────────────────────
+    def _fetch_others(self, emp_ids):
+        found = {}
+        emp_ids = list(emp_ids)
+        for start in range(0, len(emp_ids), LOOKUP_CHUNK):
+            chunk = emp_ids[start:start + LOOKUP_CHUNK]
+            rows = run_query(
+                f"""
+                SELECT
+                    EMP_ID     AS emp_id,
+                    STF_FRNAME AS first_name,
+                    STF_LSNAME AS last_name
+                FROM inout_aems..staffmst
+                WHERE EMP_ID IN ({', '.join(['%s'] * len(chunk))})
+                """,
+                chunk,
+                label='staffmst_lookup',
+            )
+            for row in rows:
+                first = (row.get('first_name') or '').strip()
+                last  = (row.get('last_name') or '').strip()
+                found[int(row['emp_id'])] = {
+                    "emp_id":     int(row['emp_id']),
+                    "full_name":  f"{first} {last}".strip(),
+                    "first_name": first,
+                    "last_name":  last,
+                }
+        return found
+
+    def get_many(self, emp_ids):
+        """
+        {emp_id: {"emp_id", "full_name", "first_name", "last_name"}}
+        Unknown IDs are left out. At most one DB round trip per 500 misses.
+        """
+        index  = self.index()
+        people = {}
+        misses = []
+        for emp_id in {int(e) for e in emp_ids if e not in (None, '')}:
+            pos = index.by_id.get(emp_id)
+            if pos is not None:
+                people[emp_id] = index.person(pos)
+                continue
+            cached = self._others.get(emp_id, misses)
+            if cached is misses:
+                misses.append(emp_id)
+            elif cached is not None:
+                people[emp_id] = cached
+        if misses:
+            fetched = self._fetch_others(misses)
+            for emp_id in misses:
+                # Cache "not found" too, so bad IDs do not hit the DB again
+                self._others.set(emp_id, fetched.get(emp_id))
+            people.update(fetched)
+        return people
+
+    def get(self, emp_id):
+        return self.get_many([emp_id]).get(int(emp_id))
+
+    def name(self, emp_id, default=""):
+        person = self.get(emp_id) if emp_id else None
+        return person["full_name"] if person else default
+
+    def fill_names(self, rows, columns=NAME_COLUMNS):
+        """
+        Set row[name_col] from row[id_col] where the name is missing or
+        blank. Rows that already carry names cost no lookup.
+        """
+        wanted = {
+            row[id_col]
+            for row in rows
+            for id_col, name_col in columns
+            if row.get(id_col) and not row.get(name_col)
+        }
+        if not wanted:
+            return rows
+        people = self.get_many(wanted)
+        for row in rows:
+            for id_col, name_col in columns:
+                if row.get(id_col) and not row.get(name_col):
+                    person = people.get(int(row[id_col]))
+                    if person:
+                        row[name_col] = person["full_name"]
+        return rows
+
+
+employee_directory = EmployeeDirectory()
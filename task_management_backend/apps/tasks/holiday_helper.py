@@ -1,45 +1,209 @@
 """
 Holiday Helper — Uses REAL data from inout_aems..holiday_master
 ──────────────────────────────────────────────────────────────
-Two functions:
+Holidays are loaded ONE YEAR AT A TIME into a process-wide
+calendar (holiday_calendar). Date checks read that calendar —
+no SQL Server round trip per probed date.
+
+Single date:
   is_holiday_or_sunday() → Simple yes/no check
   get_shift_info()       → Full info for permission popup
+
+Batch (check-dates endpoint):
+  get_shift_info_many()  → get_shift_info() for a list of dates
+  count_working_days()   → Working days between two dates
+  get_range_info()       → Working-day count + non-working days in a range
+
+Calendar:
+  holiday_calendar.invalidate()     → Drop all cached years
+  holiday_calendar.invalidate(2025) → Drop one year
+  Cached years also expire after HOLIDAY_CACHE_TTL_SECONDS.
 """
 
-from datetime import date, timedelta
+import threading
+import time
+from array import array
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+
+from django.conf import settings
 from utils.db_helper import run_query
 
 
+# Never search further than this for the next working day
+MAX_LOOKAHEAD_YEARS = 2
+
+
+class _CalendarYear:
+    """
+    One loaded year.
+      flags   → bytearray, one byte per day (1 = Sunday or holiday)
+      reasons → {day_index: Holiday_Desc} for non-Sunday holidays
+      working → prefix sums: working[i] = working days before day i
+    """
+    __slots__ = ('year', 'start', 'flags', 'reasons', 'working', 'loaded_at')
+
+    def __init__(self, year, flags, reasons):
+        self.year      = year
+        self.start     = date(year, 1, 1)
+        self.flags     = flags
+        self.reasons   = reasons
+        self.working   = array('H', accumulate(
+            (1 - flag for flag in flags), initial=0))
+        self.loaded_at = time.monotonic()
+
+
+class WorkingDayCalendar:
+    """Process-wide, year-at-a-time cache of non-working days."""
+
+    def __init__(self, ttl_seconds=None):
+        self._ttl   = ttl_seconds
+        self._years = {}
+        self._lock  = threading.Lock()
+
+    @property
+    def ttl(self):
+        if self._ttl is not None:
+            return self._ttl
+        return getattr(settings, 'HOLIDAY_CACHE_TTL_SECONDS', 3600)
+
+    # ── Cache management ─────────────────────────────────────────
+    def invalidate(self, year=None):
+        """Forget one year (or every year). Next check reloads it."""
+        with self._lock:
+            if year is None:
+                self._years.clear()
+            else:
+                self._years.pop(year, None)
+
+    def _year(self, year):
+        entry = self._years.get(year)
+        if entry is not None and time.monotonic() - entry.loaded_at < self.ttl:
+            return entry
+        with self._lock:
+            entry = self._years.get(year)
+            if entry is None or time.monotonic() - entry.loaded_at >= self.ttl:
+                entry = self._load_year(year)
+                self._years[year] = entry
+            return entry
+
+    def _load_year(self, year):
+        start = date(year, 1, 1)
+        end   = date(year + 1, 1, 1)
+        days  = (end - start).days
+
+        # Sundays first — one slice assignment for the whole year
+        flags = bytearray(days)
+        first_sunday = (6 - start.weekday()) % 7
+        sundays = range(first_sunday, days, 7)
+        flags[first_sunday::7] = b'\x01' * len(sundays)
+
+        # REAL holidays from inout_aems — one query per year
+        rows = run_query(
+            """
+            SELECT Holiday_Date, Holiday_Desc
+            FROM LPDATA..holiday_master
+            WHERE Holiday_Date >= %s AND Holiday_Date < %s AND Status = 1
+            ORDER BY Holiday_Date
+            """,
+            [start, end],
+            label='holiday_master',
+        )
+        reasons = {}
+        for row in rows:
+            holiday = row['Holiday_Date']
+            if isinstance(holiday, datetime):
+                holiday = holiday.date()
+            index = (holiday - start).days
+            if flags[index]:
+                continue    # Sunday wins, same as the old per-date check
+            flags[index] = 1
+            reasons[index] = row['Holiday_Desc']
+        return _CalendarYear(year, flags, reasons)
+
+    # ── Queries ──────────────────────────────────────────────────
+    def check(self, check_date):
+        """Returns (is_non_working, reason)."""
+        entry = self._year(check_date.year)
+        index = (check_date - entry.start).days
+        if not entry.flags[index]:
+            return False, None
+        if check_date.weekday() == 6:
+            return True, "Sunday"
+        return True, entry.reasons.get(index)
+
+    def is_non_working(self, check_date):
+        return self.check(check_date)[0]
+
+    def next_working_day(self, check_date):
+        """First working day ON or AFTER check_date."""
+        entry = self._year(check_date.year)
+        index = entry.flags.find(0, (check_date - entry.start).days)
+        for _ in range(MAX_LOOKAHEAD_YEARS):
+            if index != -1:
+                return entry.start + timedelta(days=index)
+            entry = self._year(entry.year + 1)
+            index = entry.flags.find(0)
+        raise ValueError(
+            f"No working day within {MAX_LOOKAHEAD_YEARS} years of {check_date}")
+
+    def count_working_days(self, start, end):
+        """
+        Working days from start to end, BOTH inclusive.
+        Answered from per-year prefix sums — O(years), not O(days).
+        Returns 0 when end is before start.
+        """
+        total = 0
+        for year in range(start.year, end.year + 1):
+            entry = self._year(year)
+            first = (max(start, entry.start) - entry.start).days
+            last  = (min(end, date(year, 12, 31)) - entry.start).days
+            if last >= first:
+                total += entry.working[last + 1] - entry.working[first]
+        return total
+
+    def non_working_days(self, start, end):
+        """[(date, reason), ...] for every non-working day in start..end."""
+        days = []
+        for year in range(start.year, end.year + 1):
+            entry = self._year(year)
+            first = (max(start, entry.start) - entry.start).days
+            stop  = (min(end, date(year, 12, 31)) - entry.start).days + 1
+            index = entry.flags.find(1, first, stop) if stop > first else -1
+            while index != -1:
+                day = entry.start + timedelta(days=index)
+                days.append((
+                    day,
+                    "Sunday" if day.weekday() == 6 else entry.reasons.get(index),
+                ))
+                index = entry.flags.find(1, index + 1, stop)
+        return days
+
+
+holiday_calendar = WorkingDayCalendar()
+
+
+def _to_date(value):
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
 def is_holiday_or_sunday(check_date):
     """Check if date is Sunday or holiday. Returns {"is_non_working": bool, "reason": str}"""
-    if isinstance(check_date, str):
-        check_date = date.fromisoformat(check_date)
-    
-    if check_date.weekday() == 6:
-        return {"is_non_working": True, "reason": "Sunday"}
-    
-    # REAL holidays from inout_aems
-    sql = """
-        SELECT TOP 1 Holiday_Desc 
-        FROM LPDATA..holiday_master
-        WHERE Holiday_Date = %s AND Status = 1
-    """
-    result = run_query(sql, [check_date])
-    
-    if result and len(result) > 0:
-        return {"is_non_working": True, "reason": result[0]['Holiday_Desc']}
-    
-    return {"is_non_working": False, "reason": None}
+    is_non_working, reason = holiday_calendar.check(_to_date(check_date))
+    return {"is_non_working": is_non_working, "reason": reason}
 
 
 def get_shift_info(check_date):
     """Full date check with shift suggestion for permission popup."""
-    if isinstance(check_date, str):
-        check_date = date.fromisoformat(check_date)
-    
-    check = is_holiday_or_sunday(check_date)
-    
-    if not check["is_non_working"]:
+    check_date = _to_date(check_date)
+
+    is_non_working, reason = holiday_calendar.check(check_date)
+
+    if not is_non_working:
         return {
             "needs_shift": False,
             "original_date": str(check_date),
@@ -47,22 +211,55 @@ def get_shift_info(check_date):
             "reason": None,
             "message": None,
         }
-    
-    current = check_date
-    safety = 0
-    while safety < 10:
-        current = current + timedelta(days=1)
-        if not is_holiday_or_sunday(current)["is_non_working"]:
-            break
-        safety += 1
-    
+
+    current = holiday_calendar.next_working_day(check_date)
+
     return {
         "needs_shift": True,
         "original_date": str(check_date),
         "suggested_date": str(current),
-        "reason": check["reason"],
+        "reason": reason,
         "message": (
-            f"{check_date.strftime('%b %d, %Y')} is {check['reason']}. "
+            f"{check_date.strftime('%b %d, %Y')} is {reason}. "
             f"Shift to {current.strftime('%b %d, %Y')}?"
         ),
-    }
\ No newline at end of file
+    }
+
+
+def get_shift_info_many(dates):
+    """get_shift_info() for each date, in the same order."""
+    return [get_shift_info(d) for d in dates]
+
+
+def _to_range(start, end, max_days):
+    start, end = _to_date(start), _to_date(end)
+    if end < start:
+        raise ValueError(f"end {end} is before start {start}")
+    if max_days and (end - start).days + 1 > max_days:
+        raise ValueError(f"Range is limited to {max_days} days")
+    return start, end
+
+
+def count_working_days(start, end, max_days=None):
+    """{"start", "end", "working_days"} — both ends inclusive."""
+    start, end = _to_range(start, end, max_days)
+    return {
+        "start":        str(start),
+        "end":          str(end),
+        "working_days": holiday_calendar.count_working_days(start, end),
+    }
+
+
+def get_range_info(start, end, max_days=None):
+    """Working-day count and the non-working days between start and end (inclusive)."""
+    start, end = _to_range(start, end, max_days)
+    return {
+        "start":            str(start),
+        "end":              str(end),
+        "total_days":       (end - start).days + 1,
+        "working_days":     holiday_calendar.count_working_days(start, end),
+        "non_working_days": [
+            {"date": str(day), "reason": reason}
+            for day, reason in holiday_calendar.non_working_days(start, end)
+        ],
+    }
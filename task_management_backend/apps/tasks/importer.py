@@ -0,0 +1,181 @@
+# apps/tasks/importer.py
+"""
+Bulk Task Import — CSV or NDJSON, streamed
+──────────────────────────────────────────
+Used by POST /api/tasks/import/ and `manage.py import_tasks`.
+
+  parse_rows(lines, file_type) → (row_no, task_data | error) one at a time
+  import_tasks(rows, ...)      → one result dict per row, one at a time
+  run_to_end(results)          → runs the whole import now, then replays
+                                 the results (the HTTP report)
+
+Rows are validated with validate_task_data() (same rules as
+POST /api/tasks/create/) and created TASK_IMPORT_BATCH_SIZE at a time
+through services.create_tasks_batch() — one transaction per batch.
+Only one batch is held in memory, whatever the file size. A batch that
+fails as a whole (its transaction rolled back) is reported row by row
+and the import goes on with the next one.
+
+CSV: header row with the create/ field names, e.g.
+    task_title,task_type,priority_type,task_start_date,start_time,task_end_date,end_time,emp_list
+    Morning Meeting,5,2,2025-07-15,09:00,2025-07-15,09:30,"25,30"
+
+NDJSON: one create/ body per line. emp_list may also be a list: [25, 30].
+Numbers are read as their text (5 → "5"), exactly as in a CSV cell.
+
+Result per row:
+    {"row": 3, "success": 1, "message": "...", "task_id": 123}
+"""
+
+import csv
+import json
+
+from django.conf import settings
+
+from . import services
+from .validation import validate_task_data
+
+FILE_TYPES = ('csv', 'ndjson')
+
+# Fields taken from a row — anything else is ignored
+TASK_FIELDS = (
+    'task_title', 'task_description', 'task_type', 'priority_type',
+    'task_start_date', 'start_time', 'task_end_date', 'end_time', 'emp_list',
+)
+
+
+def file_type_for(filename):
+    """'tasks.csv' → 'csv', 'tasks.jsonl' → 'ndjson', otherwise None."""
+    name = (filename or '').lower()
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    return None
+
+
+def _clean(record):
+    task_data = {}
+    for field in TASK_FIELDS:
+        value = record.get(field)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = str(value)
+        if isinstance(value, str):
+            value = value.strip()
+        if value in (None, ''):
+            continue
+        if field == 'emp_list' and isinstance(value, (list, tuple)):
+            value = ','.join(str(eid) for eid in value)
+        task_data[field] = value
+    return task_data
+
+
+def parse_rows(lines, file_type):
+    """
+    Text lines → (row_no, task_data) or (row_no, "error message").
+    row_no is the 1-based data row (CSV header not counted).
+    """
+    if file_type == 'csv':
+        row_no = 0
+        try:
+            for row_no, record in enumerate(csv.DictReader(lines), start=1):
+                yield row_no, _clean(record)
+        except csv.Error as e:
+            # The reader cannot continue past a broken row
+            yield row_no + 1, f"Invalid CSV: {str(e)}"
+        return
+
+    row_no = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        row_no += 1
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield row_no, f"Invalid JSON: {str(e)}"
+            continue
+        if not isinstance(record, dict):
+            yield row_no, "Each line must be a JSON object"
+            continue
+        yield row_no, _clean(record)
+
+
+def _validate(task_data):
+    """Error message for the row, or None. Never raises — one bad row must not end the import."""
+    try:
+        return validate_task_data(task_data)
+    except ValueError:
+        return f"Invalid task_type: {task_data.get('task_type')}"
+    except Exception as e:
+        # e.g. task_title: {} or a list where a time belongs
+        return f"Invalid row: {str(e)}"
+
+
+def import_tasks(rows, created_by, created_by_name="", batch_size=None):
+    """
+    rows from parse_rows() → result per row, in file order (generator).
+    Invalid rows are reported without touching the database.
+    Only valid rows fill a batch; a run of invalid rows is flushed
+    every 10 batches' worth so memory stays bounded.
+    """
+    batch_size = batch_size or getattr(settings, 'TASK_IMPORT_BATCH_SIZE', 100)
+    pending = []    # (row_no, task_data, error) in file order
+    valid   = 0
+
+    def flush():
+        tasks = [task_data for _, task_data, error in pending if not error]
+        try:
+            created = (services.create_tasks_batch(tasks, created_by, created_by_name)
+                       if tasks else [])
+        except Exception as e:
+            created = [{"success": 0, "message": f"Batch not imported: {str(e)}",
+                        "task_id": 0}] * len(tasks)
+        results = iter(created)
+        for row_no, _, error in pending:
+            if error:
+                yield {"row": row_no, "success": 0, "message": error, "task_id": 0}
+                continue
+            info = next(results)
+            yield {
+                "row":     row_no,
+                "success": info.get('success', 0),
+                "message": info.get('message', ''),
+                "task_id": info.get('task_id', 0),
+            }
+        pending.clear()
+
+    for row_no, task_data in rows:
+        error = task_data if isinstance(task_data, str) else _validate(task_data)
+        pending.append((row_no, task_data, error))
+        if not error:
+            valid += 1
+        if valid >= batch_size or len(pending) >= 10 * batch_size:
+            yield from flush()
+            valid = 0
+    if pending:
+        yield from flush()
+
+
+def run_to_end(results):
+    """
+    Drain results now and return a generator replaying them.
+    Every batch is created before the first line goes out, so a client
+    disconnect or proxy timeout cannot stop an import halfway. Results
+    are spooled (memory, then a temp file) — see services.spool_rows().
+    """
+    return services.spool_rows(results)
+
+
+def with_summary(results):
+    """
+    Pass results through, then yield one last line:
+    {"summary": {"total", "created", "failed"}}
+    """
+    counts = {"total": 0, "created": 0, "failed": 0}
+    for result in results:
+        counts["total"] += 1
+        counts["created" if result["success"] == 1 else "failed"] += 1
+        yield result
+    yield {"summary": counts}
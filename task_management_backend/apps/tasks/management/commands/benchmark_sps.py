@@ -0,0 +1,282 @@
+"""
+python manage.py benchmark_sps --emp-id 380988
+python manage.py benchmark_sps --emp-id 380988 --matrix full --json after.json
+python manage.py benchmark_sps --emp-id 380988 --sp sp_fetch_task_list --drop-caches
+python manage.py benchmark_sps --emp-id 380988 --database replica
+python manage.py benchmark_sps --compare before.json after.json
+
+Runs every stored procedure services.py calls over a parameter matrix:
+
+  sp_fetch_task_list    → both views × filter combinations × date ranges
+  sp_dashboard_counts   → both views × date ranges (× employee_id, ASSIGNED_BY_ME)
+  sp_get_affected_tasks → both views
+  sp_get_task_history   → a few execution_log_ids from the SELF list
+  sp_get_employees      → once
+
+--matrix single  → no filter, then each filter alone        (default)
+--matrix pairs   → also every pair of filters
+--matrix full    → every combination of filters
+
+Per case: one cold run, then --repeat warm runs (min / median / p95 / max
+ms) and the row count. "Cold" is only the first call of the case unless
+--drop-caches clears SQL Server's buffer pool and plan cache before it
+(DBCC DROPCLEANBUFFERS / FREEPROCCACHE — needs sysadmin; never on
+production). Parameters come from services._task_list_params(), so the
+cases are exactly what the API sends. Calls are routed like the API's
+(utils.db_routing) unless --database names the alias.
+
+The table (slowest warm median first) goes to stdout; --json saves the
+full report. --compare OLD NEW matches cases by name and lists the ones
+whose warm median moved by more than --threshold.
+"""
+
+import datetime
+import json
+import statistics
+import time
+from itertools import combinations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tasks import services
+from utils.constants import ViewType
+from utils.db_helper import call_sp_multiple_results, run_query
+from utils.db_routing import route
+
+SP_NAMES = (
+    'sp_fetch_task_list', 'sp_dashboard_counts', 'sp_get_affected_tasks',
+    'sp_get_task_history', 'sp_get_employees',
+)
+VIEWS = (ViewType.SELF, ViewType.ASSIGNED_BY_ME)
+DROP_CACHES_SQL = "CHECKPOINT; DBCC DROPCLEANBUFFERS; DBCC FREEPROCCACHE;"
+HISTORY_SAMPLES = 3
+
+
+def _filter_values(employee_id):
+    """One representative value per get_tasks() filter (dates are swept separately)."""
+    values = {
+        'status':        1,
+        'priority':      1,
+        'task_type':     5,
+        'overdue_only':  1,
+        'extended_only': 1,
+        'search':        'a',
+    }
+    if employee_id:
+        values['employee_id'] = employee_id
+    return values
+
+
+def _filter_sets(names, matrix):
+    sizes = {'single': 1, 'pairs': 2, 'full': len(names)}[matrix]
+    for size in range(0, sizes + 1):
+        yield from combinations(names, size)
+
+
+def _date_ranges(days_list):
+    """[(label, date_from, date_to), ...] — "all" first, then the last N days."""
+    today = datetime.date.today()
+    ranges = [('all', None, None)]
+    for days in days_list:
+        ranges.append((f'{days}d', str(today - datetime.timedelta(days=days)), str(today)))
+    return ranges
+
+
+def _case_name(sp_name, **parts):
+    return ' '.join([sp_name] + [f"{key}={value}" for key, value in parts.items()
+                                 if value is not None])
+
+
+class Command(BaseCommand):
+    help = "Time the stored procedures over a parameter matrix (warm and cold)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--emp-id', type=int, help="emp_id the SPs run as")
+        parser.add_argument('--employee-id', type=int,
+                            help="employee_id filter for ASSIGNED_BY_ME cases")
+        parser.add_argument('--sp', action='append', choices=SP_NAMES,
+                            help="Only this SP (repeatable)")
+        parser.add_argument('--matrix', choices=('single', 'pairs', 'full'), default='single')
+        parser.add_argument('--ranges', default='7,30,90,365',
+                            help="Date ranges in days, comma separated (default 7,30,90,365)")
+        parser.add_argument('--repeat', type=int, default=5, help="Warm runs per case")
+        parser.add_argument('--database', help="DATABASES alias to run on (default: routed)")
+        parser.add_argument('--drop-caches', action='store_true',
+                            help="DBCC DROPCLEANBUFFERS / FREEPROCCACHE before each cold run")
+        parser.add_argument('--top', type=int, default=25, help="Rows in the printed table")
+        parser.add_argument('--json', help="Save the report to this file")
+        parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                            help="Compare two saved reports instead of running")
+        parser.add_argument('--threshold', type=float, default=0.20,
+                            help="Relative change reported by --compare (default 0.20)")
+
+    def handle(self, *args, **options):
+        if options['compare']:
+            return self._compare(*options['compare'], options['threshold'])
+        if not options['emp_id']:
+            raise CommandError("--emp-id is required (or use --compare OLD NEW)")
+        try:
+            ranges = _date_ranges(int(d) for d in options['ranges'].split(',') if d.strip())
+        except ValueError:
+            raise CommandError("--ranges must be whole numbers of days, e.g. 7,30,90")
+
+        selected = options['sp'] or SP_NAMES
+        cases    = [case for case in self._cases(options, ranges) if case[1] in selected]
+        self.stderr.write(f"{len(cases)} cases, 1 cold + {options['repeat']} warm runs each")
+
+        results = []
+        for number, (name, sp_name, params) in enumerate(cases, start=1):
+            results.append(self._run_case(
+                name, sp_name, params, options['repeat'], options['drop_caches'],
+                options['database']))
+            if number % 25 == 0:
+                self.stderr.write(f"  {number}/{len(cases)}")
+
+        report = {
+            "meta": {
+                "emp_id":      options['emp_id'],
+                "employee_id": options['employee_id'],
+                "database":    options['database'] or "routed",
+                "matrix":      options['matrix'],
+                "repeat":      options['repeat'],
+                "cold":        "drop-caches" if options['drop_caches'] else "first-call",
+                "started":     time.strftime('%Y-%m-%dT%H:%M:%S'),
+            },
+            "cases": results,
+        }
+        self._print(results, options['top'])
+        if options['json']:
+            with open(options['json'], 'w') as f:
+                json.dump(report, f, indent=2, default=str)
+            self.stderr.write(f"Saved {options['json']}")
+
+    # ── Matrix ───────────────────────────────────────────────────
+    def _cases(self, options, ranges):
+        """[(case name, sp_name, params), ...]"""
+        emp_id      = options['emp_id']
+        employee_id = options['employee_id']
+        cases = []
+
+        for view_type in VIEWS:
+            values = _filter_values(employee_id if view_type == ViewType.ASSIGNED_BY_ME else None)
+            for names in _filter_sets(sorted(values), options['matrix']):
+                for label, date_from, date_to in ranges:
+                    filters = {name: values[name] for name in names}
+                    filters.update(date_from=date_from, date_to=date_to)
+                    cases.append((
+                        _case_name('sp_fetch_task_list', view=view_type,
+                                   filters='+'.join(names) or 'none', range=label),
+                        'sp_fetch_task_list',
+                        services._task_list_params(emp_id, view_type, filters),
+                    ))
+
+            employee_ids = [None]
+            if employee_id and view_type == ViewType.ASSIGNED_BY_ME:
+                employee_ids.append(employee_id)
+            for label, date_from, date_to in ranges:
+                for emp_filter in employee_ids:
+                    cases.append((
+                        _case_name('sp_dashboard_counts', view=view_type,
+                                   range=label, employee_id=emp_filter),
+                        'sp_dashboard_counts',
+                        [emp_id, view_type, date_from, date_to, emp_filter],
+                    ))
+
+            cases.append((_case_name('sp_get_affected_tasks', view=view_type),
+                          'sp_get_affected_tasks', [emp_id, view_type]))
+
+        if not options['sp'] or 'sp_get_task_history' in options['sp']:
+            for execution_log_id in self._history_ids(emp_id):
+                cases.append((_case_name('sp_get_task_history', execution_log_id=execution_log_id),
+                              'sp_get_task_history', [execution_log_id]))
+        cases.append((_case_name('sp_get_employees'), 'sp_get_employees', [emp_id]))
+        return cases
+
+    def _history_ids(self, emp_id):
+        rows = services.get_tasks(emp_id, ViewType.SELF)
+        if not rows:
+            self.stderr.write("No SELF tasks for --emp-id — skipping sp_get_task_history")
+        step = max(1, len(rows) // HISTORY_SAMPLES)
+        return [row['execution_log_id'] for row in rows[::step][:HISTORY_SAMPLES]]
+
+    # ── Running ──────────────────────────────────────────────────
+    def _run_case(self, name, sp_name, params, repeat, drop_caches, using=None):
+        result = {"case": name, "sp": sp_name, "params": params}
+        try:
+            if drop_caches:
+                run_query(DROP_CACHES_SQL, label='benchmark_drop_caches',
+                          using=using or route(sp_name))
+            cold_seconds, rows = self._time(sp_name, params, using)
+            warm = [self._time(sp_name, params, using)[0] for _ in range(repeat)]
+        except Exception as e:
+            result["error"] = str(e)
+            return result
+
+        result["rows"]    = rows
+        result["cold_ms"] = cold_seconds * 1000
+        if warm:
+            warm_ms = sorted(seconds * 1000 for seconds in warm)
+            result["warm_ms"] = {
+                "min":    warm_ms[0],
+                "median": statistics.median(warm_ms),
+                "p95":    warm_ms[min(len(warm_ms) - 1, int(0.95 * len(warm_ms)))],
+                "max":    warm_ms[-1],
+            }
+        return result
+
+    @staticmethod
+    def _time(sp_name, params, using=None):
+        """One call, all result sets fetched → (seconds, total rows)."""
+        started = time.perf_counter()
+        result_sets = call_sp_multiple_results(sp_name, params, using=using)
+        elapsed = time.perf_counter() - started
+        return elapsed, sum(len(rs) for rs in result_sets)
+
+    # ── Output ───────────────────────────────────────────────────
+    def _print(self, results, top):
+        def warm_median(result):
+            return result.get("warm_ms", {}).get("median", result.get("cold_ms", 0))
+
+        ranked = sorted(results, key=lambda r: ("error" not in r, warm_median(r)), reverse=True)
+        self.stdout.write(f"{'warm med':>9} {'warm p95':>9} {'cold':>9} {'rows':>7}  case")
+        for result in ranked[:top]:
+            if "error" in result:
+                self.stdout.write(f"{'ERROR':>9} {'':>9} {'':>9} {'':>7}  "
+                                  f"{result['case']}: {result['error']}")
+                continue
+            warm = result.get("warm_ms", {})
+            self.stdout.write(
+                f"{warm.get('median', 0):>9.1f} {warm.get('p95', 0):>9.1f} "
+                f"{result['cold_ms']:>9.1f} {result['rows']:>7}  {result['case']}")
+        errors = sum(1 for r in results if "error" in r)
+        if errors:
+            self.stderr.write(f"{errors} case(s) failed")
+
+    def _compare(self, old_path, new_path, threshold):
+        try:
+            with open(old_path) as f:
+                old = {r["case"]: r for r in json.load(f)["cases"]}
+            with open(new_path) as f:
+                new = {r["case"]: r for r in json.load(f)["cases"]}
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f"Cannot read reports: {str(e)}")
+
+        changed = []
+        for name in old.keys() & new.keys():
+            before = old[name].get("warm_ms", {}).get("median")
+            after  = new[name].get("warm_ms", {}).get("median")
+            if not before or after is None:
+                continue
+            ratio = after / before
+            if abs(ratio - 1) > threshold:
+                changed.append((ratio, name, before, after))
+
+        self.stdout.write(f"{'old ms':>9} {'new ms':>9} {'ratio':>7}  case")
+        for ratio, name, before, after in sorted(changed, reverse=True):
+            marker = "slower" if ratio > 1 else "faster"
+            self.stdout.write(f"{before:>9.1f} {after:>9.1f} {ratio:>6.2f}x  {name}  ({marker})")
+        slower = sum(1 for ratio, *_ in changed if ratio > 1)
+        self.stdout.write(
+            f"\n{len(old.keys() & new.keys())} cases compared, {slower} slower, "
+            f"{len(changed) - slower} faster beyond {threshold:.0%}; "
+            f"{len(old.keys() - new.keys())} only in OLD, {len(new.keys() - old.keys())} only in NEW")
@@ -0,0 +1,58 @@
+"""
+python manage.py import_tasks tasks.csv --created-by 380988
+python manage.py import_tasks tasks.ndjson --created-by 380988 --report report.ndjson
+
+Same rules and batching as POST /api/tasks/import/ (apps/tasks/importer.py).
+Per-row results are written as NDJSON (stdout, or --report); the
+summary goes to stderr. The file is read line by line.
+"""
+
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tasks import importer
+
+
+class Command(BaseCommand):
+    help = "Bulk-create tasks from a CSV or NDJSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV / NDJSON file, or - for stdin")
+        parser.add_argument('--created-by', type=int, required=True,
+                            help="emp_id the tasks are assigned by")
+        parser.add_argument('--file-type', choices=importer.FILE_TYPES,
+                            help="Default: from the file extension")
+        parser.add_argument('--batch-size', type=int,
+                            help="Tasks per transaction (default TASK_IMPORT_BATCH_SIZE)")
+        parser.add_argument('--report', help="Write per-row results here instead of stdout")
+
+    def handle(self, *args, **options):
+        path      = options['path']
+        file_type = options['file_type'] or importer.file_type_for(path)
+        if file_type not in importer.FILE_TYPES:
+            raise CommandError("Cannot tell the file type — use --file-type csv|ndjson")
+
+        source = (sys.stdin if path == '-'
+                  else open(path, encoding='utf-8-sig', newline=''))
+        report = open(options['report'], 'w') if options['report'] else self.stdout
+        try:
+            results = importer.with_summary(importer.import_tasks(
+                importer.parse_rows(source, file_type),
+                options['created_by'],
+                batch_size=options['batch_size'],
+            ))
+            for result in results:
+                if 'summary' in result:
+                    summary = result['summary']
+                    self.stderr.write(
+                        f"{summary['total']} rows: {summary['created']} created, "
+                        f"{summary['failed']} failed")
+                    continue
+                report.write(json.dumps(result, default=str) + '\n')
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if report is not self.stdout:
+                report.close()
@@ -1,15 +1,168 @@
 # apps/tasks/notifications.py
+"""
+Task Notifications — WebSocket pushes to task_updates_{emp_id}
+──────────────────────────────────────────────────────────────
+Request handlers only ENQUEUE. A background thread (dispatcher)
+drains the queue in batches and sends each batch concurrently on
+its own event loop, so create / status-update latency never waits
+on Redis.
 
+  • Queue is bounded (NOTIFICATION_QUEUE_SIZE) → overflow is dropped
+  • Redis down → batches are dropped for NOTIFICATION_RETRY_SECONDS
+    instead of timing out one by one
+  • dispatcher.stats() → enqueued / delivered / dropped / failed counters
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
+from utils.profiling import add_timing
+
+logger = logging.getLogger(__name__)
+
+
+def group_name(emp_id):
+    """Channel-layer group every connection of emp_id joins."""
+    return f"task_updates_{emp_id}"
+
+
+class NotificationDispatcher:
+
+    def __init__(self):
+        self._queue       = None
+        self._thread      = None
+        self._lock        = threading.Lock()
+        self._down_until  = 0.0
+        self._counters    = {
+            "enqueued":  0,
+            "delivered": 0,
+            "dropped":   0,     # queue full, or Redis known to be down
+            "failed":    0,     # group_send raised
+            "batches":   0,
+        }
+
+    # ── Producer side (request threads) ──────────────────────────
+    def submit(self, emp_id, data):
+        """Queue one notification. Never blocks."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((group_name(emp_id), data))
+            self._count("enqueued")
+        except queue.Full:
+            self._count("dropped")
+
+    def stats(self):
+        with self._lock:
+            snapshot = dict(self._counters)
+        snapshot["queued"] = self._queue.qsize() if self._queue else 0
+        return snapshot
+
+    def flush(self, timeout=5.0):
+        """Wait until everything queued so far has been handled."""
+        deadline = time.monotonic() + timeout
+        while self._queue and self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self._counters[name] += n
+
+    def _ensure_started(self):
+        # Started lazily — after any pre-fork, inside the worker process
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            if self._queue is None:
+                self._queue = queue.Queue(
+                    maxsize=getattr(settings, 'NOTIFICATION_QUEUE_SIZE', 10000))
+            self._thread = threading.Thread(
+                target=self._run, name="notification-dispatcher", daemon=True)
+            self._thread.start()
+
+    # ── Consumer side (dispatcher thread) ────────────────────────
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        batch_size = getattr(settings, 'NOTIFICATION_BATCH_SIZE', 100)
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._deliver(loop, batch)
+            except Exception as e:
+                logger.error(f"Notification dispatch error: {str(e)}")
+                self._count("failed", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _deliver(self, loop, batch):
+        if time.monotonic() < self._down_until:
+            self._count("dropped", len(batch))
+            return
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            self._count("dropped", len(batch))
+            return
+
+        results = loop.run_until_complete(self._send_all(channel_layer, batch))
+        failed = sum(1 for r in results if isinstance(r, Exception))
+        self._count("batches")
+        self._count("delivered", len(batch) - failed)
+        if failed:
+            self._count("failed", failed)
+        if failed == len(batch):
+            # Most likely Redis is not running — stop trying for a while
+            self._down_until = time.monotonic() + getattr(
+                settings, 'NOTIFICATION_RETRY_SECONDS', 30)
+            logger.warning(f"Notification batch failed: {results[0]}")
+
+    @staticmethod
+    async def _send_all(channel_layer, batch):
+        """All group_send calls of one batch in flight together."""
+        return await asyncio.gather(
+            *(channel_layer.group_send(group, {
+                "type": "task_notification",
+                "data": data,
+            }) for group, data in batch),
+            return_exceptions=True,
+        )
+
+
+dispatcher = NotificationDispatcher()
 
 
 def send_notification(emp_id, data):
     """Send WebSocket notification to a specific employee."""
+    started = time.perf_counter()
+    try:
+        _send(emp_id, data)
+    finally:
+        add_timing('notify', time.perf_counter() - started)
+
+
+def _send(emp_id, data):
+    if getattr(settings, 'NOTIFICATIONS_ASYNC', True):
+        dispatcher.submit(emp_id, data)
+        return
     try:
         channel_layer = get_channel_layer()
         async_to_sync(channel_layer.group_send)(
-            f"task_updates_{emp_id}",
+            group_name(emp_id),
             {
                 "type": "task_notification",
                 "data": data,
@@ -28,6 +181,19 @@ def notify_task_assigned(emp_id, task_title, assigned_by_name):
     })
 
 
+def notify_bulk_assigned(emp_id, task_titles, assigned_by_name):
+    """One notification for many tasks assigned to emp_id at once."""
+    if len(task_titles) == 1:
+        notify_task_assigned(emp_id, task_titles[0], assigned_by_name)
+        return
+    send_notification(emp_id, {
+        "type":    "TASK_ASSIGNED",
+        "message": f"{len(task_titles)} tasks assigned by {assigned_by_name}",
+        "action":  "refresh",
+        "tasks":   [{"title": title} for title in task_titles],
+    })
+
+
 def notify_status_changed(emp_id, task_title, new_status, action_by_name):
     send_notification(emp_id, {
         "type":    "STATUS_CHANGED",
@@ -36,9 +202,51 @@ def notify_status_changed(emp_id, task_title, new_status, action_by_name):
     })
 
 
+def notify_bulk_status_changed(emp_id, changes, action_by_name):
+    """
+    One notification for many status changes to emp_id's tasks.
+    changes → [(execution_log_id, task_title, new_status), ...]
+    """
+    if len(changes) == 1:
+        _, task_title, new_status = changes[0]
+        notify_status_changed(emp_id, task_title, new_status, action_by_name)
+        return
+    statuses = {new_status for _, _, new_status in changes}
+    summary  = statuses.pop() if len(statuses) == 1 else "updated"
+    send_notification(emp_id, {
+        "type":    "STATUS_CHANGED",
+        "message": f"{len(changes)} tasks — {summary} by {action_by_name}",
+        "action":  "refresh",
+        "tasks":   [
+            {"execution_log_id": log_id, "title": title, "status": new_status}
+            for log_id, title, new_status in changes
+        ],
+    })
+
+
 def notify_task_extended(emp_id, task_title, extended_date, action_by_name):
     send_notification(emp_id, {
         "type":    "EXTENDED",
         "message": f"'{task_title}' extended to {extended_date} by {action_by_name}",
         "action":  "refresh",
-    })
\ No newline at end of file
+    })
+
+
+def notify_bulk_extended(emp_id, extensions, action_by_name):
+    """
+    One notification for many extended deadlines of emp_id.
+    extensions → [(execution_log_id, task_title, extended_date), ...]
+    """
+    if len(extensions) == 1:
+        _, task_title, extended_date = extensions[0]
+        notify_task_extended(emp_id, task_title, extended_date, action_by_name)
+        return
+    send_notification(emp_id, {
+        "type":    "EXTENDED",
+        "message": f"{len(extensions)} task deadlines extended by {action_by_name}",
+        "action":  "refresh",
+        "tasks":   [
+            {"execution_log_id": log_id, "title": title, "extended_date": extended_date}
+            for log_id, title, extended_date in extensions
+        ],
+    })
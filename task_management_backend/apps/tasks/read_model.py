@@ -0,0 +1,179 @@
+"""
+Task List Read Model — sp_fetch_task_list snapshots, in memory
+──────────────────────────────────────────────────────────────
+Optional (READ_MODEL_ENABLED). One snapshot per (emp_id, view_type):
+the UNFILTERED task list, loaded with one SP call, plus an index per
+filterable column. Filtered lists are then answered from the indexes:
+
+  status       → status
+  priority     → priority_type
+  task_type    → task_type
+  employee_id  → emp_id           (ASSIGNED_BY_ME: the assignee)
+  overdue_only → is_overdue
+
+Rows keep the SP's order. Any other filter (date_from / date_to /
+extended_only / search) → None, and the caller runs the SP as before —
+those rules live inside the SP and are not duplicated here.
+
+Out of scope — always SQL Server: dashboard counts, affected-by-holiday,
+and every date-filtered / searched / extended_only list. Only the
+task-list endpoints with the indexed filters above are served here.
+
+A snapshot is reloaded when:
+  • a write in this process touched it       → discard() from _tasks_changed()
+  • a write in any worker bumped its change-log version
+  • the day changed (is_overdue / days_remaining)
+  • it is older than READ_MODEL_TTL_SECONDS  → reconcile with SQL Server
+Per process — each worker keeps its own snapshots, and relies on the
+change log to hear about other workers' writes. So the read model stays
+off (with a warning) unless CHANGE_LOG_CACHE is a shared cache (Redis):
+with a per-process LocMemCache a write in another worker would go
+unseen — even by its author — until the TTL.
+"""
+
+import logging
+import threading
+from datetime import date
+
+from django.conf import settings
+from utils.cache import TTLCache, is_process_local
+
+from .change_log import change_log
+
+logger = logging.getLogger(__name__)
+
+# filter key → column of sp_fetch_task_list
+INDEXED_FILTERS = {
+    'status':       'status',
+    'priority':     'priority_type',
+    'task_type':    'task_type',
+    'employee_id':  'emp_id',
+    'overdue_only': 'is_overdue',
+}
+FLAG_FILTERS = ('overdue_only', 'extended_only')
+
+
+def _active_filters(filters):
+    """Filters that actually narrow the list (flags: truthy, like the SP's 1 / 0)."""
+    active = {}
+    for key, value in (filters or {}).items():
+        if key in FLAG_FILTERS:
+            if value:
+                active[key] = True
+        elif value is not None:
+            active[key] = value
+    return active
+
+
+class _Snapshot:
+    __slots__ = ('columns', 'rows', 'indexes', 'version', 'day')
+
+    def __init__(self, columns, rows, version, day):
+        self.columns = columns
+        self.rows    = rows
+        self.version = version
+        self.day     = day
+        self.indexes = {}
+        for column in set(INDEXED_FILTERS.values()):
+            if column not in columns:
+                continue
+            pos   = columns.index(column)
+            index = {}
+            for i, row in enumerate(rows):
+                value = row[pos]
+                if column == 'is_overdue':
+                    value = bool(value)
+                index.setdefault(value, []).append(i)
+            self.indexes[column] = index
+
+    def positions(self, active):
+        """Row positions matching every filter, ascending. None → cannot answer."""
+        matches = []
+        for key, value in active.items():
+            index = self.indexes.get(INDEXED_FILTERS[key])
+            if index is None:
+                return None
+            matches.append(index.get(value, ()))
+        if not matches:
+            return range(len(self.rows))
+        matches.sort(key=len)
+        if len(matches) == 1:
+            return matches[0]
+        found = set(matches[0])
+        for other in matches[1:]:
+            found.intersection_update(other)
+        return sorted(found)
+
+
+class TaskReadModel:
+
+    def __init__(self):
+        self.snapshots = TTLCache(
+            max_entries=getattr(settings, 'READ_MODEL_MAX_SNAPSHOTS', 1000),
+            ttl_seconds=getattr(settings, 'READ_MODEL_TTL_SECONDS', 300),
+        )
+        self.fallbacks = 0
+        self._lock     = threading.Lock()
+        self._warned   = False
+
+    @property
+    def enabled(self):
+        if not getattr(settings, 'READ_MODEL_ENABLED', False):
+            return False
+        alias = getattr(settings, 'CHANGE_LOG_CACHE', 'default')
+        if is_process_local(alias):
+            if not self._warned:
+                self._warned = True
+                logger.warning(
+                    f"READ_MODEL_ENABLED ignored: CHANGE_LOG_CACHE '{alias}' is per "
+                    f"process, so writes in other workers would not reach the read model")
+            return False
+        return True
+
+    def tasks(self, emp_id, view_type, filters, load, columnar=False):
+        """
+        get_tasks() result from the snapshot, or None when the filters
+        need the SP. load() → call_sp_columnar result of the unfiltered list.
+        """
+        active = _active_filters(filters)
+        if any(key not in INDEXED_FILTERS for key in active):
+            with self._lock:
+                self.fallbacks += 1
+            return None
+
+        snapshot  = self._snapshot(emp_id, view_type, load)
+        positions = snapshot.positions(active)
+        if positions is None:       # SP did not return the column
+            with self._lock:
+                self.fallbacks += 1
+            return None
+        rows = [snapshot.rows[i] for i in positions]
+        if columnar:
+            return {"columns": list(snapshot.columns), "rows": rows}
+        columns = snapshot.columns
+        return [dict(zip(columns, row)) for row in rows]
+
+    def _snapshot(self, emp_id, view_type, load):
+        key     = (int(emp_id), view_type)
+        # Version first: a write landing during load() makes it stale at once
+        version = change_log.version(emp_id, view_type)
+        today   = date.today()
+        snapshot = self.snapshots.get(key)
+        if snapshot is not None and snapshot.version == version and snapshot.day == today:
+            return snapshot
+
+        result   = load()
+        snapshot = _Snapshot(result["columns"], result["rows"], version, today)
+        self.snapshots.set(key, snapshot)
+        return snapshot
+
+    def discard(self, stale):
+        """Drop snapshots for {(emp_id, view_type), ...}."""
+        if stale:
+            self.snapshots.discard_where(lambda key: key in stale)
+
+    def clear(self):
+        self.snapshots.clear()
+
+
+read_model = TaskReadModel()
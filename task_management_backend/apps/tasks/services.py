@@ -5,18 +5,148 @@ No auto-shifting. Frontend asks permission first.
 """
 # apps/tasks/services.py
 
-from utils.db_helper import call_sp, call_sp_multiple_results,run_query
+import heapq
+import json
+import tempfile
+
+from django.conf import settings
+from django.db import transaction
+from rest_framework.utils.encoders import JSONEncoder
+from utils.cache import TTLCache, is_process_local
+from utils.db_helper import (
+    call_sp,
+    call_sp_columnar,
+    call_sp_multiple_results,
+    run_query,
+    iter_sp,
+)
 from utils.constants import ActionType, TaskType
+from utils.db_routing import stick
+from utils.pagination import encode_cursor
+from .change_log import change_log
+from .employee_directory import employee_directory
+from .read_model import read_model
 from .notifications import (
     notify_task_assigned,
+    notify_bulk_assigned,
     notify_status_changed,
+    notify_bulk_status_changed,
     notify_task_extended,
+    notify_bulk_extended,
+)
+from .holiday_helper import holiday_calendar, _to_date
+
+
+# ── Dashboard cache ──────────────────────────────────────────────
+# key   → (emp_id, view_type, date_from, date_to, employee_id)
+# value → (change-log version, {section: rows} for every section loaded so far)
+# Entries are dropped by _tasks_changed() when a write in this process
+# touches emp_id, and ignored once the version moved (a write in any
+# worker). Only used when CHANGE_LOG_CACHE is shared — with a
+# per-process change log other workers' writes would go unseen.
+dashboard_cache = TTLCache(
+    max_entries=getattr(settings, 'DASHBOARD_CACHE_MAX_ENTRIES', 1000),
+    ttl_seconds=getattr(settings, 'DASHBOARD_CACHE_TTL_SECONDS', 300),
 )
 
 
+def _tasks_changed(assigned_by=None, assignees=(),
+                   execution_log_id=None, task_id=None):
+    """
+    Called after every successful write.
+      assigned_by → their ASSIGNED_BY_ME view changed
+      assignees   → their SELF view changed
+    Drops their cached dashboards and appends to the change log.
+    Their reads stay on the primary until the replica has caught up.
+    """
+    change_log.record(assigned_by, assignees,
+                      execution_log_id=execution_log_id, task_id=task_id)
+    stick([assigned_by, *assignees])
+    stale = set()
+    if assigned_by:
+        stale.add((int(assigned_by), 'ASSIGNED_BY_ME'))
+    for emp_id in assignees:
+        if emp_id:
+            stale.add((int(emp_id), 'SELF'))
+    if stale:
+        dashboard_cache.discard_where(lambda key: key[:2] in stale)
+        read_model.discard(stale)
+
+
+def _display_name(emp_id, name):
+    """Name for notification text — from the directory when not given."""
+    if name:
+        return name
+    try:
+        return employee_directory.name(emp_id, str(emp_id))
+    except Exception:
+        # The write already succeeded — never fail it over a name
+        return str(emp_id)
+
+
+def _emp_ids(emp_list):
+    """'25, 30,' → [25, 30]"""
+    return [int(eid) for eid in str(emp_list).split(',') if eid.strip()]
+
+
 def create_task(task_data, created_by, created_by_name=""):
+    """Create ONE task, then invalidate caches and notify the assignees."""
+    result = _call_create_task(task_data, created_by)
+    if result and result[0].get('success') == 1:
+        assignees = _emp_ids(task_data['emp_list'])
+        _tasks_changed(assigned_by=created_by, assignees=assignees,
+                       task_id=result[0].get('task_id'))
+        created_by_name = _display_name(created_by, created_by_name)
+        for eid in assignees:
+            notify_task_assigned(
+                eid,
+                task_data['task_title'],
+                created_by_name,
+            )
+
+    return result
+
+
+def create_tasks_batch(tasks, created_by, created_by_name=""):
+    """
+    Create many tasks in ONE transaction (bulk import).
+
+    Savepoint per task, as in update_task_status_bulk(). Returns one
+    result per task, in order: {"success", "message", "task_id"}.
+    Each assignee gets ONE notification for all tasks of the batch.
+    """
+    results, created = [], []
+    with transaction.atomic():
+        for task_data in tasks:
+            try:
+                with transaction.atomic():
+                    result = _call_create_task(task_data, created_by)
+            except Exception as e:
+                results.append({"success": 0, "message": str(e), "task_id": 0})
+                continue
+            info = result[0] if result else {"success": 0, "message": "No result", "task_id": 0}
+            results.append(info)
+            if info.get('success') == 1:
+                created.append((task_data, info))
+
+    # ── Committed — now invalidate and notify ────────────────────
+    per_assignee = {}
+    for task_data, info in created:
+        assignees = _emp_ids(task_data['emp_list'])
+        _tasks_changed(assigned_by=created_by, assignees=assignees,
+                       task_id=info.get('task_id'))
+        for eid in assignees:
+            per_assignee.setdefault(eid, []).append(task_data['task_title'])
+    if per_assignee:
+        created_by_name = _display_name(created_by, created_by_name)
+        for eid, titles in per_assignee.items():
+            notify_bulk_assigned(eid, titles, created_by_name)
+    return results
+
+
+def _call_create_task(task_data, created_by):
     """
-    Create task.
+    sp_create_task for one task. No side effects.
 
     Date + Time handling:
     ─────────────────────
@@ -80,23 +210,12 @@ def create_task(task_data, created_by, created_by_name=""):
         created_by,
         task_data['emp_list'],
     ])
-
-    if result and result[0].get('success') == 1:
-        for eid in task_data['emp_list'].split(','):
-            eid = eid.strip()
-            if eid:
-                notify_task_assigned(
-                    int(eid),
-                    task_data['task_title'],
-                    created_by_name,
-                )
-
     return result
 
 
-def get_tasks(emp_id, view_type, filters=None):
+def _task_list_params(emp_id, view_type, filters):
     if filters:
-        return call_sp('sp_fetch_task_list', [
+        return [
             emp_id,
             view_type,
             filters.get('status'),
@@ -108,11 +227,180 @@ def get_tasks(emp_id, view_type, filters=None):
             1 if filters.get('overdue_only') else 0,
             1 if filters.get('extended_only') else 0,
             filters.get('search'),
-        ])
-    return call_sp('sp_fetch_task_list', [
+        ]
+    return [
         emp_id, view_type,
         None, None, None, None, None, None, 0, 0, None,
-    ])
+    ]
+
+
+def _from_read_model(emp_id, view_type, filters, columnar=False):
+    """get_tasks() result from the read model, or None → call the SP."""
+    if not read_model.enabled:
+        return None
+    return read_model.tasks(
+        emp_id, view_type, filters,
+        load=lambda: call_sp_columnar(
+            'sp_fetch_task_list', _task_list_params(emp_id, view_type, None)),
+        columnar=columnar,
+    )
+
+
+def get_tasks(emp_id, view_type, filters=None, columnar=False):
+    result = _from_read_model(emp_id, view_type, filters, columnar)
+    if result is not None:
+        return result
+    fetch = call_sp_columnar if columnar else call_sp
+    return fetch('sp_fetch_task_list',
+                 _task_list_params(emp_id, view_type, filters))
+
+
+def iter_tasks(emp_id, view_type, filters=None, batch_size=None):
+    """get_tasks() as a generator — rows are fetched batch_size at a time."""
+    rows = _from_read_model(emp_id, view_type, filters)
+    if rows is not None:
+        return iter(rows)
+    return iter_sp('sp_fetch_task_list',
+                   _task_list_params(emp_id, view_type, filters),
+                   batch_size)
+
+
+def spool_rows(rows):
+    """
+    Drain rows into a temp file (in memory up to EXPORT_SPOOL_MEMORY_BYTES,
+    then on disk) and return a generator reading them back.
+    Closes the source cursor before the caller runs other queries on
+    the same connection (SQL Server allows one open result set).
+    """
+    spool   = tempfile.SpooledTemporaryFile(
+        max_size=getattr(settings, 'EXPORT_SPOOL_MEMORY_BYTES', 8 * 1024 * 1024),
+        mode='w+', encoding='utf-8')
+    encoder = JSONEncoder()
+    for row in rows:
+        spool.write(encoder.encode(row) + '\n')
+    spool.seek(0)
+
+    def read_back():
+        with spool:
+            for line in spool:
+                yield json.loads(line)
+    return read_back()
+
+
+def iter_task_export(emp_id, view_type, filters=None, include_history=False):
+    """
+    Rows for /api/tasks/export/, as a generator.
+    include_history → each row gets "history": sp_get_task_history rows.
+    The task list is spooled first (see spool_rows) — history is then read
+    one task at a time: one sp_get_task_history call per row (N+1).
+    """
+    rows = iter_tasks(emp_id, view_type, filters)
+    if not include_history:
+        return rows
+    rows = spool_rows(rows)
+
+    def with_history():
+        for row in rows:
+            row['history'] = call_sp('sp_get_task_history',
+                                     [row['execution_log_id']])
+            yield row
+    return with_history()
+
+
+# Stable sort key for paging: newest execution log first
+TASK_PAGE_KEY = 'execution_log_id'
+
+
+def get_task_page(emp_id, view_type, filters=None, limit=50, after=None):
+    """
+    One keyset page of get_tasks(), ordered by execution_log_id DESC.
+
+    after → execution_log_id of the last row of the previous page
+            (decoded from the client's cursor), None for page 1.
+
+    Rows are streamed from the SP and only the best limit+1 rows past
+    the cursor are held (heap), so memory and payload are per page.
+    Database work is not: the SP takes no @after / @limit, so every
+    page streams the full list — O(total rows), page 1 or page 50.
+    """
+    rows = iter_tasks(emp_id, view_type, filters)
+    if after is not None:
+        rows = (row for row in rows if row[TASK_PAGE_KEY] < after)
+    page = heapq.nlargest(limit + 1, rows, key=lambda row: row[TASK_PAGE_KEY])
+
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = encode_cursor(page[-1][TASK_PAGE_KEY])
+    return {
+        "results":     employee_directory.fill_names(page),
+        "limit":       limit,
+        "next_cursor": next_cursor,
+    }
+
+
+def get_task_changes(emp_id, view_type, since=None):
+    """
+    Tasks in emp_id's view_type list that changed after the since token.
+
+    Returns:
+      reset      → True: token unusable, reload the full list
+      tasks      → current rows of the changed tasks
+      removed    → changed execution_log_ids no longer in the list
+      next_token → pass as since next time
+    """
+    position = change_log.read_token(since) if since else None
+    delta = None
+    if position is not None:
+        delta = change_log.changes_since(position[0], emp_id, view_type)
+    if delta is None:
+        return {"reset": True, "tasks": [], "removed": [],
+                "next_token": change_log.token()}
+
+    seq, issued = position
+    log_ids, task_ids, last = delta
+    # Keep the issue time while nothing new was read (a write in flight
+    # at the end of the log) — the token still ages out into a reset
+    next_token = change_log.token(last, issued if last == seq else None)
+    if not log_ids and not task_ids:
+        return {"reset": False, "tasks": [], "removed": [],
+                "next_token": next_token}
+
+    tasks, found, has_task_id = [], set(), False
+    for row in iter_tasks(emp_id, view_type):
+        has_task_id = has_task_id or 'task_id' in row
+        if (row.get('execution_log_id') in log_ids
+                or row.get('task_id') in task_ids):
+            tasks.append(row)
+            found.add(row.get('execution_log_id'))
+    if task_ids and not has_task_id:
+        # New tasks can only be matched by task_id
+        return {"reset": True, "tasks": [], "removed": [],
+                "next_token": next_token}
+    return {
+        "reset":      False,
+        "tasks":      employee_directory.fill_names(tasks),
+        "removed":    sorted(log_ids - found),
+        "next_token": next_token,
+    }
+
+
+def _status_targets(info, action_type, action_by):
+    """
+    SP result row → (assigned_by, assignee, notify_emp_id) of a status change.
+    Assignee acts on 1/2/5 (→ assigner is told), assigner on 3/4/6/7
+    (→ assignee is told).
+    """
+    by_assignee = action_type in [1, 2, 5]
+    assigned_by = info.get('assigned_by') or (None if by_assignee else action_by)
+    assignee    = info.get('emp_id') or (action_by if by_assignee else None)
+    if by_assignee:
+        notify_emp_id = info.get('assigned_by')
+    elif action_type in [3, 4, 6, 7]:
+        notify_emp_id = info.get('emp_id')
+    else:
+        notify_emp_id = None
+    return assigned_by, assignee, notify_emp_id
 
 
 def update_task_status(execution_log_id, action_type,
@@ -121,21 +409,106 @@ def update_task_status(execution_log_id, action_type,
         execution_log_id, action_type, action_by, remarks, None,
     ])
     if result and result[0].get('success') == 1:
-        info        = result[0]
         status_name = ActionType.CHOICES.get(action_type, 'UNKNOWN')
-        if action_type in [1, 2, 5]:
-            notify_status_changed(
-                info.get('assigned_by'), remarks,
-                status_name, action_by_name,
-            )
-        elif action_type in [3, 4, 6, 7]:
+        assigned_by, assignee, notify_emp_id = _status_targets(
+            result[0], action_type, action_by)
+        _tasks_changed(
+            assigned_by=assigned_by,
+            assignees=[assignee],
+            execution_log_id=execution_log_id,
+        )
+        if notify_emp_id:
             notify_status_changed(
-                info.get('emp_id'), remarks,
-                status_name, action_by_name,
+                notify_emp_id, remarks,
+                status_name, _display_name(action_by, action_by_name),
             )
     return result
 
 
+def _update_in_savepoint(execution_log_id, params, required=()):
+    """
+    One sp_update_task_status call inside a savepoint of the caller's
+    transaction. Always returns a result row with execution_log_id —
+    an exception rolls back this item only and becomes success=0.
+    required → result columns a successful row must carry; a row
+               missing one is rolled back too instead of guessed at.
+    """
+    try:
+        with transaction.atomic():
+            result  = call_sp('sp_update_task_status', params)
+            missing = [col for col in required
+                       if result and result[0].get('success') == 1
+                       and not result[0].get(col)]
+            if missing:
+                raise ValueError(f"Not updated: result has no {', '.join(missing)}")
+    except Exception as e:
+        return {"execution_log_id": execution_log_id,
+                "success": 0, "message": str(e)}
+    info = result[0] if result else {"success": 0, "message": "No result"}
+    return {**info, "execution_log_id": execution_log_id}
+
+
+def update_task_status_bulk(items, action_by, action_by_name=""):
+    """
+    Many status updates in ONE transaction.
+
+    items → [{"execution_log_id", "action_type", "remarks"}, ...]
+
+    Each item runs in its own savepoint: a failing item is rolled back
+    and reported, the rest still commit. Returns one result per item,
+    in order: {"execution_log_id", "success", "message"}.
+    Each recipient gets ONE notification covering all their tasks.
+    """
+    results, changed = [], []
+    with transaction.atomic():
+        for item in items:
+            execution_log_id = item.get('execution_log_id')
+            action_type      = item.get('action_type')
+            remarks          = item.get('remarks', '')
+            if execution_log_id is None or action_type is None:
+                results.append({"execution_log_id": execution_log_id, "success": 0,
+                                "message": "execution_log_id and action_type required"})
+                continue
+            try:
+                execution_log_id, action_type = int(execution_log_id), int(action_type)
+            except (TypeError, ValueError):
+                results.append({"execution_log_id": execution_log_id, "success": 0,
+                                "message": "execution_log_id and action_type must be numbers"})
+                continue
+            if action_type == ActionType.EXTENDED:
+                results.append({"execution_log_id": execution_log_id, "success": 0,
+                                "message": "Use /api/tasks/extend/ to extend"})
+                continue
+
+            info = _update_in_savepoint(execution_log_id, [
+                execution_log_id, action_type, action_by, remarks, None,
+            ])
+            results.append(info)
+            if info.get('success') == 1:
+                changed.append((execution_log_id, action_type, remarks, info))
+
+    # ── Committed — now invalidate and notify ────────────────────
+    per_recipient = {}
+    for execution_log_id, action_type, remarks, info in changed:
+        assigned_by, assignee, notify_emp_id = _status_targets(
+            info, action_type, action_by)
+        _tasks_changed(
+            assigned_by=assigned_by,
+            assignees=[assignee],
+            execution_log_id=execution_log_id,
+        )
+        if notify_emp_id:
+            per_recipient.setdefault(notify_emp_id, []).append((
+                execution_log_id, remarks,
+                ActionType.CHOICES.get(action_type, 'UNKNOWN'),
+            ))
+    if per_recipient:
+        action_by_name = _display_name(action_by, action_by_name)
+        for emp_id, changes in per_recipient.items():
+            notify_bulk_status_changed(emp_id, changes, action_by_name)
+    return results
+
+
 def extend_task(execution_log_id, action_by,
                 extended_date, remarks, action_by_name=""):
     if not extended_date:
@@ -146,53 +519,196 @@ def extend_task(execution_log_id, action_by,
         action_by, remarks, extended_date,
     ])
     if result and result[0].get('success') == 1:
+        _tasks_changed(
+            assigned_by=result[0].get('assigned_by') or action_by,
+            assignees=[result[0].get('emp_id')],
+            execution_log_id=execution_log_id,
+        )
         notify_task_extended(
             result[0].get('emp_id'),
             remarks,
             extended_date,
-            action_by_name,
+            _display_name(action_by, action_by_name),
         )
     return result
 
 
-def get_task_history(execution_log_id):
-    return call_sp('sp_get_task_history', [execution_log_id])
+def extend_tasks_bulk(emp_id, view_type, items=None, action_by_name=""):
+    """
+    Move many deadlines off holidays in ONE transaction.
 
+    items → [{"execution_log_id", "extended_date"?, "remarks"?}, ...]
+            None = every task sp_get_affected_tasks returns for the view.
 
-def get_dashboard_counts(emp_id, view_type, date_from=None, date_to=None, employee_id=None):
-    results = call_sp_multiple_results(
-        'sp_dashboard_counts', [emp_id, view_type, date_from, date_to, employee_id])
-    return {
-        "view_type":        view_type,
-        "overall_counts":   results[0][0] if len(results) > 0 and results[0] else {},
-        "employee_summary": results[1]    if len(results) > 1 and results[1] else [],
-        "status_chart":     results[2]    if len(results) > 2 and results[2] else [],
-        "priority_chart":   results[3]    if len(results) > 3 and results[3] else [],
-        "monthly_trend":    results[4]    if len(results) > 4 and results[4] else [],
-    }
+    Without extended_date, a task goes to the next working day on or
+    after its current deadline (holiday calendar, no per-task
+    check-date). sp_get_affected_tasks is called at most once.
+    Savepoint per item, as in update_task_status_bulk(); each employee
+    gets ONE notification for all their extended tasks. An item whose
+    result has no assigned_by is rolled back and reported — the caller
+    is not guessed in as the assigner.
+    """
+    affected = {}
+    if items is None or any(not item.get('extended_date') for item in items):
+        affected = {row.get('execution_log_id'): row
+                    for row in get_affected_tasks(emp_id, view_type)}
+    if items is None:
+        items = [{"execution_log_id": log_id} for log_id in affected]
+
+    results, changed = [], []
+    with transaction.atomic():
+        for item in items:
+            try:
+                execution_log_id = int(item.get('execution_log_id'))
+            except (TypeError, ValueError):
+                results.append({"execution_log_id": item.get('execution_log_id'),
+                                "success": 0, "message": "execution_log_id must be a number"})
+                continue
 
+            row           = affected.get(execution_log_id) or {}
+            extended_date = item.get('extended_date')
+            if not extended_date:
+                if not row:
+                    results.append({"execution_log_id": execution_log_id, "success": 0,
+                                    "message": "Not affected by a holiday — give extended_date"})
+                    continue
+                deadline = _to_date(row.get('current_deadline') or row.get('suggested_date'))
+                new_date = holiday_calendar.next_working_day(deadline)
+                if new_date == deadline:
+                    results.append({"execution_log_id": execution_log_id, "success": 0,
+                                    "message": "Deadline is already a working day"})
+                    continue
+                extended_date = new_date.isoformat()
 
-def get_affected_tasks(emp_id, view_type):
-    return call_sp('sp_get_affected_tasks', [emp_id, view_type]) 
+            remarks = item.get('remarks') or (
+                f"Shifted from {row.get('reason')} ({_to_date(row.get('current_deadline'))})"
+                if row else '')
+            info = _update_in_savepoint(execution_log_id, [
+                execution_log_id, ActionType.EXTENDED,
+                emp_id, remarks, extended_date,
+            ], required=('assigned_by',))
+            info['extended_date'] = extended_date
+            results.append(info)
+            if info.get('success') == 1:
+                changed.append((execution_log_id, extended_date, remarks, info, row))
+
+    # ── Committed — now invalidate and notify ────────────────────
+    per_employee = {}
+    for execution_log_id, extended_date, remarks, info, row in changed:
+        assignee = info.get('emp_id') or row.get('emp_id')
+        _tasks_changed(
+            assigned_by=info['assigned_by'],
+            assignees=[assignee],
+            execution_log_id=execution_log_id,
+        )
+        if assignee:
+            per_employee.setdefault(assignee, []).append((
+                execution_log_id, row.get('task_title') or remarks, extended_date,
+            ))
+    if per_employee:
+        action_by_name = _display_name(emp_id, action_by_name)
+        for assignee, extensions in per_employee.items():
+            notify_bulk_extended(assignee, extensions, action_by_name)
+    return results
 
 
+def get_task_history(execution_log_id, columnar=False):
+    fetch = call_sp_columnar if columnar else call_sp
+    return fetch('sp_get_task_history', [execution_log_id])
+
+
+# ── Dashboard sections ───────────────────────────────────────────
+# section → (result-set index in sp_dashboard_counts, single row?)
+DASHBOARD_SECTIONS = {
+    "overall_counts":   (0, True),
+    "employee_summary": (1, False),
+    "status_chart":     (2, False),
+    "priority_chart":   (3, False),
+    "monthly_trend":    (4, False),
+}
+
+
+def _section_procedures():
+    """
+    section → SP that computes it.
+    Default: every section comes from sp_dashboard_counts (one call for all).
+    DASHBOARD_SECTION_PROCEDURES can point a section at its own SP taking
+    the same params (emp_id, view_type, date_from, date_to, employee_id).
+    Known gap: none are mapped by default (no per-section SP exists in
+    this repo), so ?sections= trims the payload and serialization only —
+    SQL Server still computes all five result sets.
+    """
+    overrides = getattr(settings, 'DASHBOARD_SECTION_PROCEDURES', {})
+    return {name: overrides.get(name, 'sp_dashboard_counts')
+            for name in DASHBOARD_SECTIONS}
+
 
-def get_employees(emp_id, search=None):
+def _load_dashboard_sections(params, sections):
+    """Run only the SPs needed for sections. Returns {section: value}."""
+    procedures = _section_procedures()
+    loaded = {}
+    for sp_name in dict.fromkeys(procedures[name] for name in sections):
+        if sp_name == 'sp_dashboard_counts':
+            results = call_sp_multiple_results(sp_name, params)
+            # Everything this SP returns comes for free — keep it all
+            for name, (index, _) in DASHBOARD_SECTIONS.items():
+                if procedures[name] == sp_name:
+                    loaded[name] = results[index] if len(results) > index and results[index] else []
+        else:
+            rows = call_sp(sp_name, params)
+            for name in sections:
+                if procedures[name] == sp_name:
+                    loaded[name] = rows
+    for name, value in loaded.items():
+        if DASHBOARD_SECTIONS[name][1]:
+            loaded[name] = value[0] if value else {}
+    return loaded
+
+
+def get_dashboard_counts(emp_id, view_type, date_from=None, date_to=None,
+                         employee_id=None, sections=None):
+    """
+    sections → names from DASHBOARD_SECTIONS (None = all).
+    One cache entry per (emp_id, view_type, filters) holds every section
+    loaded so far — a later request for another section reuses it, and
+    everything sp_dashboard_counts returned is kept from the first call.
+    """
+    sections = list(sections or DASHBOARD_SECTIONS)
+    key      = (emp_id, view_type, date_from, date_to, employee_id)
+    shared   = not is_process_local(getattr(settings, 'CHANGE_LOG_CACHE', 'default'))
+    cached   = {}
+    if shared:
+        # Version first: a write landing during the load makes it stale at once
+        version = change_log.version(emp_id, view_type)
+        entry   = dashboard_cache.get(key)
+        if entry is not None and entry[0] == version:
+            cached = entry[1]
+
+    missing = [name for name in sections if name not in cached]
+    if missing:
+        # New dict — other threads may be reading the cached one
+        cached = {**cached, **_load_dashboard_sections(list(key), missing)}
+        if shared:
+            dashboard_cache.set(key, (version, cached))
+
+    counts = {"view_type": view_type}
+    for name in sections:
+        counts[name] = cached[name]
+    return counts
+
+
+def get_affected_tasks(emp_id, view_type, columnar=False):
+    fetch = call_sp_columnar if columnar else call_sp
+    return fetch('sp_get_affected_tasks', [emp_id, view_type])
+
+
+
+def get_employees(emp_id, search=None, limit=None):
+    """
+    search → ranked top-N from the in-memory directory of active staff
+             (no LIKE query per keystroke).
+    No search → sp_get_employees, as before.
+    """
     if search:
-        return run_query(
-            """
-            SELECT
-                EMP_ID AS emp_id,
-                STF_FRNAME + ' ' + STF_LSNAME AS emp_name
-            FROM inout_aems..staffmst
-           WHERE
-                REP_STATUS = 1                             
-                AND (
-                    CAST(EMP_ID AS NVARCHAR(20)) LIKE %s
-                    OR STF_FRNAME + ' ' + STF_LSNAME LIKE %s
-                )
-            ORDER BY STF_FRNAME, STF_LSNAME
-            """,
-            [f'%{search}%', f'%{search}%']
-        )
-    return call_sp('sp_get_employees', [emp_id])
\ No newline at end of file
+        return employee_directory.search(search, limit)
+    return call_sp('sp_get_employees', [emp_id])
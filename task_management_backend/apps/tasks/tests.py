@@ -1,3 +1,579 @@
-from django.test import TestCase
+import json
+import random
+import tempfile
+import warnings
+from datetime import date
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APIClient
+
+import utils.db_helper as db_helper
+import utils.db_routing as db_routing
+from apps.authentication.token_auth import generate_token
+from benchmarks.fakes import FakeConnections, TASK_COLUMNS, task_rows
+from utils.pagination import decode_cursor, encode_cursor
+from utils.response_handler import StreamResponse
+from . import holiday_helper, importer, services
+from .change_log import change_log
+
+
+def fake_db(handler):
+    """db_helper → benchmarks.fakes for the block. handler(sql, params) → [(columns, rows), ...]"""
+    return mock.patch.object(db_helper, 'connections', FakeConnections(handler))
+
+
+class SharedChangeLogMixin:
+    """CHANGE_LOG_CACHE on a FileBasedCache — a cache other workers would see."""
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        shared = override_settings(
+            CACHES={
+                'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+                'shared':  {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                            'LOCATION': directory.name},
+            },
+            CHANGE_LOG_CACHE='shared',
+        )
+        shared.enable()
+        self.addCleanup(shared.disable)
+
+
+def _created(tasks, created_by, created_by_name=""):
+    """create_tasks_batch() stand-in: every task succeeds, ids from 100."""
+    return [{"success": 1, "message": "Task created", "task_id": 100 + i}
+            for i in range(len(tasks))]
+
+
+TIME_BOUND = {
+    "task_title": "Morning Meeting", "task_type": 5, "priority_type": 2,
+    "task_start_date": "2025-07-15", "start_time": "09:00",
+    "task_end_date": "2025-07-15", "end_time": "09:30", "emp_list": [25, 30],
+}
+
+
+def _ndjson(*records):
+    return [json.dumps(record) + "\n" for record in records]
+
+
+class ParseRowsTests(SimpleTestCase):
+
+    def test_csv_rows(self):
+        lines = [
+            "task_title,task_type,priority_type,task_start_date,task_end_date,emp_list\n",
+            " Fix Bug ,4,3,2025-07-15,2025-07-20,\"25,30\"\n",
+        ]
+        rows = list(importer.parse_rows(lines, 'csv'))
+        self.assertEqual(rows, [(1, {
+            "task_title": "Fix Bug", "task_type": "4", "priority_type": "3",
+            "task_start_date": "2025-07-15", "task_end_date": "2025-07-20",
+            "emp_list": "25,30",
+        })])
+
+    def test_ndjson_numbers_read_as_text(self):
+        (row_no, task_data), = importer.parse_rows(_ndjson(TIME_BOUND), 'ndjson')
+        self.assertEqual(row_no, 1)
+        self.assertEqual(task_data["task_type"], "5")
+        self.assertEqual(task_data["emp_list"], "25,30")
+
+    def test_ndjson_bad_lines(self):
+        lines = ["{not json\n", "\n", "[1, 2]\n"]
+        rows = list(importer.parse_rows(lines, 'ndjson'))
+        self.assertEqual([row_no for row_no, _ in rows], [1, 2])
+        self.assertTrue(rows[0][1].startswith("Invalid JSON"))
+        self.assertEqual(rows[1][1], "Each line must be a JSON object")
+
+
+@mock.patch.object(importer.services, 'create_tasks_batch', side_effect=_created)
+class ImportTasksTests(SimpleTestCase):
+
+    def _import(self, *records, batch_size=None):
+        rows = importer.parse_rows(_ndjson(*records), 'ndjson')
+        return list(importer.with_summary(
+            importer.import_tasks(rows, 380988, "Tester", batch_size=batch_size)))
+
+    def test_results_in_file_order(self, create_tasks_batch):
+        results = self._import(TIME_BOUND, {**TIME_BOUND, "emp_list": ""}, TIME_BOUND,
+                               batch_size=1)
+        self.assertEqual([(r["row"], r["success"]) for r in results[:-1]],
+                         [(1, 1), (2, 0), (3, 1)])
+        self.assertEqual(results[1]["message"], "emp_list is required")
+        self.assertEqual(results[-1], {"summary": {"total": 3, "created": 2, "failed": 1}})
+        self.assertEqual(create_tasks_batch.call_count, 2)
+
+    def test_non_string_title_is_a_row_error(self, create_tasks_batch):
+        results = self._import(TIME_BOUND, {**TIME_BOUND, "task_title": {"en": "x"}},
+                               TIME_BOUND)
+        self.assertEqual([r["success"] for r in results[:-1]], [1, 0, 1])
+        self.assertTrue(results[1]["message"].startswith("Invalid row"))
+        self.assertEqual(results[-1]["summary"]["created"], 2)
+
+    def test_mixed_time_types_are_a_row_error(self, create_tasks_batch):
+        results = self._import(TIME_BOUND, {**TIME_BOUND, "start_time": ["09:00"]})
+        self.assertEqual([r["success"] for r in results[:-1]], [1, 0])
+        self.assertTrue(results[1]["message"].startswith("Invalid row"))
+
+    def test_numeric_title_and_times_are_accepted(self, create_tasks_batch):
+        results = self._import({**TIME_BOUND, "task_title": 2025,
+                                "start_time": 900, "end_time": 930})
+        self.assertEqual(results[0]["success"], 1)
+        (tasks, *_), _ = create_tasks_batch.call_args
+        self.assertEqual(tasks[0]["task_title"], "2025")
+
+    def test_failed_batch_is_reported_and_the_next_one_runs(self, create_tasks_batch):
+        create_tasks_batch.side_effect = [RuntimeError("deadlock"), _created([1], 0)]
+        results = self._import(TIME_BOUND, TIME_BOUND, batch_size=1)
+        self.assertEqual([r["success"] for r in results[:-1]], [0, 1])
+        self.assertEqual(results[0]["message"], "Batch not imported: deadlock")
+        self.assertEqual(results[-1]["summary"], {"total": 2, "created": 1, "failed": 1})
+
+    def test_view_imports_everything_before_responding(self, create_tasks_batch):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION='Bearer ' + generate_token(380988, "Tester"))
+        upload = SimpleUploadedFile("tasks.ndjson", "".join(_ndjson(*[TIME_BOUND] * 5)).encode())
+        with self.settings(TASK_IMPORT_BATCH_SIZE=2):
+            response = client.post('/api/tasks/import/', {"file": upload})
+        # Nothing of the body read yet — every batch already ran
+        self.assertEqual(create_tasks_batch.call_count, 3)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(json.loads(lines[-1]), {"summary": {"total": 5, "created": 5, "failed": 0}})
+
+    def test_bad_task_type(self, create_tasks_batch):
+        results = self._import({**TIME_BOUND, "task_type": "x"})
+        self.assertEqual(results[0]["message"], "Invalid task_type: x")
+        create_tasks_batch.assert_not_called()
+
+
+class DashboardCacheTests(SharedChangeLogMixin, SimpleTestCase):
+
+    def setUp(self):
+        super().setUp()
+        services.dashboard_cache.clear()
+        self.addCleanup(services.dashboard_cache.clear)
+        self.calls = 0
+
+    def _dashboard(self, sql, params):
+        self.calls += 1
+        return [(['total'], [(self.calls,)])] + [(['name'], [])] * 4
+
+    def _total(self, emp_id=7):
+        with fake_db(self._dashboard):
+            return services.get_dashboard_counts(emp_id, 'SELF')["overall_counts"]["total"]
+
+    def test_sections_share_one_cached_call(self):
+        with fake_db(self._dashboard):
+            services.get_dashboard_counts(7, 'SELF', sections=['status_chart'])
+            services.get_dashboard_counts(7, 'SELF', sections=['overall_counts'])
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(services.dashboard_cache), 1)
+
+    def test_write_in_another_worker_reloads(self):
+        self.assertEqual(self._total(), 1)
+        # Another worker's write: recorded in the shared log, no local discard
+        change_log.record(assigned_by=1, assignees=[7])
+        self.assertEqual(self._total(), 2)
+        self.assertEqual(self._total(), 2)
+
+    def test_write_for_someone_else_keeps_the_entry(self):
+        self._total()
+        change_log.record(assigned_by=1, assignees=[8])
+        self.assertEqual(self._total(), 1)
+
+    def test_no_cache_with_a_per_process_change_log(self):
+        with override_settings(CHANGE_LOG_CACHE='default'):
+            self._total()
+            self._total()
+        self.assertEqual(self.calls, 2)
+
+
+class ChangeLogTests(SimpleTestCase):
+
+    def setUp(self):
+        change_log.cache.clear()
+        self.addCleanup(change_log.cache.clear)
+
+    def test_ids_are_stored_as_int(self):
+        seq = change_log.record(assigned_by="1", assignees=["7"],
+                                execution_log_id="602", task_id="90")
+        self.assertEqual(change_log.changes_since(seq - 1, 7, 'SELF'), ({602}, {90}, seq))
+        self.assertEqual(change_log.log_version("602"), change_log.log_version(602))
+
+    def test_only_own_view_is_reported(self):
+        seq = change_log.record(assigned_by=1, assignees=[7], execution_log_id=5)
+        self.assertEqual(change_log.changes_since(seq - 1, 8, 'SELF'), (set(), set(), seq))
+        self.assertEqual(change_log.changes_since(seq - 1, 1, 'ASSIGNED_BY_ME'), ({5}, set(), seq))
+
+    def test_gap_in_the_log_resets(self):
+        start = change_log.current_seq()
+        first = change_log.record(assignees=[7], execution_log_id=5)
+        change_log.record(assignees=[7], execution_log_id=6)
+        change_log.cache.delete(f'task_changes:e:{first}')     # evicted
+        self.assertIsNone(change_log.changes_since(start, 7, 'SELF'))
+
+    def test_write_in_flight_at_the_end_is_waited_for(self):
+        first = change_log.record(assignees=[7], execution_log_id=5)
+        change_log.cache.incr('task_changes:seq')               # incr done, set not yet
+        self.assertEqual(change_log.changes_since(first - 1, 7, 'SELF'), ({5}, set(), first))
+
+    def test_tokens(self):
+        token = change_log.token()
+        self.assertEqual(change_log.read_token(token)[0], change_log.current_seq())
+        self.assertIsNone(change_log.read_token("other." + token.split('.', 1)[1]))
+        self.assertIsNone(change_log.read_token("garbage"))
+        with override_settings(CHANGE_LOG_TTL_SECONDS=10):
+            self.assertIsNone(change_log.read_token(change_log.token(issued=1)))
+
+
+class TaskChangesViewTests(SimpleTestCase):
+
+    def setUp(self):
+        change_log.cache.clear()
+        self.addCleanup(change_log.cache.clear)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + generate_token(7, "Assignee"))
+
+    @staticmethod
+    def _db(sql, params):
+        if 'sp_update_task_status' in sql:
+            return [(['success', 'message', 'assigned_by', 'emp_id'],
+                     [(1, "Status updated", 1, 7)])]
+        if 'sp_fetch_task_list' in sql:
+            return [(['execution_log_id', 'task_id', 'task_title', 'emp_id', 'emp_name',
+                      'assigned_by', 'assigned_by_name'],
+                     [(602, 90, "Report", 7, "Assignee", 1, "Boss")])]
+        return []
+
+    def test_form_encoded_id_is_not_reported_removed(self):
+        with fake_db(self._db):
+            since = self.client.get('/api/tasks/changes/').json()["data"]["next_token"]
+            response = self.client.post('/api/tasks/update-status/',
+                                        {"execution_log_id": "602", "action_type": "2"})
+            self.assertEqual(response.status_code, 200)
+            data = self.client.get('/api/tasks/changes/', {"since": since}).json()["data"]
+        self.assertFalse(data["reset"])
+        self.assertEqual(data["removed"], [])
+        self.assertEqual([row["execution_log_id"] for row in data["tasks"]], [602])
+
+
+class TaskListETagTests(SimpleTestCase):
+
+    def setUp(self):
+        change_log.cache.clear()
+        self.addCleanup(change_log.cache.clear)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + generate_token(7, "Assignee"))
+        self.calls = []
+        bucket = mock.patch('apps.tasks.views._etag_bucket', return_value=0)
+        bucket.start()
+        self.addCleanup(bucket.stop)
+
+    def _db(self, sql, params):
+        self.calls.append(sql)
+        return [(TASK_COLUMNS, task_rows(3))]
+
+    def test_not_modified_until_a_write(self):
+        with fake_db(self._db):
+            first = self.client.get('/api/tasks/my-tasks/')
+            etag  = first['ETag']
+            again = self.client.get('/api/tasks/my-tasks/', HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(again.status_code, 304)
+            self.assertEqual(again['ETag'], etag)
+            self.assertEqual(len(self.calls), 1)        # the 304 never reached the DB
+
+            change_log.record(assigned_by=1, assignees=[7])
+            after = self.client.get('/api/tasks/my-tasks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after['ETag'], etag)
+
+    def test_etag_differs_per_query(self):
+        with fake_db(self._db):
+            etag     = self.client.get('/api/tasks/my-tasks/')['ETag']
+            filtered = self.client.get('/api/tasks/my-tasks/', {"status": "1"},
+                                       HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(filtered.status_code, 200)
+
+    def test_other_employees_writes_keep_the_etag(self):
+        with fake_db(self._db):
+            etag = self.client.get('/api/tasks/my-tasks/')['ETag']
+            change_log.record(assigned_by=1, assignees=[8])
+            again = self.client.get('/api/tasks/my-tasks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(again.status_code, 304)
+
+
+class StreamResponseTests(SimpleTestCase):
+
+    async def test_sync_iterator_streams_under_asgi(self):
+        pulled = []
+
+        def chunks():
+            for i in range(3):
+                pulled.append(i)
+                yield f"{i}\n"
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')      # "must consume synchronous iterators"
+            parts = StreamResponse(chunks()).__aiter__()
+            self.assertEqual(await parts.__anext__(), b"0\n")
+            self.assertEqual(pulled, [0])
+            self.assertEqual([part async for part in parts], [b"1\n", b"2\n"])
+
+    def test_export_streams_in_chunks(self):
+        rows = task_rows(450)
+        with fake_db(lambda sql, params: [(TASK_COLUMNS, rows)]):
+            client = APIClient()
+            client.credentials(HTTP_AUTHORIZATION='Bearer ' + generate_token(7, "Assignee"))
+            response = client.get('/api/tasks/export/', {"type": "csv"})
+            parts = list(response.streaming_content)
+        self.assertGreater(len(parts), 2)
+        self.assertEqual(b''.join(parts).count(b"\n"), len(rows) + 1)
+
+
+@override_settings(DB_READ_ALIAS='replica')
+class RoutingTests(SimpleTestCase):
+
+    def setUp(self):
+        caches['default'].clear()
+        self._request(actor=7)
+
+    def _request(self, actor):
+        """Start a fresh request running as actor (what the middleware + auth do)."""
+        token = db_routing._state.set(db_routing._RequestState())
+        self.addCleanup(db_routing._state.reset, token)
+        db_routing.set_actor(actor)
+
+    def test_reads_go_to_the_replica(self):
+        self.assertEqual(db_routing.route('sp_fetch_task_list'), 'replica')
+        self.assertEqual(db_routing.route('sp_fetch_task_list', using='default'), 'default')
+
+    def test_unknown_names_run_on_the_primary_without_sticking(self):
+        with fake_db(lambda sql, params: []):
+            db_helper.run_query("SELECT 1", label='sp_dashboard_status_chart')
+        self.assertEqual(db_routing.route('sp_dashboard_status_chart'), 'default')
+        self.assertEqual(db_routing.route('sp_fetch_task_list'), 'replica')
+        self._request(actor=7)
+        self.assertEqual(db_routing.route('sp_fetch_task_list'), 'replica')
+
+    def test_write_sticks_the_actor(self):
+        with fake_db(lambda sql, params: []):
+            db_helper.call_sp('sp_update_task_status', [602, 2, 7, '', None])
+        self.assertEqual(db_routing.route('sp_fetch_task_list'), 'default')
+        self._request(actor=7)
+        self.assertEqual(db_routing.route('sp_fetch_task_list'), 'default')
+        self._request(actor=8)
+        self.assertEqual(db_routing.route('sp_fetch_task_list'), 'replica')
+
+    def test_sticky_seconds_zero_never_sticks(self):
+        with override_settings(DB_STICKY_SECONDS=0):
+            db_routing.stick([7])
+        self._request(actor=7)
+        self.assertEqual(db_routing.route('sp_fetch_task_list'), 'replica')
+
+    def test_replica_needs_a_shared_sticky_cache(self):
+        with self.assertRaises(ImproperlyConfigured):
+            db_routing.DBRoutingMiddleware(lambda request: None)
+
+    @override_settings(DB_READ_ALIAS='default')
+    def test_no_replica_everything_on_the_primary(self):
+        self.assertEqual(db_routing.route('sp_fetch_task_list'), 'default')
+        db_routing.DBRoutingMiddleware(lambda request: None)
+
+
+class TaskPageTests(SimpleTestCase):
+
+    def _pages(self, rows, limit):
+        """Walk every page like a client would → [[execution_log_id, ...], ...]"""
+        pages, after = [], None
+        with fake_db(lambda sql, params: [(TASK_COLUMNS, rows)]):
+            while True:
+                page = services.get_task_page(7, 'SELF', limit=limit, after=after)
+                pages.append([row['execution_log_id'] for row in page["results"]])
+                if page["next_cursor"] is None:
+                    return pages
+                after = decode_cursor(page["next_cursor"])
+
+    def test_pages_cover_every_row_newest_first(self):
+        rows = task_rows(23)
+        random.Random(1).shuffle(rows)          # SP order does not matter
+        pages = self._pages(rows, limit=10)
+        self.assertEqual([len(page) for page in pages], [10, 10, 3])
+        ids = [i for page in pages for i in page]
+        self.assertEqual(ids, sorted((row[0] for row in rows), reverse=True))
+
+    def test_exact_multiple_has_no_empty_last_page(self):
+        self.assertEqual([len(page) for page in self._pages(task_rows(20), limit=10)], [10, 10])
+
+    def test_cursor_round_trip_and_tampering(self):
+        self.assertEqual(decode_cursor(encode_cursor(602)), 602)
+        with self.assertRaises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class WorkingDayCalendarTests(SimpleTestCase):
+    HOLIDAYS = {date(2025, 12, 31): "Year End", date(2026, 1, 1): "New Year",
+                date(2026, 1, 2): "New Year Bridge"}
+
+    def setUp(self):
+        self.loaded   = []
+        self.calendar = holiday_helper.WorkingDayCalendar(ttl_seconds=3600)
+        patcher = mock.patch.object(holiday_helper, 'holiday_calendar', self.calendar)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _db(self, sql, params):
+        start, end = params
+        self.loaded.append(start.year)
+        return [(['Holiday_Date', 'Holiday_Desc'],
+                 [(day, reason) for day, reason in sorted(self.HOLIDAYS.items())
+                  if start <= day < end])]
+
+    def test_shift_crosses_into_next_year(self):
+        with fake_db(self._db):
+            info = holiday_helper.get_shift_info("2025-12-31")
+        self.assertTrue(info["needs_shift"])
+        self.assertEqual(info["reason"], "Year End")
+        self.assertEqual(info["suggested_date"], "2026-01-03")
+        self.assertEqual(self.loaded, [2025, 2026])
+
+    def test_count_spans_both_years(self):
+        with fake_db(self._db):
+            # Dec 29 → Jan 5: 8 days, minus Dec 31, Jan 1, Jan 2 and Sunday Jan 4
+            counted = holiday_helper.count_working_days("2025-12-29", "2026-01-05")
+            info    = holiday_helper.get_range_info("2025-12-29", "2026-01-05")
+        self.assertEqual(counted["working_days"], 4)
+        self.assertEqual(info["working_days"], 4)
+        self.assertEqual(info["non_working_days"], [
+            {"date": "2025-12-31", "reason": "Year End"},
+            {"date": "2026-01-01", "reason": "New Year"},
+            {"date": "2026-01-02", "reason": "New Year Bridge"},
+            {"date": "2026-01-04", "reason": "Sunday"},
+        ])
+        self.assertEqual(sorted(self.loaded), [2025, 2026])   # one query per year
+
+    def test_invalidate_reloads_one_year(self):
+        with fake_db(self._db):
+            self.calendar.count_working_days(date(2025, 12, 29), date(2026, 1, 5))
+            self.calendar.invalidate(2026)
+            self.calendar.count_working_days(date(2025, 12, 29), date(2026, 1, 5))
+        self.assertEqual(sorted(self.loaded), [2025, 2026, 2026])
+
+
+class CheckDatesViewTests(SimpleTestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + generate_token(7, "Assignee"))
+
+    def _post(self, body):
+        with fake_db(lambda sql, params: [(['holiday_date', 'reason'], [])]):
+            return self.client.post('/api/tasks/check-dates/', body, format='json')
+
+    def test_malformed_bodies_are_400(self):
+        for body, message in [
+            ({"dates": "2025-07-06"},             "dates must be"),
+            ({"dates": [20250706]},               "dates must be"),
+            ({"pairs": "2025-07-01"},             "pairs must be"),
+            ({"pairs": [["2025-07-01"]]},         "pairs must be"),
+            ({"pairs": ["2025-07-01", "x"]},      "pairs must be"),
+            ({"pairs": {"a": 1}},                 "pairs must be"),
+            ({"start": 1, "end": 2},              "start and end must be"),
+            ({"start": "2025-07-01"},             "start and end must be given"),
+        ]:
+            with self.subTest(body=body):
+                response = self._post(body)
+                self.assertEqual(response.status_code, 400)
+                self.assertTrue(response.json()["message"].startswith(message),
+                                response.json()["message"])
+
+    def test_pairs_counted(self):
+        response = self._post({"pairs": [["2025-07-01", "2025-07-07"]]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["pairs"][0]["working_days"], 6)
+
+
+class MetricsViewTests(SimpleTestCase):
+
+    def _get(self, **extra):
+        return self.client.get('/metrics', **extra)
+
+    def test_local_scrape(self):
+        response = self._get(REMOTE_ADDR='127.0.0.1')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'task_db_calls_total', response.content)
+
+    def test_outside_the_networks(self):
+        self.assertEqual(self._get(REMOTE_ADDR='10.1.2.3').status_code, 404)
+
+    @override_settings(METRICS_ALLOWED_NETWORKS=['10.0.0.0/8'])
+    def test_network_setting(self):
+        self.assertEqual(self._get(REMOTE_ADDR='10.1.2.3').status_code, 200)
+
+    def test_proxied_request_needs_the_token(self):
+        self.assertEqual(self._get(REMOTE_ADDR='127.0.0.1',
+                                   HTTP_X_FORWARDED_FOR='203.0.113.9').status_code, 404)
+
+    @override_settings(METRICS_TOKEN='s3cret')
+    def test_token(self):
+        self.assertEqual(self._get(REMOTE_ADDR='127.0.0.1').status_code, 404)
+        self.assertEqual(self._get(REMOTE_ADDR='127.0.0.1',
+                                   HTTP_AUTHORIZATION='Bearer wrong').status_code, 404)
+        self.assertEqual(self._get(REMOTE_ADDR='127.0.0.1', HTTP_X_FORWARDED_FOR='203.0.113.9',
+                                   HTTP_AUTHORIZATION='Bearer s3cret').status_code, 200)
+
+
+class UpdateTaskStatusBulkTests(SimpleTestCase):
+    databases = {"default"}        # transaction.atomic() on the in-memory sqlite
+
+    @staticmethod
+    def _db(sql, params):
+        if 'sp_update_task_status' in sql:
+            if params[0] == 802:
+                raise RuntimeError("Task is closed")
+            return [(['success', 'message', 'assigned_by', 'emp_id'],
+                     [(1, "Status updated", 1, 7)])]
+        return []
+
+    def test_failing_item_does_not_sink_the_batch(self):
+        items = [{"execution_log_id": 801, "action_type": 2},
+                 {"execution_log_id": 802, "action_type": 2},
+                 {"execution_log_id": "x", "action_type": 2},
+                 {"execution_log_id": 803, "action_type": 2}]
+        with fake_db(self._db), \
+                mock.patch.object(services, '_tasks_changed') as changed, \
+                mock.patch.object(services, 'notify_bulk_status_changed') as notify:
+            results = services.update_task_status_bulk(items, action_by=7)
+        self.assertEqual([(r["execution_log_id"], r["success"]) for r in results],
+                         [(801, 1), (802, 0), ("x", 0), (803, 1)])
+        self.assertEqual(results[1]["message"], "Task is closed")
+        self.assertEqual([c.kwargs["execution_log_id"] for c in changed.call_args_list],
+                         [801, 803])
+        notify.assert_called_once()
+        self.assertEqual([change[0] for change in notify.call_args.args[1]], [801, 803])
+
+
+class ExtendTasksBulkTests(SimpleTestCase):
+    databases = {"default"}        # transaction.atomic() on the in-memory sqlite
+
+    @staticmethod
+    def _db(sql, params):
+        if 'sp_update_task_status' in sql:
+            assigned_by = None if params[0] == 702 else 1
+            return [(['success', 'message', 'assigned_by', 'emp_id'],
+                     [(1, "Extended", assigned_by, 7)])]
+        return []
+
+    def test_missing_assigned_by_is_not_guessed(self):
+        items = [{"execution_log_id": 701, "extended_date": "2026-01-05"},
+                 {"execution_log_id": 702, "extended_date": "2026-01-05"}]
+        with fake_db(self._db), \
+                mock.patch.object(services, '_tasks_changed') as changed, \
+                mock.patch.object(services, 'notify_bulk_extended'):
+            results = services.extend_tasks_bulk(9, 'MY_TASKS', items)
+        self.assertEqual([r["success"] for r in results], [1, 0])
+        self.assertIn("assigned_by", results[1]["message"])
+        changed.assert_called_once_with(assigned_by=1, assignees=[7], execution_log_id=701)
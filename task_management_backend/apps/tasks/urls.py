@@ -3,12 +3,18 @@ from . import views
 
 urlpatterns = [
     path('create/',              views.CreateTaskView.as_view()),
+    path('import/',              views.ImportTasksView.as_view()),
     path('my-tasks/',            views.MyTasksView.as_view()),
     path('assigned-by-me/',      views.AssignedByMeView.as_view()),
+    path('changes/',             views.TaskChangesView.as_view()),
+    path('export/',              views.TaskExportView.as_view()),
     path('update-status/',       views.UpdateTaskStatusView.as_view()),
+    path('update-status/bulk/',  views.BulkUpdateTaskStatusView.as_view()),
     path('extend/',              views.ExtendTaskView.as_view()),
+    path('extend/bulk/',         views.BulkExtendTaskView.as_view()),
     path('history/<int:execution_log_id>/', views.TaskHistoryView.as_view()),
     path('dashboard/',           views.DashboardView.as_view()),
     path('check-date/',          views.CheckDateView.as_view()),
+    path('check-dates/',         views.CheckDatesView.as_view()),
     path('affected-by-holiday/', views.AffectedByHolidayView.as_view()),
 ]
\ No newline at end of file
@@ -0,0 +1,68 @@
+# apps/tasks/validation.py
+"""
+Task Validation — rules shared by every way of creating a task
+───────────────────────────────────────────────────────────────
+CreateTaskView (one task) and the bulk importer (CSV / NDJSON rows)
+both call validate_task_data(), so a row is accepted by the import
+exactly when the same body would be accepted by POST /api/tasks/create/.
+"""
+
+from utils.constants import TaskType
+
+
+def validate_task_data(data):
+    """
+    Returns the error message for the first rule data breaks,
+    or None when it is valid. Raises ValueError if task_type is not a number.
+    """
+    task_type = int(data.get('task_type', 0))
+
+    # ── Validate required base fields ────────────────────
+    if not data.get('task_title', '').strip():
+        return "task_title is required"
+
+    if not data.get('task_start_date'):
+        return "task_start_date is required"
+
+    if not data.get('emp_list'):
+        return "emp_list is required"
+
+    # ── Task-type-aware validation ───────────────────────
+    if task_type == TaskType.TIME_BOUND:
+        # TIME_BOUND needs end date AND both times
+        if not data.get('task_end_date'):
+            return "task_end_date is required for Time Bound tasks"
+        if not data.get('start_time'):
+            return "start_time is required for Time Bound tasks"
+        if not data.get('end_time'):
+            return "end_time is required for Time Bound tasks"
+        # Time logic check: same day → end_time must be after start_time
+        if (data.get('task_start_date') == data.get('task_end_date') and
+                data.get('end_time') <= data.get('start_time')):
+            return "end_time must be after start_time on the same day"
+
+    elif task_type == TaskType.RANDOM:
+        # RANDOM: end_date optional, times not needed
+        # If no end_date given → SP will use start_date
+        pass
+
+    # ── FUTURE validations (not active yet) ─────────────
+    # elif task_type == TaskType.DAILY:
+    #     if not data.get('task_end_date'):
+    #         return "task_end_date required for Daily"
+
+    # elif task_type == TaskType.WEEKLY:
+    #     if not data.get('day_of_week'):
+    #         return "day_of_week required for Weekly"
+
+    # elif task_type == TaskType.MONTHLY:
+    #     if not data.get('task_end_date'):
+    #         return "task_end_date required for Monthly"
+
+    else:
+        # Unknown task type
+        return (f"Invalid task_type: {task_type}. "
+                f"Valid: 4 (Random), 5 (Time Bound)")
+    # ────────────────────────────────────────────────────
+
+    return None
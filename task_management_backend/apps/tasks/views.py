@@ -1,10 +1,41 @@
 # apps/tasks/views.py
 
+import codecs
+import hmac
+import ipaddress
+import time
+from datetime import date
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
-from utils.response_handler import success_response, error_response
-from utils.constants import TaskType
-from . import services
-from .holiday_helper import get_shift_info
+from utils.response_handler import (
+    success_response,
+    error_response,
+    columnar_response,
+    streaming_success_response,
+    ndjson_response,
+    csv_response,
+)
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+from utils.renderers import is_columnar, FirstRendererNegotiation
+from utils.conditional import etag_guard, make_etag
+from utils.metrics import db_metrics, render_samples
+from utils.pagination import decode_cursor, parse_limit
+from . import importer, services
+from .validation import validate_task_data
+from .change_log import change_log
+from .notifications import dispatcher
+from .read_model import read_model
+from apps.authentication.token_auth import token_cache
+from .holiday_helper import (
+    get_shift_info,
+    get_shift_info_many,
+    count_working_days,
+    get_range_info,
+)
 
 
 class CreateTaskView(APIView):
@@ -36,61 +67,10 @@ class CreateTaskView(APIView):
     """
     def post(self, request):
         try:
-            data      = request.data
-            task_type = int(data.get('task_type', 0))
-
-            # ── Validate required base fields ────────────────────
-            if not data.get('task_title', '').strip():
-                return error_response("task_title is required")
-
-            if not data.get('task_start_date'):
-                return error_response("task_start_date is required")
-
-            if not data.get('emp_list'):
-                return error_response("emp_list is required")
-
-            # ── Task-type-aware validation ───────────────────────
-            if task_type == TaskType.TIME_BOUND:
-                # TIME_BOUND needs end date AND both times
-                if not data.get('task_end_date'):
-                    return error_response(
-                        "task_end_date is required for Time Bound tasks")
-                if not data.get('start_time'):
-                    return error_response(
-                        "start_time is required for Time Bound tasks")
-                if not data.get('end_time'):
-                    return error_response(
-                        "end_time is required for Time Bound tasks")
-                # Time logic check: same day → end_time must be after start_time
-                if (data.get('task_start_date') == data.get('task_end_date') and
-                        data.get('end_time') <= data.get('start_time')):
-                    return error_response(
-                        "end_time must be after start_time on the same day")
-
-            elif task_type == TaskType.RANDOM:
-                # RANDOM: end_date optional, times not needed
-                # If no end_date given → SP will use start_date
-                pass
-
-            # ── FUTURE validations (not active yet) ─────────────
-            # elif task_type == TaskType.DAILY:
-            #     if not data.get('task_end_date'):
-            #         return error_response("task_end_date required for Daily")
-
-            # elif task_type == TaskType.WEEKLY:
-            #     if not data.get('day_of_week'):
-            #         return error_response("day_of_week required for Weekly")
-
-            # elif task_type == TaskType.MONTHLY:
-            #     if not data.get('task_end_date'):
-            #         return error_response("task_end_date required for Monthly")
-
-            else:
-                # Unknown task type
-                return error_response(
-                    f"Invalid task_type: {task_type}. "
-                    f"Valid: 4 (Random), 5 (Time Bound)")
-            # ────────────────────────────────────────────────────
+            data  = request.data
+            error = validate_task_data(data)
+            if error:
+                return error_response(error)
 
             result = services.create_task(
                 task_data       = data,
@@ -105,48 +85,238 @@ class CreateTaskView(APIView):
             return error_response(message=str(e))
 
 
+class ImportTasksView(APIView):
+    """
+    POST /api/tasks/import/   (multipart)
+
+        file      → .csv / .ndjson / .jsonl   (see apps/tasks/importer.py)
+        file_type → csv | ndjson   (only needed when the name does not tell)
+
+    Every row is checked like POST /api/tasks/create/ and created by the
+    current user, in batches. The whole file is imported before the
+    response starts (a dropped connection cannot cut it short); the
+    report is then streamed as NDJSON, one line per row, then a summary:
+
+        {"row": 1, "success": 1, "message": "...", "task_id": 123}
+        {"row": 2, "success": 0, "message": "emp_list is required", "task_id": 0}
+        {"summary": {"total": 2, "created": 1, "failed": 1}}
+    """
+    def post(self, request):
+        try:
+            upload = request.FILES.get('file')
+            if not upload:
+                return error_response("file required")
+            file_type = (request.data.get('file_type')
+                         or importer.file_type_for(upload.name))
+            if file_type not in importer.FILE_TYPES:
+                return error_response("file_type must be csv or ndjson")
+
+            lines = codecs.iterdecode(upload, 'utf-8-sig')
+            rows  = importer.parse_rows(lines, file_type)
+            return ndjson_response(importer.run_to_end(importer.with_summary(
+                importer.import_tasks(rows, request.user.emp_id, request.user.emp_name))))
+        except Exception as e:
+            return error_response(message=str(e))
+
+
+# ── ETags ────────────────────────────────────────────────────────
+# Built from the change-log version of what the response depends on,
+# plus a time bucket and the full query string (filters, format, paging).
+# The change log only sees writes made through this API (and, with the
+# default LocMemCache, only those made in this worker); the bucket rolls
+# every ETag over each TASK_ETAG_SECONDS, so a write made elsewhere — or
+# a TIME_BOUND task going overdue — is never hidden behind 304s longer.
+
+def _etag_bucket():
+    return int(time.time() // getattr(settings, 'TASK_ETAG_SECONDS', 60))
+
+
+def _view_etag(view_type):
+    def etag_func(request, *args, **kwargs):
+        if view_type is None:   # dashboard: view comes from the query
+            current = request.query_params.get('view', 'SELF')
+            current = current if current in ['SELF', 'ASSIGNED_BY_ME'] else 'SELF'
+        else:
+            current = view_type
+        return make_etag(
+            request.path,
+            request.user.emp_id,
+            change_log.version(request.user.emp_id, current),
+            date.today(),
+            _etag_bucket(),
+            request.META.get('QUERY_STRING', ''),
+        )
+    return etag_func
+
+
+def _history_etag(request, execution_log_id):
+    return make_etag(
+        request.path,
+        change_log.log_version(execution_log_id),
+        _etag_bucket(),
+        request.META.get('QUERY_STRING', ''),
+    )
+
+
+def parse_task_filters(query_params, keys):
+    """
+    Read list filters from the query string.
+    Numeric keys become int. Returns None when no filter is set.
+    """
+    filters = {}
+    for key in keys:
+        filters[key] = query_params.get(key)
+    for key in ['status', 'priority', 'task_type', 'employee_id']:
+        if filters.get(key):
+            filters[key] = int(filters[key])
+    has_filters = any(v is not None for v in filters.values())
+    return filters if has_filters else None
+
+
+def task_list_response(request, view_type, filter_keys):
+    """
+    Shared GET body of MyTasksView / AssignedByMeView.
+    ?stream=1        → rows are streamed from the cursor in chunks
+                       instead of being built into one list first.
+    ?limit=&cursor=  → keyset page: {"results", "limit", "next_cursor"}.
+                       Pass next_cursor back as cursor for the next page.
+                       Smaller payloads; the SP still reads the full list.
+    ?format=columnar → {"columns": [...], "rows": [[...], ...]}
+
+    Every response carries X-Changes-Token — taken BEFORE the query,
+    so /changes/?since=<it> never misses a write made during the read.
+    """
+    token    = change_log.token()
+    response = _task_list_body(request, view_type, filter_keys)
+    response['X-Changes-Token'] = token
+    return response
+
+
+def _task_list_body(request, view_type, filter_keys):
+    params  = request.query_params
+    filters = parse_task_filters(params, filter_keys)
+    if 'limit' in params or 'cursor' in params:
+        cursor = params.get('cursor')
+        return success_response(data=services.get_task_page(
+            request.user.emp_id, view_type, filters,
+            limit=parse_limit(params.get('limit')),
+            after=int(decode_cursor(cursor)) if cursor else None,
+        ))
+    if params.get('stream') in ('1', 'true'):
+        return streaming_success_response(
+            services.iter_tasks(request.user.emp_id, view_type, filters))
+    if is_columnar(request):
+        return columnar_response(services.get_tasks(
+            request.user.emp_id, view_type, filters, columnar=True))
+    result = services.get_tasks(request.user.emp_id, view_type, filters)
+    return success_response(data=result)
+
+
 class MyTasksView(APIView):
-    """GET /api/tasks/my-tasks/"""
+    """GET /api/tasks/my-tasks/   (?limit=&cursor= to page, ?stream=1 to stream)"""
+    FILTER_KEYS = [
+        'status', 'priority', 'task_type',
+        'date_from', 'date_to',
+        'overdue_only', 'extended_only', 'search',
+    ]
+
+    @etag_guard(_view_etag('SELF'))
     def get(self, request):
         try:
-            filters = {}
-            for key in [
-                'status', 'priority', 'task_type',
-                'date_from', 'date_to',
-                'overdue_only', 'extended_only', 'search',
-            ]:
-                filters[key] = request.query_params.get(key)
-            for key in ['status', 'priority', 'task_type']:
-                if filters.get(key):
-                    filters[key] = int(filters[key])
-            has_filters = any(v is not None for v in filters.values())
-            result = services.get_tasks(
-                request.user.emp_id, 'SELF',
-                filters if has_filters else None,
-            )
-            return success_response(data=result)
+            return task_list_response(request, 'SELF', self.FILTER_KEYS)
         except Exception as e:
             return error_response(message=str(e))
 
 
 class AssignedByMeView(APIView):
-    """GET /api/tasks/assigned-by-me/"""
+    """GET /api/tasks/assigned-by-me/   (?limit=&cursor= to page, ?stream=1 to stream)"""
+    FILTER_KEYS = [
+        'status', 'priority', 'task_type',
+        'employee_id', 'date_from', 'date_to',
+        'overdue_only', 'extended_only', 'search',
+    ]
+
+    @etag_guard(_view_etag('ASSIGNED_BY_ME'))
     def get(self, request):
         try:
-            filters = {}
-            for key in [
-                'status', 'priority', 'task_type',
-                'employee_id', 'date_from', 'date_to',
-                'overdue_only', 'extended_only', 'search',
-            ]:
-                filters[key] = request.query_params.get(key)
-            for key in ['status', 'priority', 'task_type', 'employee_id']:
-                if filters.get(key):
-                    filters[key] = int(filters[key])
-            has_filters = any(v is not None for v in filters.values())
-            result = services.get_tasks(
-                request.user.emp_id, 'ASSIGNED_BY_ME',
-                filters if has_filters else None,
+            return task_list_response(
+                request, 'ASSIGNED_BY_ME', self.FILTER_KEYS)
+        except Exception as e:
+            return error_response(message=str(e))
+
+
+class TaskExportView(APIView):
+    """
+    GET /api/tasks/export/?view=SELF|ASSIGNED_BY_ME&type=csv|ndjson
+        &include_history=1   (optional)
+        + the same filters as my-tasks / assigned-by-me
+
+    Streamed as a download straight from the cursor (fetchmany batches).
+    ?format= is still read when ?type= is absent (older clients); DRF's
+    own ?format= handling is switched off here so the view validates it.
+    Errors are always JSON.
+
+    include_history → each task also carries its sp_get_task_history
+    rows ("history": a list in NDJSON, a JSON string column in CSV).
+    That is one SP call per exported task (the SP takes one
+    execution_log_id) — N tasks cost N+1 round trips, so keep the
+    filters narrow for large lists.
+    """
+    renderer_classes = [JSONRenderer]
+    content_negotiation_class = FirstRendererNegotiation
+
+    def get(self, request):
+        try:
+            params    = request.query_params
+            view_type = params.get('view', 'SELF')
+            if view_type not in ['SELF', 'ASSIGNED_BY_ME']:
+                view_type = 'SELF'
+            export_format = params.get('type') or params.get('format') or 'csv'
+            if export_format not in ['csv', 'ndjson']:
+                return error_response("type must be csv or ndjson")
+            keys = (AssignedByMeView.FILTER_KEYS if view_type == 'ASSIGNED_BY_ME'
+                    else MyTasksView.FILTER_KEYS)
+            include_history = params.get('include_history') in ('1', 'true')
+
+            rows = services.iter_task_export(
+                request.user.emp_id, view_type,
+                parse_task_filters(params, keys),
+                include_history=include_history,
+            )
+            filename = f"tasks_{view_type.lower()}_{date.today()}.{export_format}"
+            if export_format == 'ndjson':
+                return ndjson_response(rows, filename)
+            if include_history:
+                rows = _history_as_json(rows)
+            return csv_response(rows, filename)
+        except Exception as e:
+            return error_response(message=str(e))
+
+
+def _history_as_json(rows):
+    encoder = JSONEncoder()
+    for row in rows:
+        row['history'] = encoder.encode(row['history'])
+        yield row
+
+
+class TaskChangesView(APIView):
+    """
+    GET /api/tasks/changes/?view=SELF|ASSIGNED_BY_ME&since=<token>
+
+    Delta sync. since = X-Changes-Token of the last full list load,
+    or next_token of the previous /changes/ call.
+    {"reset": false, "tasks": [...changed rows...], "removed": [ids], "next_token": "..."}
+    reset=true → reload the full list, then continue from next_token.
+    """
+    def get(self, request):
+        try:
+            view_type = request.query_params.get('view', 'SELF')
+            if view_type not in ['SELF', 'ASSIGNED_BY_ME']:
+                view_type = 'SELF'
+            result = services.get_task_changes(
+                request.user.emp_id, view_type,
+                request.query_params.get('since') or None,
             )
             return success_response(data=result)
         except Exception as e:
@@ -174,6 +344,49 @@ class UpdateTaskStatusView(APIView):
             return error_response(message=str(e))
 
 
+class BulkUpdateTaskStatusView(APIView):
+    """
+    POST /api/tasks/update-status/bulk/
+
+    {
+        "items": [
+            {"execution_log_id": 101, "action_type": 3, "remarks": "OK"},
+            {"execution_log_id": 102, "action_type": 4, "remarks": "Redo"}
+        ]
+    }
+
+    One transaction; a failing item does not undo the others.
+    Response data: {"results": [{"execution_log_id", "success", "message"}, ...],
+                    "updated": n, "failed": n}
+    """
+    MAX_ITEMS = 200
+
+    def post(self, request):
+        try:
+            items = request.data.get('items')
+            if not items or not isinstance(items, list):
+                return error_response("items required")
+            if len(items) > self.MAX_ITEMS:
+                return error_response(
+                    f"At most {self.MAX_ITEMS} items per request")
+            if not all(isinstance(item, dict) for item in items):
+                return error_response("each item must be an object")
+
+            results = services.update_task_status_bulk(
+                items,
+                request.user.emp_id,
+                request.user.emp_name,
+            )
+            updated = sum(1 for r in results if r.get('success') == 1)
+            return success_response(data={
+                "results": results,
+                "updated": updated,
+                "failed":  len(results) - updated,
+            }, message=f"{updated} of {len(results)} updated")
+        except Exception as e:
+            return error_response(message=str(e))
+
+
 class ExtendTaskView(APIView):
     """POST /api/tasks/extend/"""
     def post(self, request):
@@ -195,10 +408,62 @@ class ExtendTaskView(APIView):
             return error_response(message=str(e))
 
 
+class BulkExtendTaskView(APIView):
+    """
+    POST /api/tasks/extend/bulk/
+
+    Every holiday-affected task of a view, each to its next working day:
+        {"view": "ASSIGNED_BY_ME", "all": true}
+
+    Or an explicit list (extended_date optional → next working day):
+        {"view": "ASSIGNED_BY_ME",
+         "items": [{"execution_log_id": 101},
+                   {"execution_log_id": 102, "extended_date": "2025-07-16", "remarks": "..."}]}
+
+    Response data: {"results": [{"execution_log_id", "success", "message",
+                                 "extended_date"}, ...], "extended": n, "failed": n}
+    """
+    MAX_ITEMS = 200
+
+    def post(self, request):
+        try:
+            data      = request.data
+            view_type = data.get('view', 'ASSIGNED_BY_ME')
+            if view_type not in ['SELF', 'ASSIGNED_BY_ME']:
+                view_type = 'ASSIGNED_BY_ME'
+            items = data.get('items')
+            if data.get('all'):
+                items = None
+            elif not items or not isinstance(items, list):
+                return error_response("items or all=true required")
+            elif not all(isinstance(item, dict) for item in items):
+                return error_response("each item must be an object")
+            if items is not None and len(items) > self.MAX_ITEMS:
+                return error_response(
+                    f"At most {self.MAX_ITEMS} items per request")
+
+            results = services.extend_tasks_bulk(
+                request.user.emp_id, view_type, items,
+                request.user.emp_name,
+            )
+            extended = sum(1 for r in results if r.get('success') == 1)
+            return success_response(data={
+                "results":  results,
+                "extended": extended,
+                "failed":   len(results) - extended,
+            }, message=f"{extended} of {len(results)} extended")
+        except Exception as e:
+            return error_response(message=str(e))
+
+
 class TaskHistoryView(APIView):
-    """GET /api/tasks/history/<id>/"""
+    """GET /api/tasks/history/<id>/   (?format=columnar supported)"""
+    @etag_guard(_history_etag)
     def get(self, request, execution_log_id):
         try:
+            if is_columnar(request):
+                return columnar_response(services.get_task_history(
+                    execution_log_id, columnar=True))
             return success_response(
                 data=services.get_task_history(execution_log_id))
         except Exception as e:
@@ -206,7 +471,16 @@ class TaskHistoryView(APIView):
 
 
 class DashboardView(APIView):
-    """GET /api/tasks/dashboard/?view=SELF|ASSIGNED_BY_ME&date_from=&date_to=&employee_id="""
+    """
+    GET /api/tasks/dashboard/?view=SELF|ASSIGNED_BY_ME&date_from=&date_to=&employee_id=
+
+    &sections=overall_counts,status_chart → only those sections are
+    returned. Omit for all five. Known gap: that trims the response only.
+    A section is computed on its own just when DASHBOARD_SECTION_PROCEDURES
+    maps it to an SP (none by default); the rest share one
+    sp_dashboard_counts call that computes all five.
+    """
+    @etag_guard(_view_etag(None))
     def get(self, request):
         try:
             view_type = request.query_params.get('view', 'SELF')
@@ -219,9 +493,19 @@ class DashboardView(APIView):
             if employee_id:
                 employee_id = int(employee_id)
 
+            sections = request.query_params.get('sections') or None
+            if sections:
+                sections = [s.strip() for s in sections.split(',') if s.strip()]
+                unknown  = set(sections) - set(services.DASHBOARD_SECTIONS)
+                if unknown:
+                    return error_response(
+                        f"Unknown sections: {', '.join(sorted(unknown))}. "
+                        f"Valid: {', '.join(services.DASHBOARD_SECTIONS)}")
+
             result = services.get_dashboard_counts(
                 request.user.emp_id, view_type,
                 date_from, date_to, employee_id,
+                sections=sections,
             )
             return success_response(data=result)
         except Exception as e:
@@ -240,15 +524,138 @@ class CheckDateView(APIView):
             return error_response(message=str(e))
 
 
+class CheckDatesView(APIView):
+    """
+    POST /api/tasks/check-dates/
+
+    Batch version of check-date. Every key is optional:
+    {
+        "dates": ["2025-07-06", "2025-07-07"],        ← shift info per date
+        "pairs": [["2025-07-01", "2025-07-15"]],      ← working days per pair
+        "start": "2025-07-01", "end": "2025-07-31"    ← range summary
+    }
+
+    Response data:
+    {
+        "dates": [<same shape as check-date>, ...],
+        "pairs": [{"start", "end", "working_days"}, ...],
+        "range": {"start", "end", "total_days", "working_days",
+                  "non_working_days": [{"date", "reason"}, ...]}
+    }
+    Working-day counts include both start and end.
+    """
+    MAX_ITEMS      = 500
+    MAX_RANGE_DAYS = 3 * 366
+
+    def post(self, request):
+        try:
+            data  = request.data
+            dates = data.get('dates') or []
+            pairs = data.get('pairs') or []
+            start = data.get('start')
+            end   = data.get('end')
+
+            if not (dates or pairs or start or end):
+                return error_response("dates, pairs or start/end required")
+            if (not isinstance(dates, list)
+                    or not all(isinstance(d, str) for d in dates)):
+                return error_response("dates must be a list of YYYY-MM-DD strings")
+            if (not isinstance(pairs, list)
+                    or not all(isinstance(pair, list) and len(pair) == 2
+                               and all(isinstance(d, str) for d in pair)
+                               for pair in pairs)):
+                return error_response("pairs must be a list of [start, end] date strings")
+            if len(dates) + len(pairs) > self.MAX_ITEMS:
+                return error_response(
+                    f"At most {self.MAX_ITEMS} dates and pairs per request")
+            if bool(start) != bool(end):
+                return error_response("start and end must be given together")
+            if start and not (isinstance(start, str) and isinstance(end, str)):
+                return error_response("start and end must be YYYY-MM-DD strings")
+
+            result = {}
+            if dates:
+                result['dates'] = get_shift_info_many(dates)
+            if pairs:
+                result['pairs'] = [
+                    count_working_days(a, b, self.MAX_RANGE_DAYS)
+                    for a, b in pairs
+                ]
+            if start:
+                result['range'] = get_range_info(
+                    start, end, self.MAX_RANGE_DAYS)
+            return success_response(data=result)
+        except Exception as e:
+            return error_response(message=str(e))
+
+
 class AffectedByHolidayView(APIView):
-    """GET /api/tasks/affected-by-holiday/?view=ASSIGNED_BY_ME"""
+    """GET /api/tasks/affected-by-holiday/?view=ASSIGNED_BY_ME   (?format=columnar supported)"""
     def get(self, request):
         try:
             view_type = request.query_params.get('view', 'ASSIGNED_BY_ME')
             if view_type not in ['SELF', 'ASSIGNED_BY_ME']:
                 view_type = 'ASSIGNED_BY_ME'
+            if is_columnar(request):
+                return columnar_response(services.get_affected_tasks(
+                    request.user.emp_id, view_type, columnar=True))
             result = services.get_affected_tasks(
                 request.user.emp_id, view_type)
             return success_response(data=result)
         except Exception as e:
-            return error_response(message=str(e))
\ No newline at end of file
+            return error_response(message=str(e))
+
+
+def _metrics_allowed(request):
+    """
+    REMOTE_ADDR inside METRICS_ALLOWED_NETWORKS, and:
+      METRICS_TOKEN set → "Authorization: Bearer <METRICS_TOKEN>" as well
+      no token          → the request must not have come through a proxy
+                          (X-Forwarded-For / Forwarded) — behind one,
+                          REMOTE_ADDR is the proxy's, e.g. 127.0.0.1
+    """
+    try:
+        address = ipaddress.ip_address(request.META.get('REMOTE_ADDR', ''))
+    except ValueError:
+        return False
+    networks = getattr(settings, 'METRICS_ALLOWED_NETWORKS', ['127.0.0.1/32', '::1/128'])
+    if not any(address in ipaddress.ip_network(net, strict=False) for net in networks):
+        return False
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token:
+        return hmac.compare_digest(request.headers.get('Authorization', ''),
+                                   f'Bearer {token}')
+    return not ('HTTP_X_FORWARDED_FOR' in request.META or 'HTTP_FORWARDED' in request.META)
+
+
+class MetricsView(APIView):
+    """
+    GET /metrics   — Prometheus text format. Internal: 404 unless
+    _metrics_allowed() (METRICS_ALLOWED_NETWORKS, optional METRICS_TOKEN).
+
+    Per SP / query label: calls, errors, rows, latency histogram.
+    Also: notification dispatcher counters, in-process cache hits/misses.
+    """
+    authentication_classes = []
+    permission_classes     = [AllowAny]
+
+    def get(self, request):
+        if not _metrics_allowed(request):
+            raise Http404
+        body = db_metrics.render_prometheus()
+        body += render_samples(
+            'task_notifications', 'Notification dispatcher counters',
+            'gauge', 'event', dispatcher.stats())
+        caches = {'dashboard': services.dashboard_cache,
+                  'token': token_cache,
+                  'read_model': read_model.snapshots}
+        body += render_samples(
+            'task_cache_hits_total', 'In-process cache hits',
+            'counter', 'cache', {name: c.hits for name, c in caches.items()})
+        body += render_samples(
+            'task_cache_misses_total', 'In-process cache misses',
+            'counter', 'cache', {name: c.misses for name, c in caches.items()})
+        body += render_samples(
+            'task_read_model_fallbacks_total', 'Task lists sent to the SP (unindexed filter)',
+            'counter', 'cache', {'read_model': read_model.fallbacks})
+        return HttpResponse(body, content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,23 @@
+"""
+Backend Microbenchmarks — no SQL Server needed
+──────────────────────────────────────────────
+    python -m benchmarks                         → run all, print table
+    python -m benchmarks --json out.json         → also save results
+    python -m benchmarks --compare base.json     → ratio vs a saved run;
+                                                   exit 1 on regression
+    python -m benchmarks -k db_ --quick          → subset, fewer repeats
+
+Run from task_management_backend/. Uses benchmarks.settings (SQLite,
+in-memory channel layer); db_helper talks to benchmarks.fakes.FakeConnection.
+
+Suites (one module each, a benchmarks() generator of (name, func)):
+  bench_db        → call_sp / iter_sp / call_sp_columnar at 1k/10k/100k rows
+  bench_render    → success_response JSON rendering, streamed envelope
+  bench_auth      → StandaloneTokenAuthentication, token cache off / on
+  bench_holidays  → get_shift_info around holiday clusters
+  bench_filters   → parse_task_filters (MyTasksView / AssignedByMeView)
+
+Numbers: best of --repeat runs (GC off, loop count calibrated so one
+run takes ≥ --min-time), in µs per call. Best-of is the most stable
+run-to-run figure; the median is reported alongside it.
+"""
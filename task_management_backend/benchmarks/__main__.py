@@ -0,0 +1,45 @@
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+
+import django  # noqa: E402
+django.setup()
+
+from benchmarks import (  # noqa: E402
+    bench_auth, bench_db, bench_filters, bench_holidays, bench_render, runner,
+)
+
+SUITES = [bench_db, bench_render, bench_auth, bench_holidays, bench_filters]
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('-k', dest='pattern', help="Only benchmarks whose name contains this")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="Seconds per timed run (default 0.2)")
+    parser.add_argument('--quick', action='store_true',
+                        help="Skip the largest sizes, 3 repeats")
+    parser.add_argument('--json', help="Save results to this file")
+    parser.add_argument('--compare', help="Baseline JSON from an earlier --json run")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Ratio change reported as regression (default 0.10)")
+    args = parser.parse_args()
+
+    repeat = 3 if args.quick else args.repeat
+    runner.header()
+    results = runner.run(SUITES, args.pattern, repeat, args.min_time, args.quick)
+    if args.json:
+        runner.save(results, args.json)
+    if args.compare:
+        regressions = runner.compare(results, args.compare, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""StandaloneTokenAuthentication.authenticate — same token every call."""
+
+from django.test import RequestFactory
+
+from apps.authentication import token_auth
+from utils.cache import TTLCache
+
+
+def benchmarks(quick=False):
+    token   = token_auth.generate_token(380988, 'Ritesh Pachlore')
+    request = RequestFactory().get('/api/tasks/my-tasks/',
+                                   HTTP_AUTHORIZATION=f'Bearer {token}')
+    auth    = token_auth.StandaloneTokenAuthentication()
+    enabled = token_auth.token_cache
+    disabled = TTLCache(max_entries=0, ttl_seconds=0)
+
+    def uncached():
+        token_auth.token_cache = disabled
+        try:
+            return auth.authenticate(request)
+        finally:
+            token_auth.token_cache = enabled
+
+    def cached():
+        return auth.authenticate(request)
+
+    def no_header(request=RequestFactory().get('/api/tasks/my-tasks/')):
+        return auth.authenticate(request)
+
+    enabled.clear()
+    yield "auth_token_uncached", uncached
+    yield "auth_token_cached", cached
+    yield "auth_no_header", no_header
@@ -0,0 +1,33 @@
+"""db_helper: cursor rows → dicts / tuples, at 1k / 10k / 100k rows."""
+
+from benchmarks import fakes
+from utils import db_helper
+
+SIZES       = (1000, 10000, 100000)
+QUICK_SIZES = (1000, 10000)
+
+
+def benchmarks(quick=False):
+    for size in (QUICK_SIZES if quick else SIZES):
+        rows = fakes.task_rows(size)
+        result_set = [(fakes.TASK_COLUMNS, rows)]
+
+        def handler(sql, params, result_set=result_set):
+            return result_set
+
+        def call_sp(handler=handler):
+            fakes.install(handler)
+            return db_helper.call_sp('sp_fetch_task_list', [1, 'SELF'])
+
+        def iter_sp(handler=handler):
+            fakes.install(handler)
+            for _ in db_helper.iter_sp('sp_fetch_task_list', [1, 'SELF']):
+                pass
+
+        def columnar(handler=handler):
+            fakes.install(handler)
+            return db_helper.call_sp_columnar('sp_fetch_task_list', [1, 'SELF'])
+
+        yield f"db_call_sp_{size // 1000}k", call_sp
+        yield f"db_iter_sp_{size // 1000}k", iter_sp
+        yield f"db_call_sp_columnar_{size // 1000}k", columnar
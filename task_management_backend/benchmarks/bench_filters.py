@@ -0,0 +1,19 @@
+"""parse_task_filters — the query-string parsing of MyTasksView / AssignedByMeView."""
+
+from django.http import QueryDict
+
+from apps.tasks.views import AssignedByMeView, MyTasksView, parse_task_filters
+
+
+def benchmarks(quick=False):
+    empty = QueryDict('')
+    typical = QueryDict('status=1&priority=3&date_from=2025-07-01&date_to=2025-07-31')
+    full = QueryDict(
+        'status=2&priority=1&task_type=5&employee_id=380988'
+        '&date_from=2025-07-01&date_to=2025-07-31'
+        '&overdue_only=1&extended_only=1&search=meeting')
+
+    yield "filters_none", lambda: parse_task_filters(empty, MyTasksView.FILTER_KEYS)
+    yield "filters_typical", lambda: parse_task_filters(typical, MyTasksView.FILTER_KEYS)
+    yield "filters_all_assigned_by_me", lambda: parse_task_filters(
+        full, AssignedByMeView.FILTER_KEYS)
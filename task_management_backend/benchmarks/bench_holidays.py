@@ -0,0 +1,55 @@
+"""
+holiday_helper.get_shift_info around holiday clusters.
+
+The calendar is loaded once from a fake holiday_master (Diwali-style
+runs of 5–9 consecutive holidays, plus scattered single days), then
+every lookup is answered from memory — what a warm worker does.
+"""
+
+import datetime
+
+from benchmarks import fakes
+from apps.tasks.holiday_helper import (
+    get_shift_info,
+    get_shift_info_many,
+    holiday_calendar,
+)
+
+YEAR = 2025
+
+# (first day, length) — consecutive holidays
+CLUSTERS = [((1, 13), 5), ((3, 10), 6), ((8, 11), 7), ((10, 18), 9), ((12, 22), 8)]
+SINGLES  = [(1, 26), (4, 14), (5, 1), (8, 15), (10, 2)]
+
+
+def _holidays():
+    days = []
+    for (month, day), length in CLUSTERS:
+        first = datetime.date(YEAR, month, day)
+        days += [(first + datetime.timedelta(days=i), "Festival") for i in range(length)]
+    days += [(datetime.date(YEAR, month, day), "Holiday") for month, day in SINGLES]
+    return days
+
+
+def _handler(sql, params):
+    if 'holiday_master' in sql:
+        start, end = params
+        rows = [(d, desc) for d, desc in _holidays() if start <= d < end]
+        return [(['Holiday_Date', 'Holiday_Desc'], rows)]
+    return []
+
+
+def benchmarks(quick=False):
+    fakes.install(_handler)
+    holiday_calendar.invalidate()
+
+    cluster_start = datetime.date(YEAR, 10, 18)     # 9-day run → longest shift
+    working_day   = datetime.date(YEAR, 7, 1)
+    year_of_dates = [str(datetime.date(YEAR, 1, 1) + datetime.timedelta(days=i))
+                     for i in range(365)]
+    get_shift_info(cluster_start)                   # load the year
+
+    yield "holiday_shift_in_cluster", lambda: get_shift_info(cluster_start)
+    yield "holiday_shift_working_day", lambda: get_shift_info(working_day)
+    yield "holiday_shift_iso_string", lambda: get_shift_info("2025-10-20")
+    yield "holiday_shift_many_365", lambda: get_shift_info_many(year_of_dates)
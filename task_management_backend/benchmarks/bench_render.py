@@ -0,0 +1,35 @@
+"""response_handler: rendering task lists to JSON bytes."""
+
+from rest_framework.renderers import JSONRenderer
+
+from benchmarks import fakes
+from utils.response_handler import (
+    _stream_envelope,
+    columnar_response,
+    success_response,
+)
+
+SIZES       = (1000, 10000)
+QUICK_SIZES = (1000,)
+
+
+def benchmarks(quick=False):
+    renderer = JSONRenderer()
+    for size in (QUICK_SIZES if quick else SIZES):
+        rows  = fakes.task_rows(size)
+        dicts = [dict(zip(fakes.TASK_COLUMNS, row)) for row in rows]
+        label = f"{size // 1000}k"
+
+        def render_dicts(dicts=dicts):
+            return renderer.render(success_response(data=dicts).data)
+
+        def render_columnar(rows=rows):
+            response = columnar_response({"columns": fakes.TASK_COLUMNS, "rows": rows})
+            return renderer.render(response.data)
+
+        def render_stream(dicts=dicts):
+            return ''.join(_stream_envelope(iter(dicts), "Success"))
+
+        yield f"render_json_{label}", render_dicts
+        yield f"render_columnar_{label}", render_columnar
+        yield f"render_stream_{label}", render_stream
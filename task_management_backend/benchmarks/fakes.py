@@ -0,0 +1,111 @@
+"""
+Fake DB-API connection for db_helper
+────────────────────────────────────
+    install(handler) → db_helper uses a FakeConnection (for every alias) from now on
+    handler(sql, params) → [(columns, rows), ...]   one entry per result set
+
+Rows are plain tuples, as pyodbc returns them (close enough for timing
+the Python side: dict building, batching, encoding).
+"""
+
+import datetime
+import random
+
+import utils.db_helper as db_helper
+
+
+class FakeCursor:
+
+    def __init__(self, handler):
+        self.handler     = handler
+        self.description = None
+        self._sets       = []
+        self._rows       = []
+        self._pos        = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        pass
+
+    def execute(self, sql, params=None):
+        self._sets = list(self.handler(sql, params or []))
+        self._next()
+
+    def _next(self):
+        if self._sets:
+            columns, self._rows = self._sets.pop(0)
+            self.description = [(col,) for col in columns] if columns else None
+        else:
+            self.description, self._rows = None, []
+        self._pos = 0
+
+    def fetchall(self):
+        rows = self._rows[self._pos:] if self._pos else self._rows
+        self._pos = len(self._rows)
+        return rows
+
+    def fetchmany(self, size):
+        rows = self._rows[self._pos:self._pos + size]
+        self._pos += len(rows)
+        return rows
+
+    def nextset(self):
+        if not self._sets:
+            return None
+        self._next()
+        return True
+
+
+class FakeConnection:
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def cursor(self):
+        return FakeCursor(self.handler)
+
+
+class FakeConnections:
+    """Stands in for django.db.connections — every alias gets the same fake."""
+
+    def __init__(self, handler):
+        self.connection = FakeConnection(handler)
+
+    def __getitem__(self, alias):
+        return self.connection
+
+
+def install(handler):
+    db_helper.connections = FakeConnections(handler)
+
+
+# ── Canned data ──────────────────────────────────────────────────
+TASK_COLUMNS = [
+    'execution_log_id', 'task_id', 'task_title', 'task_description',
+    'task_type', 'priority_type', 'status', 'emp_id', 'emp_name',
+    'assigned_by', 'assigned_by_name', 'task_start_date', 'task_end_date',
+    'is_overdue', 'extended_count',
+]
+
+
+def task_rows(count, seed=42):
+    """count sp_fetch_task_list-shaped rows. Same seed → same rows."""
+    rng  = random.Random(seed)
+    base = datetime.datetime(2025, 1, 1, 9, 0)
+    rows = []
+    for i in range(count):
+        start = base + datetime.timedelta(days=rng.randrange(365))
+        rows.append((
+            count - i, 10000 + i, f"Task {i}", "Quarterly checklist item",
+            rng.choice((4, 5)), rng.randint(1, 3), rng.randint(0, 7),
+            rng.randrange(100, 600), "Ritesh Pachlore",
+            380988, "Amit Kumar", start,
+            start + datetime.timedelta(days=rng.randrange(1, 30)),
+            rng.random() < 0.2, rng.randrange(3),
+        ))
+    return rows
@@ -0,0 +1,81 @@
+"""Timing, reporting and comparing benchmark runs."""
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+
+def measure(func, repeat, min_time):
+    """→ {"best_us", "median_us", "loops"} per call of func."""
+    timer = timeit.Timer(func)
+    loops = 1
+    while True:
+        if timer.timeit(loops) >= min_time / 5:
+            break
+        loops *= 2
+    # Scale so one run takes about min_time
+    elapsed = timer.timeit(loops)
+    loops = max(1, int(loops * min_time / max(elapsed, 1e-9)))
+
+    gc.collect()
+    runs = [t / loops for t in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        "best_us":   min(runs) * 1e6,
+        "median_us": statistics.median(runs) * 1e6,
+        "loops":     loops,
+    }
+
+
+def run(suites, pattern=None, repeat=5, min_time=0.2, quick=False, out=sys.stdout):
+    results = {}
+    for suite in suites:
+        for name, func in suite.benchmarks(quick=quick):
+            if pattern and pattern not in name:
+                continue
+            results[name] = measure(func, repeat, min_time)
+            r = results[name]
+            out.write(f"{name:<44}{r['best_us']:>14.2f}{r['median_us']:>14.2f}\n")
+            out.flush()
+    return results
+
+
+def header(out=sys.stdout):
+    out.write(f"{'benchmark':<44}{'best µs':>14}{'median µs':>14}\n")
+
+
+def save(results, path):
+    with open(path, 'w') as f:
+        json.dump({
+            "meta": {
+                "python":   sys.version.split()[0],
+                "platform": platform.platform(),
+                "time":     time.strftime('%Y-%m-%dT%H:%M:%S'),
+            },
+            "results": results,
+        }, f, indent=2, sort_keys=True)
+
+
+def compare(results, baseline_path, threshold, out=sys.stdout):
+    """Print new/old ratios. Returns the names that got slower than threshold."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+    out.write(f"\n{'benchmark':<44}{'base µs':>12}{'now µs':>12}{'ratio':>9}\n")
+    regressions = []
+    for name, r in results.items():
+        old = baseline.get(name)
+        if old is None:
+            out.write(f"{name:<44}{'—':>12}{r['best_us']:>12.2f}{'new':>9}\n")
+            continue
+        ratio = r['best_us'] / old['best_us']
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  SLOWER'
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = '  faster'
+        out.write(f"{name:<44}{old['best_us']:>12.2f}{r['best_us']:>12.2f}{ratio:>9.2f}{flag}\n")
+    return regressions
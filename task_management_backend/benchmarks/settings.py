@@ -0,0 +1,16 @@
+"""Django settings for the benchmarks — the real ones, minus SQL Server."""
+
+import os
+
+os.environ.setdefault('CHANNEL_LAYER', 'memory')
+
+from config.settings import *  # noqa: E402,F401,F403
+
+# Never connected to — db_helper is pointed at benchmarks.fakes
+DATABASES = {
+    'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'},
+}
+
+PROFILING_ENABLED = False
+DB_SLOW_CALL_MS = 0             # No slow-call warnings for fake calls
+NOTIFICATIONS_ASYNC = False
@@ -3,20 +3,27 @@ ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+  http      → regular Django app (same views as WSGI)
+  websocket → ws/tasks/?token=<jwt> → TaskUpdatesConsumer
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
 
-# import os
-
-# from django.core.asgi import get_asgi_application
-
-# os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+import os
 
-# application = get_asgi_application()
+from django.core.asgi import get_asgi_application
 
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
+# Must run before anything that imports models / app code
+django_asgi_app = get_asgi_application()
 
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+from apps.authentication.ws_auth import JWTAuthMiddleware   # noqa: E402
+from apps.tasks.routing import websocket_urlpatterns        # noqa: E402
 
-from django.urls import path, include
-urlpatterns = [path('api/tasks/', include('apps.tasks.urls'))]
\ No newline at end of file
+application = ProtocolTypeRouter({
+    'http':      django_asgi_app,
+    'websocket': JWTAuthMiddleware(URLRouter(websocket_urlpatterns)),
+})
@@ -7,6 +7,7 @@ Django Settings — STANDALONE MODE
 • No Django models (all data through stored procedures)
 """
 
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -31,6 +32,7 @@ INSTALLED_APPS = [
      'django.contrib.sessions',
     'rest_framework',          # Django REST Framework
     'corsheaders',             # CORS for React
+    'channels',                # WebSocket (ws/tasks/)
     'apps.authentication',     # Our auth app
     'apps.tasks',              # Our tasks app
 ]
@@ -42,6 +44,8 @@ INSTALLED_APPS = [
 # ════════════════════════════════════════
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',    # Must be first
+    'utils.profiling.ProfilingMiddleware',      # Only when PROFILING_ENABLED
+    'utils.db_routing.DBRoutingMiddleware',     # Per-request read/write routing state
     'django.middleware.common.CommonMiddleware',
 ]
 
@@ -52,6 +56,7 @@ MIDDLEWARE = [
 # ════════════════════════════════════════
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
+CORS_EXPOSE_HEADERS = ['X-Changes-Token', 'ETag', 'Server-Timing']
 
 
 # ════════════════════════════════════════
@@ -73,6 +78,72 @@ DATABASES = {
 }
 
 
+# Optional read replica (e.g. an Always On readable secondary).
+# DB_REPLICA_HOST set → read-only SPs go there (see DB ROUTING below)
+if os.environ.get('DB_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.environ['DB_REPLICA_HOST'],
+        'PORT': os.environ.get('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'OPTIONS': {
+            **DATABASES['default']['OPTIONS'],
+            'extra_params': 'ApplicationIntent=ReadOnly',
+        },
+    }
+
+# Rows pulled per fetchmany() by db_helper.iter_sp / iter_query
+DB_FETCH_BATCH_SIZE = 500
+
+
+# ════════════════════════════════════════
+# DB READ/WRITE ROUTING (utils/db_routing.py)
+# Read-only SPs / run_query labels → DB_READ_ALIAS, everything else →
+# 'default'. After a write (DB_WRITES), the employees it touched read
+# from 'default' for DB_STICKY_SECONDS (covers replica lag). Names in
+# neither set run on 'default' without making anyone sticky.
+# With a replica, DB_STICKY_CACHE must be shared (Redis, see CACHES) —
+# the server refuses to start on a per-process LocMemCache.
+# ════════════════════════════════════════
+DB_READ_ALIAS = 'replica' if 'replica' in DATABASES else 'default'
+DB_READ_ONLY = {
+    'sp_fetch_task_list', 'sp_dashboard_counts', 'sp_get_task_history',
+    'sp_get_affected_tasks', 'sp_get_employees',
+    'staffmst_directory', 'staffmst_lookup', 'holiday_master',
+}
+DB_WRITES = {'sp_create_task', 'sp_update_task_status'}
+DB_STICKY_SECONDS = 5
+DB_STICKY_CACHE = 'default'         # Alias in CACHES — must be shared when a replica is set
+
+
+# ════════════════════════════════════════
+# DB METRICS (GET /metrics, Prometheus text)
+# Per SP: calls, errors, rows, latency histogram — per process
+# ════════════════════════════════════════
+DB_METRICS_ENABLED = True
+DB_SLOW_CALL_MS = 500               # Log a warning for calls at least this slow (0 = off)
+DB_METRICS_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+METRICS_ALLOWED_NETWORKS = ['127.0.0.1/32', '::1/128']  # ⚠️ CHANGE: your Prometheus host / subnet
+# Set → /metrics also needs "Authorization: Bearer <token>". Required behind
+# a reverse proxy: without it, proxied requests (X-Forwarded-For) get 404.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+
+# ════════════════════════════════════════
+# CACHE
+# Holds the task change log (delta sync).
+# LocMemCache = per process. With several workers, point this at
+# Redis so all workers share one log:
+#   'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+#   'LOCATION': 'redis://127.0.0.1:6379/1',
+# ════════════════════════════════════════
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    }
+}
+
+
 # ════════════════════════════════════════
 # REST FRAMEWORK
 # Every API requires JWT token (except login)
@@ -84,6 +155,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'rest_framework.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+        'utils.renderers.ColumnarJSONRenderer',     # ?format=columnar
+    ],
 }
 
 
@@ -94,6 +170,132 @@ REST_FRAMEWORK = {
 JWT_SECRET_KEY = "standalone-task-mgmt-secret-key-2025"
 JWT_EXPIRATION_HOURS = 24    # Token valid for 24 hours
 
+# Verified tokens, per process — skips jwt.decode on repeat requests
+TOKEN_CACHE_SIZE = 10000            # 0 → verify every request
+TOKEN_CACHE_TTL_SECONDS = 900       # Re-verify at least this often (key rotation)
+
+
+# ════════════════════════════════════════
+# PROFILING (utils/profiling.py)
+# Server-Timing header on every response + cProfile dumps.
+# PROFILING=1 env var to turn on.
+# ════════════════════════════════════════
+PROFILING_ENABLED = os.environ.get('PROFILING') == '1'
+PROFILING_ALLOWED_EMP_IDS = []      # May send "X-Profile: 1" → cProfile dump of that request
+PROFILING_SAMPLE_RATE = 0.0         # Fraction of requests profiled automatically...
+PROFILING_SLOW_MS = 1000            # ...and dumped only when at least this slow
+PROFILING_DIR = BASE_DIR / 'profiles'
+
+
+# ════════════════════════════════════════
+# HOLIDAY CALENDAR
+# holiday_master is cached in-process, one year at a time
+# ════════════════════════════════════════
+HOLIDAY_CACHE_TTL_SECONDS = 3600    # Reload a cached year after 1 hour
+
+
+# ════════════════════════════════════════
+# DASHBOARD CACHE
+# sp_dashboard_counts results, per process.
+# Dropped on create / status update / extend for the affected employees,
+# and reloaded when their change-log version moved (writes in any worker).
+# Only active with a shared CHANGE_LOG_CACHE (Redis, see CACHES) — with
+# the per-process LocMemCache every request runs the SP.
+# ════════════════════════════════════════
+DASHBOARD_CACHE_TTL_SECONDS = 300
+DASHBOARD_CACHE_MAX_ENTRIES = 1000
+
+# Optional: compute a section with its own SP instead of sp_dashboard_counts.
+# Same params: (emp_id, view_type, date_from, date_to, employee_id)
+# e.g. {'status_chart': 'sp_dashboard_status_chart'}
+# KNOWN GAP: no per-section SPs ship with this repo (the SQL lives in the
+# database), so with the empty default ?sections= only trims the
+# response — SQL Server still computes all five sections in the one
+# sp_dashboard_counts call. Map a section here once its SP exists.
+DASHBOARD_SECTION_PROCEDURES = {}
+
+
+# ════════════════════════════════════════
+# TASK LIST READ MODEL (apps/tasks/read_model.py)
+# my-tasks / assigned-by-me served from in-memory snapshots of
+# sp_fetch_task_list, per process. Date / search / extended_only
+# filters still go to the SP; dashboard counts and affected-by-holiday
+# are out of scope and always run on SQL Server.
+# Needs a shared CHANGE_LOG_CACHE (Redis, see CACHES) — with the
+# per-process LocMemCache this setting is ignored with a warning.
+# ════════════════════════════════════════
+READ_MODEL_ENABLED = os.environ.get('READ_MODEL') == '1'
+READ_MODEL_TTL_SECONDS = 300        # Reconcile with SQL Server after 5 min
+READ_MODEL_MAX_SNAPSHOTS = 1000     # (emp_id, view_type) lists kept
+
+
+# ════════════════════════════════════════
+# BULK IMPORT / EXPORT
+# POST /api/tasks/import/, manage.py import_tasks, GET /api/tasks/export/
+# ════════════════════════════════════════
+TASK_IMPORT_BATCH_SIZE = 100        # Tasks per transaction
+
+# GET /api/tasks/export/?include_history=1 spools the task list first
+# (then one sp_get_task_history call per task);
+# beyond this size the spool moves to a temp file on disk
+EXPORT_SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+
+
+# ════════════════════════════════════════
+# CHANGE LOG (GET /api/tasks/changes/)
+# ════════════════════════════════════════
+CHANGE_LOG_CACHE = 'default'        # Alias in CACHES
+CHANGE_LOG_TTL_SECONDS = 86400      # Entries kept 1 day; tokens valid half that
+CHANGE_LOG_MAX_SCAN = 5000          # More changes than this since a token → reset
+CHANGE_LOG_PIN_SECONDS = 300        # Version of a key with no recorded change is re-read after this
+TASK_ETAG_SECONDS = 60              # Task list / dashboard / history ETags roll over at least this often
+
+# ETag of /api/auth/employees/ (staffmst has no change version)
+EMPLOYEE_LIST_ETAG_SECONDS = 300
+
+
+# ════════════════════════════════════════
+# EMPLOYEE DIRECTORY
+# Active staffmst rows in memory for ?search= and name lookups
+# ════════════════════════════════════════
+EMPLOYEE_DIRECTORY_TTL_SECONDS = 600    # Reload from staffmst every 10 min
+EMPLOYEE_SEARCH_LIMIT = 50              # Default top-N for search
+EMPLOYEE_LOOKUP_CACHE_SIZE = 5000       # Inactive / unknown IDs remembered
+
+
+# ════════════════════════════════════════
+# WEBSOCKET (Channels)
+# CHANNEL_LAYER env var:
+#   redis  → default, needed when running more than one process
+#   memory → single process / local runs / tests, no Redis needed
+# ════════════════════════════════════════
+ASGI_APPLICATION = 'config.asgi.application'
+CHANNEL_LAYER = os.environ.get('CHANNEL_LAYER', 'redis')
+
+if CHANNEL_LAYER == 'memory':
+    CHANNEL_LAYERS = {
+        'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'},
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {"hosts": [('127.0.0.1', 6379)]},   # ⚠️ CHANGE: your Redis
+        },
+    }
+
+
+# ════════════════════════════════════════
+# NOTIFICATIONS
+# Sent by a background dispatcher — requests only enqueue
+# ════════════════════════════════════════
+# False → send inline (old behaviour). The in-memory layer only works
+# on the server's own event loop, so it always sends inline.
+NOTIFICATIONS_ASYNC = CHANNEL_LAYER != 'memory'
+NOTIFICATION_QUEUE_SIZE = 10000     # Beyond this, new notifications are dropped
+NOTIFICATION_BATCH_SIZE = 100       # group_sends in flight together
+NOTIFICATION_RETRY_SECONDS = 30     # Pause after a batch fails completely
+
 
 # ════════════════════════════════════════
 # OTHER SETTINGS
@@ -24,8 +24,11 @@ Including another URLconf
 
 
 from django.urls import path, include
+from apps.tasks.views import MetricsView
+
 urlpatterns = [path('api/tasks/', include('apps.tasks.urls')),
-               path('api/auth/', include('apps.authentication.urls'))
+               path('api/auth/', include('apps.authentication.urls')),
+               path('metrics', MetricsView.as_view()),     # internal, see METRICS_ALLOWED_NETWORKS / METRICS_TOKEN
 ]
 
 
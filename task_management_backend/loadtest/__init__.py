@@ -0,0 +1,28 @@
+"""
+End-to-end Load Test — the frontend's traffic mix over real HTTP
+────────────────────────────────────────────────────────────────
+    python -m loadtest                              → 20 users, 30 s, 1 worker × 8 threads
+    python -m loadtest --users 50 --workers 4 --threads 4 --duration 60
+    python -m loadtest --think-ms 2000 --ramp 10    → open-ish loop, realistic pacing
+    python -m loadtest --mix create=30,status=30    → reweight pages
+    python -m loadtest --json run.json              → also save the report
+
+Run from task_management_backend/. The Django app runs unchanged
+(loadtest.settings = the real settings minus SQL Server) in --workers
+server processes on one port; db_helper talks to loadtest.sqlite_backend,
+a SQLite file with the same stored procedures and result columns.
+The client is stdlib only, in this process: one thread per virtual user,
+each looping over the pages described in loadtest.traffic.
+
+Report: per endpoint — count, errors, req/s, p50 / p95 / p99 / max ms.
+
+Sizing workers: keep --users and --think-ms at the expected peak, then
+raise --workers / --threads until p95 stops improving. SQLite is not
+SQL Server — absolute DB times differ; the Python side (auth, caches,
+serialization, notifications) and the request mix are the real thing.
+
+Against gunicorn (or any server) instead of the built-in one:
+    python -m loadtest --init-db /tmp/lt.sqlite3
+    LOADTEST_DB=/tmp/lt.sqlite3 gunicorn -w 4 --threads 8 loadtest.wsgi
+    python -m loadtest --target http://127.0.0.1:8000 --db /tmp/lt.sqlite3
+"""
@@ -0,0 +1,126 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loadtest import report, traffic  # noqa: E402
+from loadtest.sqlite_backend import SQLiteBackend  # noqa: E402
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_mix(text):
+    """'dashboard=30,status=20' → mix dict (pages not named keep their default)."""
+    mix = dict(traffic.DEFAULT_MIX)
+    for part in filter(None, (text or '').split(',')):
+        name, _, weight = part.partition('=')
+        if name not in mix:
+            raise SystemExit(f"Unknown page '{name}' — one of {', '.join(mix)}")
+        mix[name] = float(weight)
+    return mix
+
+
+def start_workers(db_path, port, workers, threads):
+    """Start the server processes; returns them once every one is listening."""
+    env = dict(os.environ, PYTHONPATH=BACKEND_DIR + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    procs = []
+    for _ in range(workers):
+        procs.append(subprocess.Popen(
+            [sys.executable, '-m', 'loadtest.server', '--db', db_path,
+             '--port', str(port), '--threads', str(threads), '--reuse-port'],
+            cwd=BACKEND_DIR, env=env, stdout=subprocess.PIPE, text=True))
+    for proc in procs:
+        line = proc.stdout.readline()
+        if not line.startswith('ready'):
+            stop_workers(procs)
+            raise SystemExit("A server process failed to start")
+    return procs
+
+
+def stop_workers(procs):
+    for proc in procs:
+        proc.terminate()
+    for proc in procs:
+        proc.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m loadtest')
+    parser.add_argument('--users', type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument('--duration', type=float, default=30, help="Seconds after ramp-up")
+    parser.add_argument('--ramp', type=float, default=0, help="Seconds to start all users over")
+    parser.add_argument('--think-ms', type=float, default=0,
+                        help="Mean pause between page visits (0 = closed loop, max load)")
+    parser.add_argument('--mix', help="Page weights, e.g. dashboard=40,create=5")
+    parser.add_argument('--workers', type=int, default=1, help="Server processes")
+    parser.add_argument('--threads', type=int, default=8, help="Request threads per process")
+    parser.add_argument('--port', type=int, default=8100)
+    parser.add_argument('--employees', type=int, default=500)
+    parser.add_argument('--tasks', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--db', help="Existing database (required with --target)")
+    parser.add_argument('--init-db', metavar='PATH', help="Only create the database at PATH")
+    parser.add_argument('--target', help="Base URL of an already running server")
+    parser.add_argument('--json', help="Save the report to this file")
+    args = parser.parse_args()
+
+    if args.init_db:
+        SQLiteBackend.create(args.employees, args.tasks, args.seed, path=args.init_db)
+        print(f"Created {args.init_db}: {args.employees} employees, {args.tasks} tasks")
+        return
+    if args.target and not args.db:
+        parser.error("--target needs --db (the database that server uses)")
+
+    db_path, created = args.db, False
+    if db_path is None:
+        db_path = os.path.join(tempfile.mkdtemp(prefix='loadtest_'), 'tasks.sqlite3')
+        SQLiteBackend.create(args.employees, args.tasks, args.seed, path=db_path)
+        created = True
+    backend = SQLiteBackend(db_path)
+    emp_ids = backend.sample_emp_ids(args.users, seed=args.seed)
+    backend.close()
+
+    procs = []
+    base_url = args.target
+    if base_url is None:
+        procs = start_workers(db_path, args.port, args.workers, args.threads)
+        base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        print(f"{len(emp_ids)} users → {base_url} for {args.duration:g} s ...", flush=True)
+        samples, elapsed, logged_in = traffic.run_users(
+            base_url, emp_ids, args.duration, args.think_ms / 1000,
+            parse_mix(args.mix), args.seed, args.ramp)
+    finally:
+        stop_workers(procs)
+        if created:
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(db_path + suffix):
+                    os.remove(db_path + suffix)
+            os.rmdir(os.path.dirname(db_path))
+
+    if logged_in < len(emp_ids):
+        print(f"{len(emp_ids) - logged_in} user(s) could not get a token")
+    config = {
+        "users":    len(emp_ids),
+        "workers":  args.workers if not args.target else None,
+        "threads":  args.threads if not args.target else None,
+        "target":   base_url,
+        "duration": args.duration,
+        "ramp":     args.ramp,
+        "think_ms": args.think_ms,
+        "elapsed":  elapsed,
+        "mix":      parse_mix(args.mix),
+        "employees": args.employees,
+        "tasks":    args.tasks,
+    }
+    summary = report.summarize(samples, elapsed)
+    report.print_table(summary, config)
+    if args.json:
+        report.save(summary, config, args.json)
+
+
+if __name__ == '__main__':
+    main()
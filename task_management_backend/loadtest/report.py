@@ -0,0 +1,71 @@
+"""Percentiles, throughput and the printed / JSON report of a load-test run."""
+
+import json
+import math
+import platform
+import time
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples, elapsed):
+    """Samples → {label: {"count", "errors", "rps", "p50_ms", "p95_ms", "p99_ms", "max_ms"}}"""
+    summary = {}
+    everything = []
+    for label, values in samples.latencies.items():
+        values = sorted(values)
+        everything.extend(values)
+        summary[label] = _row(values, samples.errors.get(label, 0), elapsed)
+    everything.sort()
+    summary['TOTAL'] = _row(everything, sum(samples.errors.values()), elapsed)
+    return summary
+
+
+def _row(values, errors, elapsed):
+    return {
+        "count":  len(values),
+        "errors": errors,
+        "rps":    len(values) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "max_ms": (values[-1] if values else 0.0) * 1000,
+    }
+
+
+def print_table(summary, config):
+    server = (f"{config['workers']} worker(s) × {config['threads']} thread(s)"
+              if config['workers'] else config['target'])
+    print(f"\n{config['users']} users, {server}, {config['elapsed']:.1f} s"
+          f"{'' if config['think_ms'] else ', no think time'}\n")
+    print(f"{'endpoint':34} {'count':>7} {'err':>5} {'req/s':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    rows = sorted((item for item in summary.items() if item[0] != 'TOTAL'),
+                  key=lambda item: -item[1]['count'])
+    rows.append(('TOTAL', summary['TOTAL']))
+    for label, row in rows:
+        if label == 'TOTAL':
+            print("-" * 92)
+        print(f"{label:34} {row['count']:>7} {row['errors']:>5} {row['rps']:>8.1f} "
+              f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} "
+              f"{row['max_ms']:>8.1f}")
+
+
+def save(summary, config, path):
+    with open(path, 'w') as f:
+        json.dump({
+            "meta": {
+                "python":   platform.python_version(),
+                "machine":  platform.machine(),
+                "saved":    time.strftime('%Y-%m-%dT%H:%M:%S'),
+                **config,
+            },
+            "endpoints": summary,
+        }, f, indent=2)
+    print(f"\nSaved {path}")
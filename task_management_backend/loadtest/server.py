@@ -0,0 +1,92 @@
+"""
+Load-test server — the Django app over HTTP on the SQLite stand-in
+──────────────────────────────────────────────────────────────────
+    python -m loadtest.server --db /tmp/lt.sqlite3 --port 8100 --threads 8
+
+One process, a fixed pool of --threads request threads (like one
+gunicorn worker with --threads). `python -m loadtest --workers N` starts
+N of these on the same port (SO_REUSEPORT), all on one database file.
+Prints "ready <port>" once it accepts connections.
+"""
+
+import argparse
+import os
+import socket
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'loadtest.settings')
+
+
+class _QuietHandler(WSGIRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PooledWSGIServer(WSGIServer):
+    """wsgiref server handing each connection to a fixed thread pool."""
+    request_queue_size = 256
+    allow_reuse_address = True
+
+    def __init__(self, address, threads, reuse_port=False):
+        self.reuse_port = reuse_port
+        self.pool = ThreadPoolExecutor(threads, thread_name_prefix='loadtest')
+        super().__init__(address, _QuietHandler)
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+def application(db_path):
+    """Django WSGI app with db_helper on the SQLite file at db_path."""
+    from django.core.wsgi import get_wsgi_application
+    app = get_wsgi_application()
+
+    from benchmarks import fakes
+    from loadtest.sqlite_backend import SQLiteBackend
+    fakes.install(SQLiteBackend(db_path).handle)
+    return app
+
+
+def serve(db_path, host='127.0.0.1', port=8100, threads=8, reuse_port=False):
+    server = PooledWSGIServer((host, port), threads, reuse_port)
+    server.set_app(application(db_path))
+    print(f"ready {server.server_port}", flush=True)
+    try:
+        server.serve_forever()
+    finally:
+        server.pool.shutdown(wait=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m loadtest.server')
+    parser.add_argument('--db', required=True, help="SQLite file from `python -m loadtest --init-db`")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8100)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--reuse-port', action='store_true')
+    args = parser.parse_args()
+    try:
+        serve(args.db, args.host, args.port, args.threads, args.reuse_port)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,16 @@
+"""Django settings for the load test — the real ones, minus SQL Server."""
+
+import os
+
+os.environ.setdefault('CHANNEL_LAYER', 'memory')
+
+from config.settings import *  # noqa: E402,F401,F403
+
+# Never connected to — db_helper is pointed at loadtest.sqlite_backend
+DATABASES = {
+    'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'},
+}
+
+DEBUG = False
+PROFILING_ENABLED = os.environ.get('PROFILING') == '1'
+DB_SLOW_CALL_MS = 0             # SQLite timings say nothing about SQL Server
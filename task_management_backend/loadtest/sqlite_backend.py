@@ -0,0 +1,309 @@
+"""
+SQLite stand-in for SQL Server
+──────────────────────────────
+The stored procedures the API calls, re-implemented over a throwaway
+SQLite file (WAL, one connection per thread), with the same parameters
+and result-set columns. Raw queries (staffmst, holiday_master) run
+as-is after the cross-database prefixes are stripped.
+
+    backend = SQLiteBackend.create(employees=500, tasks=5000)
+    benchmarks.fakes.install(backend.handle)    → db_helper uses it
+
+Close enough in shape and cost for load tests — not for correctness.
+"""
+
+import datetime
+import os
+import random
+import re
+import sqlite3
+import tempfile
+import threading
+
+SCHEMA = """
+CREATE TABLE staffmst (
+    EMP_ID INTEGER PRIMARY KEY, STF_FRNAME TEXT, STF_LSNAME TEXT, REP_STATUS INTEGER);
+CREATE TABLE holiday_master (
+    Holiday_Date DATE, Holiday_Desc TEXT, Status INTEGER);
+CREATE TABLE task (
+    task_id INTEGER PRIMARY KEY, task_title TEXT, task_description TEXT,
+    task_type INTEGER, priority_type INTEGER, task_start_date DATE,
+    created_by INTEGER);
+CREATE TABLE task_execution_log (
+    execution_log_id INTEGER PRIMARY KEY, task_id INTEGER, emp_id INTEGER,
+    status INTEGER, deadline DATE, extended_count INTEGER DEFAULT 0);
+CREATE TABLE task_history (
+    history_id INTEGER PRIMARY KEY, execution_log_id INTEGER,
+    action_type INTEGER, action_by INTEGER, remarks TEXT, action_date TIMESTAMP);
+CREATE INDEX ix_log_emp ON task_execution_log (emp_id);
+CREATE INDEX ix_log_task ON task_execution_log (task_id);
+CREATE INDEX ix_task_created_by ON task (created_by);
+CREATE INDEX ix_history_log ON task_history (execution_log_id);
+CREATE INDEX ix_holiday_date ON holiday_master (Holiday_Date);
+"""
+
+FIRST_NAMES = ['Ritesh', 'Rahul', 'Priya', 'Amit', 'Ravi', 'Sneha', 'Arjun', 'Kiran',
+               'Pooja', 'Vikas', 'Neha', 'Suresh', 'Anita', 'Rohit', 'Meena', 'Deepak']
+LAST_NAMES  = ['Pachlore', 'Sharma', 'Singh', 'Kumar', 'Patel', 'Verma', 'Gupta',
+               'Joshi', 'Rao', 'Mehta', 'Nair', 'Das']
+HOLIDAYS    = [((1, 26), "Republic Day"), ((3, 14), "Holi"), ((8, 15), "Independence Day"),
+               ((10, 2), "Gandhi Jayanti"), ((10, 20), "Diwali"), ((10, 21), "Diwali"),
+               ((10, 22), "Diwali"), ((12, 25), "Christmas")]
+
+TASK_LIST_SQL = """
+SELECT l.execution_log_id, t.task_id, t.task_title, t.task_description,
+       t.task_type, t.priority_type, l.status, l.emp_id,
+       e.STF_FRNAME || ' ' || e.STF_LSNAME AS emp_name,
+       t.created_by AS assigned_by,
+       a.STF_FRNAME || ' ' || a.STF_LSNAME AS assigned_by_name,
+       t.task_start_date, l.deadline AS task_end_date, l.extended_count,
+       CASE WHEN l.deadline < DATE('now') AND l.status NOT IN (3, 6) THEN 1 ELSE 0 END AS is_overdue
+FROM task_execution_log l
+JOIN task t ON t.task_id = l.task_id
+JOIN staffmst e ON e.EMP_ID = l.emp_id
+JOIN staffmst a ON a.EMP_ID = t.created_by
+"""
+
+EXEC_RE = re.compile(r"^\s*EXEC\s+(\w+)", re.IGNORECASE)
+
+
+def _plain(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def _result(cursor):
+    columns = [col[0] for col in cursor.description] if cursor.description else []
+    return columns, cursor.fetchall()
+
+
+class SQLiteBackend:
+
+    def __init__(self, path):
+        self.path   = path
+        self._local = threading.local()
+
+    # ── Setup ────────────────────────────────────────────────────
+    @classmethod
+    def create(cls, employees=500, tasks=5000, seed=1, path=None):
+        """New database file filled with deterministic data."""
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='loadtest_', suffix='.sqlite3')
+            os.close(fd)
+        backend = cls(path)
+        db = backend.db
+        db.executescript(SCHEMA)
+        backend._seed(db, employees, tasks, random.Random(seed))
+        db.commit()
+        backend.close()     # Server processes open their own connections
+        return backend
+
+    def _seed(self, db, employees, tasks, rng):
+        db.executemany(
+            "INSERT INTO staffmst VALUES (?, ?, ?, ?)",
+            [(1000 + i, rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES),
+              0 if rng.random() < 0.05 else 1) for i in range(employees)])
+        years = (2025, 2026)
+        db.executemany(
+            "INSERT INTO holiday_master VALUES (?, ?, 1)",
+            [(datetime.date(year, month, day).isoformat(), desc)
+             for year in years for (month, day), desc in HOLIDAYS])
+
+        today = datetime.date.today()
+        log_rows, task_rows = [], []
+        for task_id in range(1, tasks + 1):
+            start = today + datetime.timedelta(days=rng.randrange(-120, 60))
+            task_rows.append((task_id, f"Task {task_id}", "Generated for load test",
+                              rng.choice((4, 5)), rng.randint(1, 3), start.isoformat(),
+                              1000 + rng.randrange(employees)))
+            for emp in rng.sample(range(employees), rng.choice((1, 1, 1, 2, 3))):
+                deadline = start + datetime.timedelta(days=rng.randrange(0, 30))
+                log_rows.append((task_id, 1000 + emp, rng.randint(0, 7), deadline.isoformat()))
+        db.executemany("INSERT INTO task VALUES (?, ?, ?, ?, ?, ?, ?)", task_rows)
+        db.executemany(
+            "INSERT INTO task_execution_log (task_id, emp_id, status, deadline) "
+            "VALUES (?, ?, ?, ?)", log_rows)
+        db.execute(
+            "INSERT INTO task_history (execution_log_id, action_type, action_by, remarks, action_date) "
+            "SELECT l.execution_log_id, 0, t.created_by, 'Assigned', t.task_start_date "
+            "FROM task_execution_log l JOIN task t ON t.task_id = l.task_id")
+
+    @property
+    def db(self):
+        """This thread's connection (SQLite connections are per thread)."""
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30,
+                                 detect_types=sqlite3.PARSE_DECLTYPES)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=OFF")
+            self._local.db = db
+        return db
+
+    def close(self):
+        """Close this thread's connection."""
+        db = getattr(self._local, 'db', None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+    def sample_emp_ids(self, count, seed=2):
+        """Active employees that have tasks — for virtual users."""
+        rows = self.db.execute(
+            "SELECT DISTINCT l.emp_id FROM task_execution_log l "
+            "JOIN staffmst s ON s.EMP_ID = l.emp_id WHERE s.REP_STATUS = 1 "
+            "ORDER BY l.emp_id").fetchall()
+        ids = [row[0] for row in rows]
+        return random.Random(seed).sample(ids, min(count, len(ids)))
+
+    # ── db_helper entry point ────────────────────────────────────
+    def handle(self, sql, params):
+        """benchmarks.fakes handler: SQL text + params → [(columns, rows), ...]"""
+        params = [_plain(p) for p in params]
+        match = EXEC_RE.match(sql)
+        if match:
+            return getattr(self, match.group(1))(*params)
+        sql = (sql.replace('inout_aems..', '').replace('LPDATA..', '')
+               .replace('%s', '?'))
+        return [_result(self.db.execute(sql, params))]
+
+    # ── Stored procedures ────────────────────────────────────────
+    def sp_fetch_task_list(self, emp_id, view_type, status=None, priority=None,
+                           task_type=None, employee_id=None, date_from=None,
+                           date_to=None, overdue_only=0, extended_only=0, search=None):
+        where, args = [], []
+        if view_type == 'SELF':
+            where.append("l.emp_id = ?")
+        else:
+            where.append("t.created_by = ?")
+        args.append(emp_id)
+        for column, value in (("l.status", status), ("t.priority_type", priority),
+                              ("t.task_type", task_type), ("l.emp_id", employee_id)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                args.append(value)
+        if date_from:
+            where.append("l.deadline >= ?")
+            args.append(date_from)
+        if date_to:
+            where.append("l.deadline <= ?")
+            args.append(date_to)
+        if overdue_only:
+            where.append("l.deadline < DATE('now') AND l.status NOT IN (3, 6)")
+        if extended_only:
+            where.append("l.extended_count > 0")
+        if search:
+            where.append("t.task_title LIKE ?")
+            args.append(f"%{search}%")
+        sql = TASK_LIST_SQL + " WHERE " + " AND ".join(where) + \
+            " ORDER BY l.execution_log_id DESC"
+        return [_result(self.db.execute(sql, args))]
+
+    def sp_dashboard_counts(self, emp_id, view_type, date_from=None,
+                            date_to=None, employee_id=None):
+        scope = "l.emp_id = ?" if view_type == 'SELF' else "t.created_by = ?"
+        where, args = [scope], [emp_id]
+        if date_from:
+            where.append("l.deadline >= ?")
+            args.append(date_from)
+        if date_to:
+            where.append("l.deadline <= ?")
+            args.append(date_to)
+        if employee_id:
+            where.append("l.emp_id = ?")
+            args.append(employee_id)
+        base = (" FROM task_execution_log l JOIN task t ON t.task_id = l.task_id"
+                " WHERE " + " AND ".join(where))
+        db = self.db
+        return [
+            _result(db.execute(
+                "SELECT COUNT(*) AS total,"
+                " SUM(l.status = 0) AS assigned, SUM(l.status IN (1, 5)) AS in_progress,"
+                " SUM(l.status = 2) AS submitted, SUM(l.status = 3) AS approved,"
+                " SUM(l.status = 4) AS rejected,"
+                " SUM(l.deadline < DATE('now') AND l.status NOT IN (3, 6)) AS overdue" + base,
+                args)),
+            _result(db.execute(
+                "SELECT l.emp_id, COUNT(*) AS total, SUM(l.status = 3) AS approved"
+                + base + " GROUP BY l.emp_id ORDER BY total DESC LIMIT 20", args)),
+            _result(db.execute(
+                "SELECT l.status, COUNT(*) AS count" + base + " GROUP BY l.status", args)),
+            _result(db.execute(
+                "SELECT t.priority_type, COUNT(*) AS count" + base
+                + " GROUP BY t.priority_type", args)),
+            _result(db.execute(
+                "SELECT STRFTIME('%Y-%m', l.deadline) AS month, COUNT(*) AS count"
+                + base + " GROUP BY month ORDER BY month", args)),
+        ]
+
+    def sp_get_employees(self, emp_id):
+        return [_result(self.db.execute(
+            "SELECT EMP_ID AS emp_id, STF_FRNAME || ' ' || STF_LSNAME AS emp_name"
+            " FROM staffmst WHERE REP_STATUS = 1 ORDER BY STF_FRNAME, STF_LSNAME"))]
+
+    def sp_get_affected_tasks(self, emp_id, view_type):
+        scope = "l.emp_id = ?" if view_type == 'SELF' else "t.created_by = ?"
+        return [_result(self.db.execute(
+            "SELECT l.execution_log_id, t.task_title, l.emp_id,"
+            " e.STF_FRNAME || ' ' || e.STF_LSNAME AS emp_name,"
+            " t.priority_type, l.status, l.deadline AS current_deadline,"
+            " DATE(l.deadline, '+1 day') AS suggested_date,"
+            " COALESCE(h.Holiday_Desc, 'Sunday') AS reason,"
+            " CAST(JULIANDAY(l.deadline) - JULIANDAY('now') AS INTEGER) AS days_until_deadline"
+            " FROM task_execution_log l JOIN task t ON t.task_id = l.task_id"
+            " JOIN staffmst e ON e.EMP_ID = l.emp_id"
+            " LEFT JOIN holiday_master h ON h.Holiday_Date = l.deadline AND h.Status = 1"
+            " WHERE " + scope + " AND l.status NOT IN (3, 6) AND l.deadline >= DATE('now')"
+            " AND (h.Holiday_Date IS NOT NULL OR STRFTIME('%w', l.deadline) = '0')",
+            [emp_id]))]
+
+    def sp_get_task_history(self, execution_log_id):
+        return [_result(self.db.execute(
+            "SELECT h.history_id, h.action_type, h.action_by,"
+            " s.STF_FRNAME || ' ' || s.STF_LSNAME AS action_by_name,"
+            " h.remarks, h.action_date"
+            " FROM task_history h LEFT JOIN staffmst s ON s.EMP_ID = h.action_by"
+            " WHERE h.execution_log_id = ? ORDER BY h.history_id",
+            [execution_log_id]))]
+
+    def sp_update_task_status(self, execution_log_id, action_type, action_by,
+                              remarks, extended_date):
+        db = self.db
+        row = db.execute(
+            "SELECT l.emp_id, t.created_by FROM task_execution_log l"
+            " JOIN task t ON t.task_id = l.task_id WHERE l.execution_log_id = ?",
+            [execution_log_id]).fetchone()
+        columns = ['success', 'message', 'assigned_by', 'emp_id']
+        if row is None:
+            return [(columns, [(0, "Task not found", None, None)])]
+        with db:
+            if int(action_type) == 8:
+                db.execute(
+                    "UPDATE task_execution_log SET deadline = ?,"
+                    " extended_count = extended_count + 1 WHERE execution_log_id = ?",
+                    [extended_date, execution_log_id])
+            else:
+                db.execute("UPDATE task_execution_log SET status = ? WHERE execution_log_id = ?",
+                           [action_type, execution_log_id])
+            db.execute(
+                "INSERT INTO task_history (execution_log_id, action_type, action_by,"
+                " remarks, action_date) VALUES (?, ?, ?, ?, ?)",
+                [execution_log_id, action_type, action_by, remarks,
+                 datetime.datetime.now().isoformat(' ')])
+        return [(columns, [(1, "Updated", row[1], row[0])])]
+
+    def sp_create_task(self, title, description, task_type, priority_type,
+                       start_date, start_time, end_date, end_time, created_by, emp_list):
+        db = self.db
+        with db:
+            cursor = db.execute(
+                "INSERT INTO task (task_title, task_description, task_type,"
+                " priority_type, task_start_date, created_by) VALUES (?, ?, ?, ?, ?, ?)",
+                [title, description, task_type, priority_type, start_date, created_by])
+            task_id = cursor.lastrowid
+            for emp_id in [e for e in str(emp_list).split(',') if e.strip()]:
+                db.execute(
+                    "INSERT INTO task_execution_log (task_id, emp_id, status, deadline)"
+                    " VALUES (?, ?, 0, ?)", [task_id, int(emp_id), end_date])
+        return [(['success', 'message', 'task_id'], [(1, "Task created", task_id)])]
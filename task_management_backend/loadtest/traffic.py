@@ -0,0 +1,289 @@
+"""
+Virtual users replaying the React pages' call pattern
+─────────────────────────────────────────────────────
+Each virtual user logs in once (dev-token), then loops over page
+visits picked by weight until the run ends:
+
+  dashboard   → GET dashboard/?view=SELF + GET my-tasks/          (page load)
+  assigned    → GET dashboard/?view=ASSIGNED_BY_ME + GET assigned-by-me/
+  create      → GET auth/employees/?search= per keystroke,
+                GET check-date/ per date change, POST create/
+  status      → POST update-status/ burst on own tasks, then GET my-tasks/
+  extend      → GET check-date/ + POST extend/ burst on assigned tasks,
+                then GET assigned-by-me/
+  affected    → GET affected-by-holiday/, POST extend/ per shifted task
+  history     → GET history/<id>/                                 (task detail)
+
+Only the standard library — the client never imports Django.
+Samples are kept per user thread and merged at the end (no locking
+on the hot path).
+"""
+
+import datetime
+import http.client
+import json
+import random
+import threading
+import time
+from urllib.parse import quote, urlsplit
+
+from .sqlite_backend import FIRST_NAMES
+
+DEFAULT_MIX = {
+    'dashboard': 30,
+    'assigned':  15,
+    'create':    10,
+    'status':    15,
+    'extend':    10,
+    'affected':   5,
+    'history':   15,
+}
+
+
+class Samples:
+    """endpoint label → latencies (seconds) and error count."""
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors    = {}
+
+    def record(self, label, seconds, ok):
+        self.latencies.setdefault(label, []).append(seconds)
+        if not ok:
+            self.errors[label] = self.errors.get(label, 0) + 1
+
+    def merge(self, other):
+        for label, values in other.latencies.items():
+            self.latencies.setdefault(label, []).extend(values)
+        for label, count in other.errors.items():
+            self.errors[label] = self.errors.get(label, 0) + count
+
+
+class Client:
+    """One persistent HTTP connection; reopened whenever the server closes it."""
+
+    def __init__(self, base_url, samples, timeout=30):
+        parts = urlsplit(base_url)
+        self.host    = parts.hostname
+        self.port    = parts.port or 80
+        self.prefix  = parts.path.rstrip('/') + '/api'
+        self.timeout = timeout
+        self.samples = samples
+        self.token   = None
+        self._conn   = None
+
+    def request(self, label, method, path, body=None):
+        """→ decoded "data" of the envelope, or None on any failure."""
+        headers = {'Accept': 'application/json'}
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers['Content-Type'] = 'application/json'
+
+        started = time.perf_counter()
+        try:
+            if self._conn is None:
+                self._conn = http.client.HTTPConnection(
+                    self.host, self.port, timeout=self.timeout)
+            self._conn.request(method, self.prefix + path, payload, headers)
+            response = self._conn.getresponse()
+            raw = response.read()
+            status = response.status
+            if response.will_close:
+                self._conn.close()
+                self._conn = None
+        except (OSError, http.client.HTTPException):
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self.samples.record(label, time.perf_counter() - started, False)
+            return None
+        elapsed = time.perf_counter() - started
+
+        try:
+            envelope = json.loads(raw) if raw else {}
+        except ValueError:
+            envelope = {}
+        ok = status < 400 and envelope.get('success', True) is not False
+        self.samples.record(label, elapsed, ok)
+        return envelope.get('data') if ok else None
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class VirtualUser(threading.Thread):
+
+    def __init__(self, base_url, emp_id, seed, deadline, think_seconds=0.0, mix=None):
+        super().__init__(daemon=True)
+        self.samples  = Samples()
+        self.client   = Client(base_url, self.samples)
+        self.emp_id   = emp_id
+        self.rng      = random.Random(seed)
+        self.deadline = deadline
+        self.think    = think_seconds
+        mix = mix or DEFAULT_MIX
+        self.pages    = list(mix)
+        self.weights  = [mix[name] for name in self.pages]
+        self.own_ids      = []
+        self.assigned_ids = []
+        self.logged_in    = False
+
+    def login(self):
+        data = self.client.request(
+            'GET /auth/dev-token/', 'GET', f'/auth/dev-token/?emp_id={self.emp_id}')
+        if data:
+            self.client.token = data['token']
+            self.logged_in = True
+        return self.logged_in
+
+    def run(self):
+        try:
+            if not self.login():
+                return
+            self.page_dashboard()
+            while time.monotonic() < self.deadline:
+                page = self.rng.choices(self.pages, self.weights)[0]
+                getattr(self, f'page_{page}')()
+                self._pause()
+        finally:
+            self.client.close()
+
+    def _pause(self, scale=1.0):
+        if self.think:
+            time.sleep(self.rng.expovariate(1 / (self.think * scale)))
+
+    def _date(self, low=-10, high=60):
+        day = datetime.date.today() + datetime.timedelta(days=self.rng.randint(low, high))
+        return day.isoformat()
+
+    # ── Pages ────────────────────────────────────────────────────
+    def page_dashboard(self):
+        self.client.request('GET /tasks/dashboard/', 'GET', '/tasks/dashboard/?view=SELF')
+        self._my_tasks()
+
+    def page_assigned(self):
+        self.client.request('GET /tasks/dashboard/', 'GET',
+                            '/tasks/dashboard/?view=ASSIGNED_BY_ME')
+        self._assigned_tasks()
+
+    def page_create(self):
+        # Employee picker: one search per keystroke (after the 300 ms debounce)
+        name = self.rng.choice(FIRST_NAMES).lower()
+        found = None
+        for length in range(1, self.rng.randint(2, len(name)) + 1):
+            found = self.client.request(
+                'GET /auth/employees/?search=', 'GET',
+                f'/auth/employees/?search={quote(name[:length])}') or found
+            self._pause(0.3)
+        # Start and end date pickers: one check per change
+        start, end = self._date(0, 10), self._date(10, 40)
+        for day in (start, end):
+            self.client.request('GET /tasks/check-date/', 'GET', f'/tasks/check-date/?date={day}')
+        if not found:
+            return
+        assignees = self.rng.sample(found, min(len(found), self.rng.randint(1, 3)))
+        self.client.request('POST /tasks/create/', 'POST', '/tasks/create/', {
+            'task_title':      f"Load test task {self.rng.randrange(10 ** 6)}",
+            'task_type':       5,
+            'priority_type':   self.rng.randint(1, 3),
+            'task_start_date': start,
+            'start_time':      '09:00',
+            'task_end_date':   end,
+            'end_time':        '18:00',
+            'emp_list':        ','.join(str(e['emp_id']) for e in assignees),
+        })
+
+    def page_status(self):
+        if not self.own_ids:
+            self._my_tasks()
+        ids = self.rng.sample(self.own_ids, min(len(self.own_ids), self.rng.randint(3, 8)))
+        for execution_log_id in ids:
+            self.client.request('POST /tasks/update-status/', 'POST', '/tasks/update-status/', {
+                'execution_log_id': execution_log_id,
+                'action_type':      self.rng.choice((1, 2)),
+                'remarks':          "Load test",
+            })
+            self._pause(0.5)
+        if ids:
+            self._my_tasks()
+
+    def page_extend(self):
+        if not self.assigned_ids:
+            self._assigned_tasks()
+        ids = self.rng.sample(self.assigned_ids,
+                              min(len(self.assigned_ids), self.rng.randint(1, 4)))
+        for execution_log_id in ids:
+            day = self._date(1, 30)
+            check = self.client.request('GET /tasks/check-date/', 'GET',
+                                        f'/tasks/check-date/?date={day}')
+            if check and check.get('needs_shift'):
+                day = check['suggested_date']
+            self.client.request('POST /tasks/extend/', 'POST', '/tasks/extend/', {
+                'execution_log_id': execution_log_id,
+                'extended_date':    day,
+                'remarks':          "Load test",
+            })
+            self._pause(0.5)
+        if ids:
+            self._assigned_tasks()
+
+    def page_affected(self):
+        tasks = self.client.request('GET /tasks/affected-by-holiday/', 'GET',
+                                    '/tasks/affected-by-holiday/?view=ASSIGNED_BY_ME') or []
+        for task in tasks[:3]:
+            self.client.request('POST /tasks/extend/', 'POST', '/tasks/extend/', {
+                'execution_log_id': task['execution_log_id'],
+                'extended_date':    task['suggested_date'],
+                'remarks': f"Shifted from {task['reason']} ({task['current_deadline']})",
+            })
+
+    def page_history(self):
+        ids = self.own_ids + self.assigned_ids
+        if not ids:
+            return
+        self.client.request('GET /tasks/history/<id>/', 'GET',
+                            f'/tasks/history/{self.rng.choice(ids)}/')
+
+    # ── Task lists (refresh the ids the bursts act on) ───────────
+    def _my_tasks(self):
+        rows = self.client.request('GET /tasks/my-tasks/', 'GET', '/tasks/my-tasks/')
+        if rows is not None:
+            self.own_ids = [row['execution_log_id'] for row in rows
+                            if row.get('status') not in (3, 6)]
+
+    def _assigned_tasks(self):
+        rows = self.client.request('GET /tasks/assigned-by-me/', 'GET',
+                                   '/tasks/assigned-by-me/')
+        if rows is not None:
+            self.assigned_ids = [row['execution_log_id'] for row in rows
+                                 if row.get('status') not in (3, 6)]
+
+
+def run_users(base_url, emp_ids, duration, think_seconds=0.0, mix=None,
+              seed=1, ramp_seconds=0.0):
+    """
+    One VirtualUser per emp_id, started over ramp_seconds.
+    → (merged Samples, measured wall-clock seconds, users that logged in)
+    """
+    started  = time.monotonic()
+    deadline = started + ramp_seconds + duration
+    users = [VirtualUser(base_url, emp_id, seed * 100003 + i, deadline, think_seconds, mix)
+             for i, emp_id in enumerate(emp_ids)]
+    step = ramp_seconds / len(users) if users else 0
+    for user in users:
+        user.start()
+        if step:
+            time.sleep(step)
+    for user in users:
+        user.join()
+    elapsed = time.monotonic() - started
+
+    merged = Samples()
+    for user in users:
+        merged.merge(user.samples)
+    return merged, elapsed, sum(1 for user in users if user.logged_in)
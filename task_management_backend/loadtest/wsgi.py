@@ -0,0 +1,15 @@
+"""
+WSGI app for running the load-test backend under a real server:
+
+    python -m loadtest --init-db /tmp/lt.sqlite3
+    LOADTEST_DB=/tmp/lt.sqlite3 gunicorn -w 4 --threads 8 loadtest.wsgi
+    python -m loadtest --target http://127.0.0.1:8000 --db /tmp/lt.sqlite3
+"""
+
+import os
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'loadtest.settings')
+
+from loadtest.server import application as _application  # noqa: E402
+
+application = _application(os.environ['LOADTEST_DB'])
@@ -0,0 +1,81 @@
+"""
+In-process TTL + LRU cache
+──────────────────────────
+Thread-safe. Every entry expires after ttl_seconds; when the cache is
+full, the least recently used entry is evicted.
+Per process — each worker keeps its own copy.
+
+is_process_local(alias) → True when a Django CACHES alias is per process
+too (LocMemCache / DummyCache), i.e. other workers never see its keys.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def is_process_local(alias):
+    backend = settings.CACHES.get(alias, {}).get('BACKEND', '')
+    return backend in PROCESS_LOCAL_BACKENDS
+
+
+class TTLCache:
+
+    def __init__(self, max_entries, ttl_seconds):
+        self.max_entries = max_entries
+        self.ttl         = ttl_seconds
+        self._data       = OrderedDict()    # key → (expires_at, value)
+        self._lock       = threading.Lock()
+        self.hits        = 0
+        self.misses      = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            if item[0] <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key, value, ttl_seconds=None):
+        ttl = self.ttl if ttl_seconds is None else ttl_seconds
+        if self.max_entries <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            item = self._data.pop(key, None)
+            return item[1] if item else None
+
+    def discard_where(self, predicate):
+        """Drop every entry whose KEY matches predicate. Returns count dropped."""
+        with self._lock:
+            doomed = [key for key in self._data if predicate(key)]
+            for key in doomed:
+                del self._data[key]
+            return len(doomed)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
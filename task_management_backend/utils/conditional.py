@@ -0,0 +1,48 @@
+"""
+Conditional GET — ETag / If-None-Match
+──────────────────────────────────────
+ETags come from a cheap version string (e.g. change-log version),
+NOT from hashing the body, so a 304 is decided before the stored
+procedure runs.
+"""
+
+import hashlib
+from functools import wraps
+
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+
+
+def make_etag(*parts):
+    """Strong ETag from any values (user, version, query string…)."""
+    raw = '|'.join(str(part) for part in parts).encode()
+    return quote_etag(hashlib.blake2b(raw, digest_size=16).hexdigest())
+
+
+def etag_guard(etag_func):
+    """
+    Decorator for APIView.get(self, request, ...).
+    etag_func(request, *args, **kwargs) → make_etag(...) value.
+
+    If-None-Match matches → 304, the view body never runs.
+    Otherwise the view runs and its 200 response gets the ETag.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            etag = etag_func(request, *args, **kwargs)
+            if_none_match = request.headers.get('If-None-Match')
+            if if_none_match and etag in parse_etags(if_none_match):
+                response = HttpResponseNotModified()
+                response['ETag'] = etag
+                patch_vary_headers(response, ['Authorization'])
+                return response
+
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                response['ETag'] = etag
+                patch_vary_headers(response, ['Authorization'])
+            return response
+        return wrapper
+    return decorator
@@ -1,27 +1,82 @@
 """
 Database Helper — Calls stored procedures and raw queries
-All database access goes through these 3 functions.
+All database access goes through these functions.
+
+Materialized (list of dicts):
+  call_sp()                  → ONE result set
+  call_sp_multiple_results() → MULTIPLE result sets
+  run_query()                → Raw SQL
+
+Columnar ({"columns": [...], "rows": [tuple, ...]}):
+  call_sp_columnar()         → ONE result set, column names sent once
+
+Streaming (generator of dicts, fetchmany in batches):
+  iter_sp()                  → ONE result set
+  iter_query()               → Raw SQL
+
+Every call is timed into utils.metrics.db_metrics, labelled by SP name
+(run_query / iter_query: by their label argument). Streaming calls are
+timed to their first batch.
+
+Every call runs on the alias utils.db_routing.route() picks for that
+name: read-only SPs / labels (DB_READ_ONLY) on DB_READ_ALIAS, the rest
+on the primary. using='default' (any alias) overrides the routing.
 """
 
-from django.db import connection
+from django.conf import settings
+from django.db import connections
+from utils.db_routing import PRIMARY, is_write, note_write, route
+from utils.metrics import db_metrics
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def call_sp(sp_name, params=None):
+def _execute_sp(cursor, sp_name, params):
+    if params:
+        placeholders = ', '.join(['%s'] * len(params))
+        cursor.execute(f"EXEC {sp_name} {placeholders}", params)
+    else:
+        cursor.execute(f"EXEC {sp_name}")
+
+
+def _cursor(name, using):
+    """Cursor on the alias routed for name. Writes (DB_WRITES) keep the request on the primary."""
+    alias = route(name, using)
+    if alias == PRIMARY and is_write(name):
+        note_write()
+    return connections[alias].cursor()
+
+
+def _fetch_batches(cursor, batch_size, call):
+    """
+    Yield rows as dicts, pulling batch_size rows per round trip.
+    call.stop() once the first batch is in — the rest is the caller's pace.
+    """
+    if not cursor.description:
+        call.stop()
+        return
+    columns = [col[0] for col in cursor.description]
+    batch_size = batch_size or getattr(settings, 'DB_FETCH_BATCH_SIZE', 500)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        call.stop()
+        if not rows:
+            return
+        for row in rows:
+            yield dict(zip(columns, row))
+
+
+def call_sp(sp_name, params=None, using=None):
     """Call SP that returns ONE result set."""
-    with connection.cursor() as cursor:
+    with db_metrics.track(sp_name) as call, _cursor(sp_name, using) as cursor:
         try:
-            if params:
-                placeholders = ', '.join(['%s'] * len(params))
-                cursor.execute(f"EXEC {sp_name} {placeholders}", params)
-            else:
-                cursor.execute(f"EXEC {sp_name}")
-            
+            _execute_sp(cursor, sp_name, params)
+
             if cursor.description:
                 columns = [col[0] for col in cursor.description]
                 rows = cursor.fetchall()
+                call.rows = len(rows)
                 return [dict(zip(columns, row)) for row in rows]
             return []
         except Exception as e:
@@ -29,25 +84,21 @@ def call_sp(sp_name, params=None):
             raise
 
 
-def call_sp_multiple_results(sp_name, params=None):
+def call_sp_multiple_results(sp_name, params=None, using=None):
     """Call SP that returns MULTIPLE result sets (like dashboard)."""
-    with connection.cursor() as cursor:
+    with db_metrics.track(sp_name) as call, _cursor(sp_name, using) as cursor:
         try:
-            if params:
-                placeholders = ', '.join(['%s'] * len(params))
-                cursor.execute(f"EXEC {sp_name} {placeholders}", params)
-            else:
-                cursor.execute(f"EXEC {sp_name}")
-            
+            _execute_sp(cursor, sp_name, params)
+
             result_sets = []
-            
+
             if cursor.description:
                 columns = [col[0] for col in cursor.description]
                 rows = cursor.fetchall()
                 result_sets.append([dict(zip(columns, row)) for row in rows])
             else:
                 result_sets.append([])
-            
+
             while cursor.nextset():
                 try:
                     if cursor.description:
@@ -58,27 +109,84 @@ def call_sp_multiple_results(sp_name, params=None):
                         result_sets.append([])
                 except Exception:
                     result_sets.append([])
-            
+
+            call.rows = sum(len(rs) for rs in result_sets)
             return result_sets
         except Exception as e:
             logger.error(f"SP Error [{sp_name}]: {str(e)}")
             raise
 
 
-def run_query(sql, params=None):
-    """Run raw SQL query. Used by holiday_helper."""
-    with connection.cursor() as cursor:
+def run_query(sql, params=None, label='query', using=None):
+    """Run raw SQL query. Used by holiday_helper. label → metrics name."""
+    with db_metrics.track(label) as call, _cursor(label, using) as cursor:
         try:
             if params:
                 cursor.execute(sql, params)
             else:
                 cursor.execute(sql)
-            
+
             if cursor.description:
                 columns = [col[0] for col in cursor.description]
                 rows = cursor.fetchall()
+                call.rows = len(rows)
                 return [dict(zip(columns, row)) for row in rows]
             return []
         except Exception as e:
             logger.error(f"Query Error: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+
+def call_sp_columnar(sp_name, params=None, using=None):
+    """
+    Call SP that returns ONE result set — columnar.
+    Column names appear once; each row stays a plain tuple (no dict per row).
+    """
+    with db_metrics.track(sp_name) as call, _cursor(sp_name, using) as cursor:
+        try:
+            _execute_sp(cursor, sp_name, params)
+
+            if cursor.description:
+                columns = [col[0] for col in cursor.description]
+                rows = cursor.fetchall()
+                call.rows = len(rows)
+                return {"columns": columns, "rows": [tuple(row) for row in rows]}
+            return {"columns": [], "rows": []}
+        except Exception as e:
+            logger.error(f"SP Error [{sp_name}]: {str(e)}")
+            raise
+
+
+def iter_sp(sp_name, params=None, batch_size=None, using=None):
+    """
+    Call SP that returns ONE result set — as a generator.
+    Rows are fetched batch_size at a time (default DB_FETCH_BATCH_SIZE),
+    so memory stays flat however many rows the SP returns.
+    The cursor stays open until the generator is exhausted or closed.
+    Timed up to the first batch only (execute + first fetchmany).
+    """
+    with db_metrics.track(sp_name) as call, _cursor(sp_name, using) as cursor:
+        try:
+            _execute_sp(cursor, sp_name, params)
+            for row in _fetch_batches(cursor, batch_size, call):
+                call.rows += 1
+                yield row
+        except Exception as e:
+            logger.error(f"SP Error [{sp_name}]: {str(e)}")
+            raise
+
+
+def iter_query(sql, params=None, batch_size=None, label='query', using=None):
+    """Run raw SQL query — as a generator. See iter_sp()."""
+    with db_metrics.track(label) as call, _cursor(label, using) as cursor:
+        try:
+            if params:
+                cursor.execute(sql, params)
+            else:
+                cursor.execute(sql)
+            for row in _fetch_batches(cursor, batch_size, call):
+                call.rows += 1
+                yield row
+        except Exception as e:
+            logger.error(f"Query Error: {str(e)}")
+            raise
@@ -0,0 +1,145 @@
+"""
+DB Read/Write Routing — which DATABASES alias a db_helper call runs on
+──────────────────────────────────────────────────────────────────────
+route(name, using) for an SP name / run_query label:
+
+  using given                    → that alias (caller's hint wins)
+  no replica (DB_READ_ALIAS is the primary) → primary
+  inside transaction.atomic()    → primary (the savepoints live there)
+  name not in DB_READ_ONLY       → primary (writes, anything unknown)
+  current actor is sticky        → primary (read-your-writes)
+  otherwise                      → DB_READ_ALIAS
+
+Sticky: stick(emp_ids) after a write — requests by those employees
+read from the primary for DB_STICKY_SECONDS, until the replica has
+caught up. Kept in Django's cache (DB_STICKY_CACHE), which must be
+shared (Redis) once a replica is configured: with a per-process
+LocMemCache only the worker that wrote would know, and the author's
+next request could land on another worker and read stale rows.
+DBRoutingMiddleware refuses to start in that setup (ImproperlyConfigured).
+A write run through db_helper (a name in DB_WRITES) also makes the
+rest of its own request read from the primary, and sticks its actor.
+Names in neither set still run on the primary, but do not stick
+anyone — "unknown" is a routing default, not a write.
+
+Actor: set_actor(emp_id) by token authentication, per request
+(ContextVar; DBRoutingMiddleware starts each request clean).
+"""
+
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections
+from utils.cache import is_process_local
+
+PRIMARY = DEFAULT_DB_ALIAS
+
+
+class _RequestState:
+    __slots__ = ('actor', 'sticky')
+
+    def __init__(self, actor=None):
+        self.actor  = actor
+        self.sticky = None      # None → not looked up yet
+
+
+_state = ContextVar('db_routing_state', default=None)
+
+
+def _read_alias():
+    return getattr(settings, 'DB_READ_ALIAS', PRIMARY)
+
+
+def _sticky_key(emp_id):
+    return f'db_sticky:{emp_id}'
+
+
+def _cache():
+    return caches[getattr(settings, 'DB_STICKY_CACHE', 'default')]
+
+
+def check_sticky_cache():
+    """A replica needs a shared DB_STICKY_CACHE, or read-your-writes breaks across workers."""
+    alias = getattr(settings, 'DB_STICKY_CACHE', 'default')
+    if _read_alias() != PRIMARY and is_process_local(alias):
+        raise ImproperlyConfigured(
+            f"DB_READ_ALIAS '{_read_alias()}' needs a shared DB_STICKY_CACHE; "
+            f"'{alias}' is per process (use Redis, see CACHES)")
+
+
+def set_actor(emp_id):
+    """The employee the current request runs as."""
+    state = _state.get()
+    if state is None:
+        _state.set(_RequestState(emp_id))
+    else:
+        state.actor  = emp_id
+        state.sticky = None
+
+
+def stick(emp_ids):
+    """Send reads by these employees to the primary for DB_STICKY_SECONDS."""
+    if _read_alias() == PRIMARY:
+        return
+    seconds = getattr(settings, 'DB_STICKY_SECONDS', 5)
+    keys = {_sticky_key(int(e)): 1 for e in emp_ids if e}
+    if keys and seconds > 0:
+        _cache().set_many(keys, timeout=seconds)
+
+
+def note_write():
+    """A write just went to the primary — keep this request and its actor there."""
+    state = _state.get()
+    if state is None:
+        return
+    state.sticky = True
+    if state.actor is not None:
+        stick([state.actor])
+
+
+def _actor_is_sticky():
+    state = _state.get()
+    if state is None or state.actor is None:
+        return False
+    if state.sticky is None:
+        state.sticky = _cache().get(_sticky_key(state.actor)) is not None
+    return state.sticky
+
+
+def is_read_only(name):
+    return name in getattr(settings, 'DB_READ_ONLY', ())
+
+
+def is_write(name):
+    return name in getattr(settings, 'DB_WRITES', ())
+
+
+def route(name, using=None):
+    """Alias for the SP / query label name. See module docstring."""
+    if using:
+        return using
+    read_alias = _read_alias()
+    if read_alias == PRIMARY:
+        return PRIMARY
+    if connections[PRIMARY].in_atomic_block:
+        return PRIMARY
+    if not is_read_only(name) or _actor_is_sticky():
+        return PRIMARY
+    return read_alias
+
+
+class DBRoutingMiddleware:
+    """Fresh routing state per request (threads are reused between requests)."""
+
+    def __init__(self, get_response):
+        check_sticky_cache()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _state.set(_RequestState())
+        try:
+            return self.get_response(request)
+        finally:
+            _state.reset(token)
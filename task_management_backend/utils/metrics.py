@@ -0,0 +1,178 @@
+"""
+DB Call Metrics — per stored procedure / labelled query
+───────────────────────────────────────────────────────
+Every db_helper call is recorded under its SP name (or run_query label):
+
+  calls   → number of calls
+  errors  → calls that raised
+  rows    → rows returned
+  latency → histogram (DB_METRICS_BUCKETS_MS), sum and count
+
+Calls slower than DB_SLOW_CALL_MS are logged as warnings.
+Streaming calls (iter_sp / iter_query) are timed up to their first
+batch — execute + first fetch. Time the caller spends consuming the
+rest is not database latency and is left out.
+render_prometheus() → Prometheus text format for GET /metrics
+(render_samples() adds other counters to the same page).
+Per process — each worker reports its own numbers.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+from utils.profiling import add_timing
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class _Call:
+    """
+    Handed to the caller of track() — set .rows before the block ends.
+    stop() ends the timed part early (rows are still counted to the end).
+    """
+    __slots__ = ('rows', 'stopped')
+
+    def __init__(self):
+        self.rows    = 0
+        self.stopped = None
+
+    def stop(self):
+        if self.stopped is None:
+            self.stopped = time.perf_counter()
+
+
+class _Stats:
+    __slots__ = ('calls', 'errors', 'rows', 'seconds', 'buckets')
+
+    def __init__(self, bucket_count):
+        self.calls   = 0
+        self.errors  = 0
+        self.rows    = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (bucket_count + 1)     # last one = +Inf
+
+
+class DBMetrics:
+
+    def __init__(self):
+        self._stats = {}
+        self._lock  = threading.Lock()
+        self.buckets_ms = tuple(getattr(
+            settings, 'DB_METRICS_BUCKETS_MS', DEFAULT_BUCKETS_MS))
+
+    def observe(self, label, seconds, rows=0, error=False):
+        elapsed_ms = seconds * 1000
+        bucket = bisect_left(self.buckets_ms, elapsed_ms)
+        with self._lock:
+            stats = self._stats.get(label)
+            if stats is None:
+                stats = self._stats[label] = _Stats(len(self.buckets_ms))
+            stats.calls   += 1
+            stats.rows    += rows
+            stats.seconds += seconds
+            stats.buckets[bucket] += 1
+            if error:
+                stats.errors += 1
+
+        slow_ms = getattr(settings, 'DB_SLOW_CALL_MS', 500)
+        if slow_ms and elapsed_ms >= slow_ms:
+            logger.warning(f"Slow DB call [{label}]: {elapsed_ms:.0f} ms, {rows} rows")
+
+    def track(self, label):
+        """
+        with db_metrics.track('sp_name') as call:
+            ...
+            call.rows = len(rows)
+        """
+        return _Tracker(self, label)
+
+    def snapshot(self):
+        """{label: {"calls", "errors", "rows", "seconds", "buckets"}}"""
+        with self._lock:
+            return {
+                label: {
+                    "calls":   s.calls,
+                    "errors":  s.errors,
+                    "rows":    s.rows,
+                    "seconds": s.seconds,
+                    "buckets": list(s.buckets),
+                }
+                for label, s in self._stats.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def render_prometheus(self):
+        lines = [
+            "# HELP task_db_calls_total DB calls by stored procedure / query label",
+            "# TYPE task_db_calls_total counter",
+        ]
+        snapshot = sorted(self.snapshot().items())
+        for label, s in snapshot:
+            lines.append(f'task_db_calls_total{{sp="{label}"}} {s["calls"]}')
+
+        lines += ["# HELP task_db_errors_total DB calls that raised",
+                  "# TYPE task_db_errors_total counter"]
+        for label, s in snapshot:
+            lines.append(f'task_db_errors_total{{sp="{label}"}} {s["errors"]}')
+
+        lines += ["# HELP task_db_rows_total Rows returned",
+                  "# TYPE task_db_rows_total counter"]
+        for label, s in snapshot:
+            lines.append(f'task_db_rows_total{{sp="{label}"}} {s["rows"]}')
+
+        lines += ["# HELP task_db_call_duration_seconds DB call latency",
+                  "# TYPE task_db_call_duration_seconds histogram"]
+        for label, s in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets_ms + (None,), s["buckets"]):
+                cumulative += count
+                le = "+Inf" if bound is None else f"{bound / 1000:g}"
+                lines.append(
+                    f'task_db_call_duration_seconds_bucket{{sp="{label}",le="{le}"}} {cumulative}')
+            lines.append(f'task_db_call_duration_seconds_sum{{sp="{label}"}} {s["seconds"]:.6f}')
+            lines.append(f'task_db_call_duration_seconds_count{{sp="{label}"}} {s["calls"]}')
+        return "\n".join(lines) + "\n"
+
+
+def render_samples(name, help_text, kind, label, values):
+    """
+    Extra metric families for /metrics:
+    render_samples('x_total', 'help', 'counter', 'event', {'sent': 3})
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for key, value in sorted(values.items()):
+        lines.append(f'{name}{{{label}="{key}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+class _Tracker:
+    __slots__ = ('metrics', 'label', 'call', 'started')
+
+    def __init__(self, metrics, label):
+        self.metrics = metrics
+        self.label   = label
+
+    def __enter__(self):
+        self.call    = _Call()
+        self.started = time.perf_counter()
+        return self.call
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = (self.call.stopped or time.perf_counter()) - self.started
+        add_timing('db', elapsed)
+        # A streaming generator closed early (GeneratorExit) is not an error
+        error = exc_type is not None and not issubclass(exc_type, GeneratorExit)
+        if getattr(settings, 'DB_METRICS_ENABLED', True):
+            self.metrics.observe(self.label, elapsed, self.call.rows, error)
+        return False
+
+
+db_metrics = DBMetrics()
@@ -0,0 +1,43 @@
+"""
+Keyset (cursor) pagination helpers
+──────────────────────────────────
+Cursor = opaque, URL-safe token holding the sort key of the last row
+a client has seen. The next page is "rows after that key" — no OFFSET,
+so inserts between requests never shift a page (no skipped / repeated
+rows), and only one page is held in memory and sent.
+
+It does NOT make later pages cheaper on the database: sp_fetch_task_list
+has no @after / @limit parameters, so every page reads the SP's whole
+result and the cursor is applied in Python (services.get_task_page).
+Page 50 costs the same as page 1 because both are a full scan.
+"""
+
+import base64
+import json
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE     = 200
+
+
+def encode_cursor(key):
+    raw = json.dumps({"k": key}, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Returns the sort key stored in cursor. Raises ValueError if tampered."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded))["k"]
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def parse_limit(value):
+    """limit query param → int in 1..MAX_PAGE_SIZE."""
+    if value in (None, ''):
+        return DEFAULT_PAGE_SIZE
+    limit = int(value)
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    return min(limit, MAX_PAGE_SIZE)
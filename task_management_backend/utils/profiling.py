@@ -0,0 +1,137 @@
+"""
+Request Profiling — Server-Timing headers + cProfile dumps
+──────────────────────────────────────────────────────────
+Optional (PROFILING_ENABLED). When off, ProfilingMiddleware removes
+itself at startup (MiddlewareNotUsed) and add_timing() is a no-op.
+
+Per request, time is summed by phase and sent back as:
+
+    Server-Timing: auth;dur=0.4, db;dur=38.2;desc="3 calls",
+                   serialize;dur=2.1, notify;dur=0.3, total;dur=45.0
+
+  auth      → StandaloneTokenAuthentication
+  db        → every db_helper call (utils.metrics)
+  serialize → DRF rendering (after the view returned)
+  notify    → queuing / sending notifications
+  total     → whole request, this middleware inward
+
+cProfile (one .prof file per request, in PROFILING_DIR) for:
+  • "X-Profile: 1" from an emp_id in PROFILING_ALLOWED_EMP_IDS → always written
+  • PROFILING_SAMPLE_RATE of all requests → written only when slower
+    than PROFILING_SLOW_MS
+Read a dump with: python -m pstats <file>  /  snakeviz <file>
+"""
+
+import cProfile
+import logging
+import os
+import random
+import re
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'X-Profile'
+
+# phase → [seconds, count] for the current request; None when not profiling
+_timings = ContextVar('request_timings', default=None)
+
+
+def add_timing(phase, seconds):
+    """Add seconds to phase of the current request (no-op outside one)."""
+    timings = _timings.get()
+    if timings is None:
+        return
+    entry = timings.get(phase)
+    if entry is None:
+        timings[phase] = [seconds, 1]
+    else:
+        entry[0] += seconds
+        entry[1] += 1
+
+
+def _server_timing(timings, total):
+    parts = []
+    for phase, (seconds, count) in timings.items():
+        part = f"{phase};dur={seconds * 1000:.1f}"
+        if count > 1:
+            part += f';desc="{count} calls"'
+        parts.append(part)
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def _requested_by_allowed_user(request):
+    if request.headers.get(PROFILE_HEADER) != '1':
+        return False
+    allowed = getattr(settings, 'PROFILING_ALLOWED_EMP_IDS', [])
+    auth_header = request.headers.get('Authorization', '')
+    if not allowed or not auth_header.startswith('Bearer '):
+        return False
+    from apps.authentication.token_auth import decode_token
+    try:
+        user = decode_token(auth_header.replace('Bearer ', '').strip())
+    except Exception:
+        return False
+    return user.emp_id in allowed
+
+
+class ProfilingMiddleware:
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.directory    = str(getattr(settings, 'PROFILING_DIR', 'profiles'))
+        self.slow_ms      = getattr(settings, 'PROFILING_SLOW_MS', 1000)
+        self.sample_rate  = getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0)
+
+    def __call__(self, request):
+        forced  = _requested_by_allowed_user(request)
+        sampled = not forced and random.random() < self.sample_rate
+        profiler = cProfile.Profile() if (forced or sampled) else None
+
+        timings = {}
+        token   = _timings.set(timings)
+        request._profiling_render_start = None
+        started = time.perf_counter()
+        try:
+            if profiler:
+                profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                if profiler:
+                    profiler.disable()
+        finally:
+            _timings.reset(token)
+        ended = time.perf_counter()
+        total = ended - started
+
+        if request._profiling_render_start is not None:
+            timings['serialize'] = [ended - request._profiling_render_start, 1]
+        response['Server-Timing'] = _server_timing(timings, total)
+
+        if profiler and (forced or total * 1000 >= self.slow_ms):
+            self._dump(profiler, request, total)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF Response renders right after this — everything from here
+        # until get_response() returns is serialization
+        request._profiling_render_start = time.perf_counter()
+        return response
+
+    def _dump(self, profiler, request, total):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path_part = re.sub(r'[^A-Za-z0-9]+', '_', request.path).strip('_') or 'root'
+            name = (f"{time.strftime('%Y%m%d-%H%M%S')}_{request.method}_"
+                    f"{path_part}_{total * 1000:.0f}ms.prof")
+            profiler.dump_stats(os.path.join(self.directory, name))
+        except OSError as e:
+            logger.error(f"Profile dump failed: {str(e)}")
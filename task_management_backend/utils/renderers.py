@@ -0,0 +1,38 @@
+"""
+Extra DRF renderers
+───────────────────
+Selected with the standard DRF ?format= query param.
+FirstRendererNegotiation opts a download view out of that selection.
+"""
+
+from rest_framework.negotiation import BaseContentNegotiation
+from rest_framework.renderers import JSONRenderer
+
+
+class ColumnarJSONRenderer(JSONRenderer):
+    """
+    ?format=columnar → still JSON, but views that support it return
+    {"columns": [...], "rows": [[...], ...]} instead of a list of objects.
+    Views check is_columnar(request); others render as plain JSON.
+    """
+    format = 'columnar'
+
+
+class FirstRendererNegotiation(BaseContentNegotiation):
+    """
+    Always the view's first renderer — ignores Accept and ?format=.
+    For views that stream their own body (CSV / NDJSON downloads) and
+    only go through DRF for JSON errors; DRF would otherwise answer an
+    unknown ?format= with 404 before the view can validate it.
+    """
+
+    def select_parser(self, request, parsers):
+        return parsers[0] if parsers else None
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+def is_columnar(request):
+    renderer = getattr(request, 'accepted_renderer', None)
+    return renderer is not None and renderer.format == ColumnarJSONRenderer.format
@@ -1,13 +1,49 @@
 """
 Standardized API Responses
 Every API returns: {"success": bool, "message": str, "data": any}
+
+Streamed responses (StreamResponse) stream under WSGI and ASGI alike.
+Under ASGI, Django 4.2 would read a sync iterator to the end before
+sending anything. StreamResponse instead pulls one chunk at a time on
+the request's sync thread (where its cursor lives).
 """
 
+import csv
+import datetime
+import json
+import logging
+from itertools import chain
+
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.utils.encoders import JSONEncoder
+
+logger = logging.getLogger(__name__)
+
+# Rows encoded per chunk written to the socket
+STREAM_CHUNK_ROWS = 200
+
 
+class StreamResponse(StreamingHttpResponse):
+    """StreamingHttpResponse over a sync iterator that also streams under ASGI."""
 
-def success_response(data=None, message="Success", 
+    async def __aiter__(self):
+        if self.is_async:
+            async for part in super().__aiter__():
+                yield part
+            return
+        chunks     = iter(self.streaming_content)
+        next_chunk = sync_to_async(next, thread_sensitive=True)
+        while True:
+            part = await next_chunk(chunks, None)
+            if part is None:
+                return
+            yield part
+
+
+def success_response(data=None, message="Success",
                      status_code=status.HTTP_200_OK):
     return Response(
         {"success": True, "message": message, "data": data},
@@ -15,9 +51,139 @@ def success_response(data=None, message="Success",
     )
 
 
-def error_response(message="Something went wrong", errors=None, 
+def error_response(message="Something went wrong", errors=None,
                    status_code=status.HTTP_400_BAD_REQUEST):
     return Response(
         {"success": False, "message": message, "errors": errors},
         status=status_code
-    )
\ No newline at end of file
+    )
+
+
+def columnar_response(result, message="Success"):
+    """
+    success_response() for db_helper.call_sp_columnar() output.
+    data = {"columns": [...], "rows": [[...], ...]}
+    """
+    return success_response(
+        data={"columns": result["columns"], "rows": result["rows"]},
+        message=message,
+    )
+
+
+def _stream_envelope(rows, message):
+    """
+    Encode rows into the standard envelope chunk by chunk.
+    "data" is written FIRST so that a failure halfway through can
+    still finish the JSON with "success": false.
+    """
+    encoder = JSONEncoder()
+    yield '{"data": ['
+    chunk = []
+    first = True
+    try:
+        for row in rows:
+            chunk.append(encoder.encode(row))
+            if len(chunk) >= STREAM_CHUNK_ROWS:
+                yield ('' if first else ',') + ','.join(chunk)
+                first = False
+                chunk = []
+        if chunk:
+            yield ('' if first else ',') + ','.join(chunk)
+    except Exception as e:
+        logger.error(f"Stream Error: {str(e)}")
+        yield '], "success": false, "message": ' + json.dumps(str(e)) + '}'
+        return
+    yield '], "success": true, "message": ' + json.dumps(message) + '}'
+
+
+def _ndjson_lines(rows):
+    encoder = JSONEncoder()
+    chunk = []
+    for row in rows:
+        chunk.append(encoder.encode(row) + '\n')
+        if len(chunk) >= STREAM_CHUNK_ROWS:
+            yield ''.join(chunk)
+            chunk = []
+    if chunk:
+        yield ''.join(chunk)
+
+
+def _attachment(response, filename):
+    if filename:
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def _prime(rows):
+    """Pull the first row now, so a failing query raises in the view."""
+    rows = iter(rows)
+    first = next(rows, None)
+    return first, (chain((first,), rows) if first is not None else rows)
+
+
+def ndjson_response(rows, filename=None):
+    """
+    One JSON object per line (application/x-ndjson), streamed.
+    For reports and exports that are read line by line — no envelope.
+    filename → sent as a download. The first row is primed, as in
+    streaming_success_response().
+    """
+    _, rows = _prime(rows)
+    return _attachment(StreamResponse(
+        _ndjson_lines(rows),
+        content_type='application/x-ndjson',
+    ), filename)
+
+
+class _Echo:
+    """File-like object for csv.writer that hands each line back."""
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    # Dates as ISO 8601 — same text as the JSON responses
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def _csv_lines(columns, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    chunk = []
+    for row in rows:
+        chunk.append(writer.writerow([_csv_value(row.get(col)) for col in columns]))
+        if len(chunk) >= STREAM_CHUNK_ROWS:
+            yield ''.join(chunk)
+            chunk = []
+    if chunk:
+        yield ''.join(chunk)
+
+
+def csv_response(rows, filename=None):
+    """
+    Rows (dicts) streamed as CSV. The header is the keys of the first
+    row; every row is expected to have the same keys (one SP result set).
+    """
+    first, rows = _prime(rows)
+    columns = list(first) if first is not None else []
+    return _attachment(StreamResponse(
+        _csv_lines(columns, rows),
+        content_type='text/csv; charset=utf-8',
+    ), filename)
+
+
+def streaming_success_response(rows, message="Success"):
+    """
+    Same envelope as success_response(), but "data" is streamed from
+    an iterable of rows (e.g. db_helper.iter_sp) instead of built in memory.
+
+    The first row is pulled right away, so a failing query raises in
+    the view (→ error_response) instead of inside the stream.
+    """
+    _, rows = _prime(rows)
+    return StreamResponse(
+        _stream_envelope(rows, message),
+        content_type='application/json',
+    )